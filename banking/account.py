@@ -1,26 +1,149 @@
-from decimal import Decimal, ROUND_HALF_UP
-from typing import List, Dict
+from bisect import bisect_left, bisect_right
+from decimal import Decimal
+from typing import Iterator, List, Dict, Optional, Tuple, Union
+from banking.balance_tree import BalanceTree
+from banking.checkpoint import MonthCheckpoint, month_checksum
+from banking.dates import month_key, month_range, next_month
+from banking.ledger import Ledger, TransactionView, MAX_CENTS, TYPE_CODES, date_to_ordinal, ordinal_to_date
+from banking.mmap_ledger import MappedLedger, write_ledger_file
+from banking.money import Money
 from banking.transaction import Transaction
 
 class Account:
     """
     Represents a bank account with transactions.
     Maintains balance and generates unique transaction IDs.
+    History is stored in a columnar Ledger sorted by (date, sequence) with a
+    running-balance column, so point-in-time balances are a bisect and a
+    month's statement is a contiguous slice. Transaction objects are only
+    materialised when read.
+    A withdrawal must not take the balance below zero at any point from its
+    date on, not just today. Backdated withdrawals are checked against a
+    BalanceTree of per-day lowest balances, built on first need and kept up
+    to date on every posting after that.
+    Months can be closed with close_months: each gets a MonthCheckpoint and
+    no longer accepts postings, and their entries can be evicted (optionally
+    into an archive file) so the ledger only holds open months.
     """
 
     def __init__(self, account_id: str):
         self.account_id = account_id
-        self.transactions: List[Transaction] = []
+        self.ledger = Ledger()
         # Map date to count of transactions to generate txn id suffix
         self.txn_counter: Dict[str, int] = {}
-        self.balance = Decimal('0.00').quantize(Decimal('0.01'))
+        self.balance = Money(0)
+        # Sorted YYYYMM keys of months with activity
+        self._month_keys: List[str] = []
+        self._tree: Optional[BalanceTree] = None
+        # Index of the first appended entry not yet folded into _tree
+        self._tree_stale: Optional[int] = None
+        # Month-close compaction: checkpoints in month order, last closed and
+        # last evicted day ordinals, and (first YYYYMM, last YYYYMM, path)
+        # of each archive file
+        self.checkpoints: List[MonthCheckpoint] = []
+        self._checkpoint_months: List[str] = []
+        self.closed_through: Optional[int] = None
+        self.evicted_through: Optional[int] = None
+        self.archives: List[Tuple[str, str, str]] = []
+        self._archive_ledgers: Dict[str, MappedLedger] = {}
 
-    def _next_txn_id(self, date: str) -> str:
-        count = self.txn_counter.get(date, 0) + 1
-        self.txn_counter[date] = count
-        return f"{date}-{count:02d}"
+    @classmethod
+    def restore(cls, account_id: str, ledger: Ledger, txn_counter: Dict[str, int]) -> 'Account':
+        """Rebuilds an account from a saved (or mapped) ledger and id counters."""
+        account = cls(account_id)
+        account.ledger = ledger
+        account.txn_counter = txn_counter
+        account.balance = Money(ledger.running[-1] if len(ledger) else ledger.opening)
+        account._month_keys = ledger.months()
+        return account
 
-    def add_transaction(self, date: str, txn_type: str, amount: Decimal) -> Transaction:
+    @classmethod
+    def open_archive(cls, account_id: str, path: str) -> 'Account':
+        """
+        Opens a read-only account over a memory-mapped ledger file written by
+        write_ledger_file. Nothing is loaded up front; statements and balance
+        queries read only the slices they need.
+        """
+        return cls.restore(account_id, MappedLedger(path), {})
+
+    @property
+    def transactions(self) -> TransactionView:
+        """All transactions in (date, txn_id) order, materialised on access."""
+        return TransactionView(self.ledger)
+
+    def _day_mins(self, lo: int = 0) -> Iterator[Tuple[int, int]]:
+        """(day, lowest running balance that day) for each day from index lo on."""
+        dates, running = self.ledger.dates, self.ledger.running
+        if lo:
+            lo = bisect_left(dates, dates[lo]) if lo < len(dates) else lo
+        while lo < len(dates):
+            hi = bisect_right(dates, dates[lo], lo)
+            yield dates[lo], min(running[lo:hi])
+            lo = hi
+
+    def _balance_tree(self) -> BalanceTree:
+        tree = self._tree
+        if tree is not None and self._tree_stale is not None:
+            # Fold in entries appended since the last check
+            days = list(self._day_mins(self._tree_stale))
+            self._tree_stale = None
+            if all(tree.covers(day) for day, _ in days):
+                for day, value in days:
+                    tree.set(day, value)
+            else:
+                tree = None
+        if tree is None:
+            first, last = self.ledger.dates[0], self.ledger.dates[-1]
+            # Leave room for later postings so appends rarely force a rebuild
+            tree = BalanceTree(first, 2 * (last - first + 1) + 64)
+            tree.load(self._day_mins())
+            self._tree = tree
+        return tree
+
+    def _tree_posted(self, idx: int, date_ord: int, delta: int, removed: bool = False) -> None:
+        """
+        Applies a posting (or removal) of delta cents at ledger index idx to
+        the balance tree, if built. Appends only note where the unfolded
+        tail starts; everything else shifts the later days in O(log n).
+        """
+        tree = self._tree
+        if tree is None:
+            return
+        stale = self._tree_stale
+        if not removed and idx == len(self.ledger) - 1:
+            if stale is None:
+                self._tree_stale = idx
+            return
+        if stale is not None and idx < stale:
+            self._tree_stale = stale - 1 if removed else stale + 1
+        if not tree.covers(date_ord):
+            self._tree = self._tree_stale = None
+            return
+        tree.add(date_ord + 1, tree.last_day, delta)
+        lo, hi = self.ledger.span(date_ord, date_ord)
+        tree.set(date_ord, min(self.ledger.running[lo:hi]) if lo < hi else float('inf'))
+
+    def _lowest_balance_from(self, date_ord: int) -> int:
+        """
+        Lowest balance from the end of date_ord onwards; a withdrawal posted
+        on date_ord lowers every one of these balances.
+        """
+        ledger = self.ledger
+        if not len(ledger) or date_ord >= ledger.dates[-1]:
+            return self.balance.cents
+        tree = self._balance_tree()
+        return min(ledger.balance_on(date_ord), tree.min(date_ord + 1, tree.last_day))
+
+    def _insert(self, date: str, date_ord: int, seq: int, txn_type: str, amount: Money) -> Transaction:
+        idx = self.ledger.insert(date_ord, seq, TYPE_CODES[txn_type], amount.cents)
+        self._tree_posted(idx, date_ord, -amount.cents if txn_type == 'W' else amount.cents)
+        month = date[:6]
+        pos = bisect_left(self._month_keys, month)
+        if pos == len(self._month_keys) or self._month_keys[pos] != month:
+            self._month_keys.insert(pos, month)
+        return self.ledger.materialise(idx)
+
+    def add_transaction(self, date: str, txn_type: str, amount: Union[Decimal, Money]) -> Transaction:
         """
         Adds a deposit or withdrawal transaction after validation.
         Updates balance accordingly.
@@ -30,45 +153,67 @@ class Account:
         if txn_type not in {'D', 'W'}:
             raise ValueError("Transaction type must be 'D' or 'W'")
 
-        amount = amount.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-        if amount <= 0:
+        amount = Money.from_decimal(amount)
+        if amount.cents <= 0:
             raise ValueError("Amount must be positive")
+        if amount.cents > MAX_CENTS:
+            raise ValueError("Amount is too large")
 
-        if txn_type == 'W':
-            if not self.transactions:
-                raise ValueError("First transaction cannot be withdrawal")
-            if self.balance - amount < 0:
-                raise ValueError("Withdrawal would cause negative balance")
+        if txn_type == 'W' and not len(self.ledger) and not self.ledger.opening:
+            raise ValueError("First transaction cannot be withdrawal")
 
-        txn_id = self._next_txn_id(date)
-        txn = Transaction(date=date, txn_id=txn_id, txn_type=txn_type, amount=amount)
-        self.transactions.append(txn)
+        date_ord = date_to_ordinal(date)
+        self._check_open(date_ord)
+        if txn_type == 'W' and self._lowest_balance_from(date_ord) < amount.cents:
+            raise ValueError("Withdrawal would cause negative balance")
+        seq = self.txn_counter.get(date, 0) + 1
+        txn = self._insert(date, date_ord, seq, txn_type, amount)
+        self.txn_counter[date] = seq
 
         # Update balance
         if txn_type == 'D':
-            self.balance += amount
+            self.balance = Money(self.balance.cents + amount.cents)
         else:
-            self.balance -= amount
-
-        self.balance = self.balance.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+            self.balance = Money(self.balance.cents - amount.cents)
         return txn
 
-    def add_interest(self, date: str, amount: Decimal) -> Transaction:
+    def add_interest(self, date: str, amount: Union[Decimal, Money]) -> Transaction:
         """
         Adds interest transaction (type 'I') to the account.
         """
-        amount = amount.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-        if amount < 0:
+        amount = Money.from_decimal(amount)
+        if amount.cents < 0:
             raise ValueError("Interest amount cannot be negative")
+        if amount.cents == 0:
+            raise ValueError("Transaction amount must be > 0")
 
-        txn_id = ""  # Interest transactions have empty txn_id as per spec
-        txn = Transaction(date=date, txn_id=txn_id, txn_type='I', amount=amount)
-        self.transactions.append(txn)
-
-        self.balance += amount
-        self.balance = self.balance.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        # Interest transactions have empty txn_id as per spec (sequence 0)
+        date_ord = date_to_ordinal(date)
+        self._check_open(date_ord)
+        txn = self._insert(date, date_ord, 0, 'I', amount)
+        self.balance = Money(self.balance.cents + amount.cents)
         return txn
 
+    def remove_interest(self, date: str) -> Optional[Money]:
+        """
+        Removes the interest entry posted on a date, if any, so it can be
+        recalculated. Returns the removed amount.
+        """
+        date_ord = date_to_ordinal(date)
+        self._check_open(date_ord)
+        lo, hi = self.ledger.span(date_ord, date_ord)
+        for i in range(lo, hi):
+            if self.ledger.types[i] == TYPE_CODES['I']:
+                amount = Money(self.ledger.amounts[i])
+                self.ledger.remove(i)
+                self._tree_posted(i, date_ord, -amount.cents, removed=True)
+                self.balance = Money(self.balance.cents - amount.cents)
+                month_lo, month_hi = self.ledger.month_span(date[:6])
+                if month_lo == month_hi:
+                    self._month_keys.remove(date[:6])
+                return amount
+        return None
+
     def get_statement(self, year_month: str) -> List[Transaction]:
         """
         Returns list of transactions including interest transactions for the specified year-month.
@@ -77,30 +222,170 @@ class Account:
         if len(year_month) != 6 or not year_month.isdigit():
             raise ValueError("YearMonth must be in YYYYMM format")
 
-        return [txn for txn in self.transactions if txn.date.startswith(year_month)]
+        ledger = self.statement_ledger(year_month)
+        lo, hi = ledger.month_span(year_month)
+        return [ledger.materialise(i) for i in range(lo, hi)]
+
+    def get_statement_range(self, from_ym: str, to_ym: str) -> List[Transaction]:
+        """
+        Returns the transactions of every month from from_ym through to_ym
+        (YYYYMM, inclusive) in order, read as one slice of the ledger.
+        Evicted months are read from their archives month by month.
+        """
+        for year_month in (from_ym, to_ym):
+            if len(year_month) != 6 or not year_month.isdigit():
+                raise ValueError("YearMonth must be in YYYYMM format")
+        if from_ym > to_ym:
+            raise ValueError("Start month must not be after end month")
+
+        rows = []
+        year_month = from_ym
+        if self.evicted_through is not None:
+            while year_month <= min(to_ym, month_key(self.evicted_through)):
+                rows.extend(self.get_statement(year_month))
+                year_month = next_month(year_month)
+        if year_month <= to_ym:
+            ledger = self.ledger
+            lo, hi = ledger.span(month_range(year_month)[0], month_range(to_ym)[1])
+            rows.extend(ledger.materialise(i) for i in range(lo, hi))
+        return rows
+
+    def statement_ledger(self, year_month: str):
+        """
+        The ledger holding a month's entries: the live ledger, or the archive
+        of an evicted month. Raises ValueError if the month was evicted
+        without an archive.
+        """
+        if self.evicted_through is None or year_month > month_key(self.evicted_through):
+            return self.ledger
+        for first, last, path in self.archives:
+            if first <= year_month <= last:
+                ledger = self._archive_ledgers.get(path)
+                if ledger is None:
+                    ledger = self._archive_ledgers[path] = MappedLedger(path)
+                return ledger
+        checkpoint = self.checkpoint(year_month)
+        if checkpoint is None or not checkpoint.txn_count:
+            return self.ledger  # nothing was evicted from this month
+        raise ValueError(f"Transactions for {year_month} were compacted")
 
-    def get_balance_on_date(self, date: str) -> Decimal:
+    def get_balance_on_date(self, date: str) -> Money:
         """
         Returns balance at the end of a given date.
         Considers all transactions up to and including that date.
         """
-        balance = Decimal('0.00')
-        for txn in sorted(self.transactions, key=lambda t: (t.date, t.txn_id or "")):
-            if txn.date > date:
-                break
-            if txn.txn_type in ('D', 'I'):
-                balance += txn.amount
-            elif txn.txn_type == 'W':
-                balance -= txn.amount
-        return balance.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        date_ord = date_to_ordinal(date)
+        if self.evicted_through is not None and date_ord <= self.evicted_through:
+            return self._compacted_balance(date, date_ord)
+        return Money(self.ledger.balance_on(date_ord))
+
+    def get_lowest_balance_from(self, date: str) -> Money:
+        """
+        Returns the lowest running balance over every entry dated on or after
+        date, or the current balance if there are none.
+        """
+        date_ord = date_to_ordinal(date)
+        if not len(self.ledger) or date_ord > self.ledger.dates[-1]:
+            return self.balance
+        tree = self._balance_tree()
+        return Money(min(self.balance.cents, tree.min(date_ord, tree.last_day)))
+
+    def _compacted_balance(self, date: str, date_ord: int) -> Money:
+        """Balance on a day in an evicted month, from its checkpoint where possible."""
+        year_month = month_key(date_ord)
+        checkpoint = self.checkpoint(year_month)
+        if checkpoint is None:
+            return Money(0)  # before the account's first month
+        if date_ord == month_range(year_month)[1]:
+            return checkpoint.closing_balance
+        if checkpoint.txn_count == (1 if checkpoint.interest else 0):
+            # Nothing but the month-end interest moved the balance
+            return checkpoint.closing_balance - checkpoint.interest
+        return Money(self.statement_ledger(year_month).balance_on(date_ord))
+
+    def _check_open(self, date_ord: int) -> None:
+        if self.closed_through is not None and date_ord <= self.closed_through:
+            raise ValueError(f"Month {month_key(date_ord)} is closed")
+
+    def month_closed(self, year_month: str) -> bool:
+        """Whether a YYYYMM month is at or before the last closed month."""
+        return self.closed_through is not None and month_range(year_month)[1] <= self.closed_through
+
+    def checkpoint(self, year_month: str) -> Optional[MonthCheckpoint]:
+        """The checkpoint of a closed month, if any."""
+        pos = bisect_left(self._checkpoint_months, year_month)
+        if pos < len(self._checkpoint_months) and self._checkpoint_months[pos] == year_month:
+            return self.checkpoints[pos]
+        return None
+
+    def close_months(self, through: str, evict: bool = False,
+                     archive_path: Optional[str] = None) -> List[MonthCheckpoint]:
+        """
+        Closes every month up to and including `through` (YYYYMM): records a
+        checkpoint for each month not yet closed, from the account's first
+        month on, and rejects postings dated in closed months from then on.
+        With evict (implied by archive_path), the closed months' entries and
+        id counters are dropped from memory; archive_path first writes those
+        entries to a ledger file that statements can still read.
+        Returns the new checkpoints.
+        """
+        if len(through) != 6 or not through.isdigit():
+            raise ValueError("YearMonth must be in YYYYMM format")
+        last_day = month_range(through)[1]
+        if self.closed_through is not None:
+            if last_day <= self.closed_through:
+                return []
+            year_month = month_key(self.closed_through + 1)
+        elif len(self.ledger):
+            year_month = month_key(self.ledger.dates[0])
+        else:
+            return []
+
+        ledger = self.ledger
+        new = []
+        while year_month <= through:
+            lo, hi = ledger.month_span(year_month)
+            interest = sum(ledger.amounts[i] for i in range(lo, hi) if ledger.types[i] == TYPE_CODES['I'])
+            first, last = month_range(year_month)
+            new.append(MonthCheckpoint(year_month, Money(ledger.balance_on(last)), Money(interest),
+                                       hi - lo, month_checksum(ledger, lo, hi)))
+            year_month = month_key(last + 1)
+        self.checkpoints.extend(new)
+        self._checkpoint_months.extend(c.year_month for c in new)
+        self.closed_through = last_day
+
+        if evict or archive_path:
+            hi = bisect_right(ledger.dates, last_day)
+            if archive_path and hi:
+                write_ledger_file(archive_path, ledger.slice(0, hi))
+                self.archives.append((month_key(ledger.dates[0]), through, archive_path))
+            self.evict_through(last_day)
+        return new
+
+    def evict_through(self, last_day: int) -> None:
+        """Drops the entries and id counters dated up to last_day (a day ordinal) from memory."""
+        self.ledger.evict(bisect_right(self.ledger.dates, last_day))
+        last_date = ordinal_to_date(last_day)
+        self.txn_counter = {d: n for d, n in self.txn_counter.items() if d > last_date}
+        self._month_keys = [m for m in self._month_keys if m > month_key(last_day)]
+        self._tree = self._tree_stale = None
+        self.evicted_through = last_day
 
     def get_all_transaction_dates(self) -> List[str]:
         """Returns sorted unique transaction dates."""
-        dates = sorted(set(txn.date for txn in self.transactions))
-        return dates
+        return [ordinal_to_date(d) for d in dict.fromkeys(self.ledger.dates)]
+
+    def get_transaction_dates_between(self, start: str, end: str) -> List[str]:
+        """Returns sorted unique transaction dates within [start, end]."""
+        lo, hi = self.ledger.span(date_to_ordinal(start), date_to_ordinal(end))
+        return [ordinal_to_date(d) for d in dict.fromkeys(self.ledger.dates[lo:hi])]
+
+    def get_months(self) -> List[str]:
+        """Returns sorted YYYYMM keys of months with activity."""
+        return self._month_keys.copy()
 
-    def get_balance(self) -> Decimal:
+    def get_balance(self) -> Money:
         """
         Returns current balance of the account.
         """
-        return self.balance.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        return self.balance
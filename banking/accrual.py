@@ -0,0 +1,125 @@
+from typing import Dict, Optional
+from banking.account import Account
+from banking.dates import date_to_ordinal, month_end, month_key, month_range, month_start
+from banking.money import Money, half_up_div
+from banking.rule_timeline import InterestRuleTimeline
+
+class InterestAccrual:
+    """
+    Running interest accrual for one account.
+    Periods start on the 1st of each month, on every posting date and on
+    every rule-change date, exactly as in compute_period_interest. Each
+    posting at or after the frontier (the start of the still-open period)
+    closes the open period: its rounded interest is added to the month's
+    accrued total, and months passed along the way are finalised. Month-end
+    then only reads the accrued value plus the open tail. A backdated posting
+    or rule change marks the accrual dirty from that date; the next read
+    recomputes from the start of that month only, and never from before the
+    account's closed months.
+    The periods, rule_lookups, balance_lookups and recomputations counters
+    only ever grow; Metrics diffs them around a call.
+    """
+
+    def __init__(self, account: Account, timeline: InterestRuleTimeline):
+        self.account = account
+        self.timeline = timeline
+        self._frontier: Optional[int] = None
+        self._accrued = 0
+        self._finalised: Dict[str, int] = {}
+        self._dirty: Optional[int] = None
+        if account.closed_through is not None:
+            self._dirty = account.closed_through + 1
+        elif len(account.ledger):
+            self._dirty = account.ledger.dates[0]
+        self.periods = 0
+        self.rule_lookups = 0
+        self.balance_lookups = 0
+        self.recomputations = 0
+
+    def _segment(self, first: int, last: int, cents: int) -> int:
+        """Interest in cents on a constant balance over [first, last], split at rule changes."""
+        total = 0
+        rates = self.timeline.rates_between(first, last)
+        self.rule_lookups += 1
+        starts = [first] + [d for d, _ in rates if d > first]
+        idx = 0
+        rate = None
+        for i, start in enumerate(starts):
+            while idx < len(rates) and rates[idx][0] <= start:
+                rate = rates[idx][1]
+                idx += 1
+            if rate is None:
+                continue
+            days = (starts[i + 1] if i + 1 < len(starts) else last + 1) - start
+            total += half_up_div(cents * rate[0] * days, 36500 * rate[1])
+            self.periods += 1
+        return total
+
+    def _close(self, upto: int) -> None:
+        """Closes the open period(s) from the frontier up to the day before upto."""
+        first = self._frontier
+        cents = self.account.ledger.balance_on(first)
+        self.balance_lookups += 1
+        while first < upto:
+            last_of_month = month_end(first)
+            last = min(upto - 1, last_of_month)
+            self._accrued += self._segment(first, last, cents)
+            if last == last_of_month:
+                self._finalised[month_key(first)] = self._accrued
+                self._accrued = 0
+            first = last + 1
+        self._frontier = upto
+
+    def on_posting(self, date: str) -> None:
+        """Records that the ledger changed on date."""
+        date_ord = date_to_ordinal(date)
+        if self._frontier is None and self._dirty is None:
+            self._frontier = month_start(date_ord)
+            self._close(date_ord)
+        elif self._dirty is not None or date_ord < self._frontier:
+            self.invalidate(date)
+        else:
+            self._close(date_ord)
+
+    def invalidate(self, date: str) -> None:
+        """Marks everything from date onwards for recomputation."""
+        date_ord = date_to_ordinal(date)
+        if self.account.closed_through is not None:
+            date_ord = max(date_ord, self.account.closed_through + 1)
+        self._dirty = date_ord if self._dirty is None else min(self._dirty, date_ord)
+
+    def _repair(self) -> None:
+        if self._dirty is None:
+            return
+        ledger = self.account.ledger
+        start = month_start(self._dirty)
+        if self._frontier is not None:
+            # The frontier's month is only partly accrued; never skip past it
+            start = min(start, month_start(self._frontier))
+        self._dirty = None
+        self.recomputations += 1
+        month = month_key(start)
+        self._finalised = {ym: v for ym, v in self._finalised.items() if ym < month}
+        if not len(ledger) and not ledger.opening:
+            self._frontier = None
+            return
+        lo = ledger.span(start, start)[0]
+        self._frontier = start
+        self._accrued = 0
+        for date_ord in dict.fromkeys(ledger.dates[lo:]):
+            self._close(date_ord)
+
+    def month_interest(self, year_month: str) -> Money:
+        """Interest for a month: finalised total, or accrued value plus the open tail."""
+        self._repair()
+        if self._frontier is None:
+            return Money(0)
+        frontier_month = month_key(self._frontier)
+        if year_month < frontier_month:
+            return Money(self._finalised.get(year_month, 0))
+        first, last = month_range(year_month)
+        cents = self.account.ledger.balance_on(self._frontier)
+        self.balance_lookups += 1
+        if year_month == frontier_month:
+            return Money(self._accrued + self._segment(self._frontier, last, cents))
+        return Money(self._segment(first, last, cents))
@@ -0,0 +1,122 @@
+from bisect import bisect_left, insort
+from decimal import Decimal
+from typing import Dict, Iterable, List, Tuple, Union
+from banking.account import Account
+from banking.dates import date_to_ordinal
+from banking.ledger import TYPE_NAMES
+from banking.money import Money
+import threading
+
+class BankAggregates:
+    """
+    Bank-wide figures kept current on every posting, so portfolio queries
+    never scan accounts or ledgers:
+      - per-day totals of deposits, withdrawals and interest (by entry date),
+      - the total of all current balances,
+      - an index of (balance, account_id) kept sorted for top-N and
+        below-threshold queries.
+    record() is called by Bank for each posting (negative cents for a
+    reversed interest entry). Updates and queries take one short lock, so
+    concurrent posters to different accounts stay consistent.
+    Day totals of entries that month close evicts from the ledgers are kept
+    aside (keep_evicted), so rebuild() can still count them.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._days: List[int] = []
+        self._day_totals: Dict[int, List[int]] = {}
+        self._evicted: Dict[int, List[int]] = {}
+        self._balances: Dict[str, int] = {}
+        self._index: List[Tuple[int, str]] = []
+        self._total = 0
+
+    def record(self, account_id: str, date_ord: int, type_code: int, cents: int, balance: int) -> None:
+        """Adds one posting of cents on date_ord and sets the account's new balance."""
+        with self._lock:
+            totals = self._day_totals.get(date_ord)
+            if totals is None:
+                totals = self._day_totals[date_ord] = [0, 0, 0]
+                insort(self._days, date_ord)
+            totals[type_code] += cents
+            self._set_balance(account_id, balance)
+
+    def _set_balance(self, account_id: str, balance: int) -> None:
+        old = self._balances.get(account_id)
+        if old == balance:
+            return
+        if old is not None:
+            del self._index[bisect_left(self._index, (old, account_id))]
+            self._total -= old
+        insort(self._index, (balance, account_id))
+        self._balances[account_id] = balance
+        self._total += balance
+
+    def keep_evicted(self, ledger, hi: int) -> None:
+        """Sets aside the day totals of a ledger's first hi entries before they are evicted."""
+        with self._lock:
+            _add_entries(self._evicted, ledger, hi)
+
+    def evicted_totals(self) -> Dict[int, List[int]]:
+        """Day totals of evicted entries, {day ordinal: [D, W, I] cents}, for saving."""
+        with self._lock:
+            return {date_ord: list(totals) for date_ord, totals in self._evicted.items()}
+
+    def restore_evicted(self, evicted: Dict[int, List[int]]) -> None:
+        """Replaces the evicted day totals with saved ones (call before rebuild)."""
+        with self._lock:
+            self._evicted = {date_ord: list(totals) for date_ord, totals in evicted.items()}
+
+    def rebuild(self, accounts: Iterable[Account]) -> None:
+        """Recomputes everything from the evicted totals and the ledgers in memory (after a reload)."""
+        with self._lock:
+            self._day_totals = {date_ord: list(totals) for date_ord, totals in self._evicted.items()}
+            self._balances, self._index, self._total = {}, [], 0
+            for account in accounts:
+                _add_entries(self._day_totals, account.ledger, len(account.ledger))
+                self._set_balance(account.account_id, account.balance.cents)
+            self._days = sorted(self._day_totals)
+
+    def day_totals(self, date: str) -> Dict[str, Money]:
+        """Deposits, withdrawals and interest posted on a YYYYMMDD date, keyed D/W/I."""
+        with self._lock:
+            totals = list(self._day_totals.get(date_to_ordinal(date), (0, 0, 0)))
+        return {name: Money(cents) for name, cents in zip(TYPE_NAMES, totals)}
+
+    def totals_between(self, start: str, end: str) -> Dict[str, Money]:
+        """Deposits, withdrawals and interest posted within [start, end], keyed D/W/I."""
+        first, last = date_to_ordinal(start), date_to_ordinal(end)
+        sums = [0, 0, 0]
+        with self._lock:
+            for idx in range(bisect_left(self._days, first), len(self._days)):
+                date_ord = self._days[idx]
+                if date_ord > last:
+                    break
+                for code, cents in enumerate(self._day_totals[date_ord]):
+                    sums[code] += cents
+        return {name: Money(cents) for name, cents in zip(TYPE_NAMES, sums)}
+
+    def total_balance(self) -> Money:
+        """Sum of every account's current balance."""
+        return Money(self._total)
+
+    def top_balances(self, n: int) -> List[Tuple[str, Money]]:
+        """The n largest balances as (account_id, balance), largest first."""
+        with self._lock:
+            top = self._index[-n:] if n > 0 else []
+        return [(account_id, Money(cents)) for cents, account_id in reversed(top)]
+
+    def accounts_below(self, threshold: Union[Money, Decimal, int, str]) -> List[Tuple[str, Money]]:
+        """Accounts whose balance is strictly below threshold, lowest first."""
+        cents = Money.from_decimal(threshold).cents
+        with self._lock:
+            below = self._index[:bisect_left(self._index, (cents, ""))]
+        return [(account_id, Money(balance)) for balance, account_id in below]
+
+def _add_entries(day_totals: Dict[int, List[int]], ledger, hi: int) -> None:
+    """Adds a ledger's first hi entries to per-day [D, W, I] totals."""
+    for date_ord, type_code, cents in zip(ledger.dates[:hi], ledger.types[:hi], ledger.amounts[:hi]):
+        totals = day_totals.get(date_ord)
+        if totals is None:
+            totals = day_totals[date_ord] = [0, 0, 0]
+        totals[type_code] += cents
@@ -0,0 +1,87 @@
+from typing import Iterable, List, Tuple
+
+INF = float('inf')
+
+class BalanceTree:
+    """
+    Segment tree over a run of consecutive days with range-add and
+    range-min, both O(log n).
+    Each leaf holds the lowest running balance reached on that day (INF for
+    days without entries). Adds stay on the node they were applied to rather
+    than being pushed down, so a node's value is the minimum of its subtree
+    including its own pending add.
+    """
+
+    def __init__(self, first_day: int, days: int):
+        size = 1
+        while size < days:
+            size *= 2
+        self.first_day = first_day
+        self.size = size
+        self._min: List[float] = [INF] * (2 * size)
+        self._add: List[int] = [0] * (2 * size)
+
+    @property
+    def last_day(self) -> int:
+        return self.first_day + self.size - 1
+
+    def covers(self, day: int) -> bool:
+        return self.first_day <= day <= self.last_day
+
+    def load(self, day_mins: Iterable[Tuple[int, int]]) -> None:
+        """Bulk-sets (day, lowest balance) pairs on a fresh tree in O(n)."""
+        for day, value in day_mins:
+            self._min[self.size + day - self.first_day] = value
+        for node in range(self.size - 1, 0, -1):
+            self._min[node] = min(self._min[2 * node], self._min[2 * node + 1])
+
+    def set(self, day: int, value: float) -> None:
+        """Sets one day's lowest balance."""
+        node = self.size + day - self.first_day
+        pending = 0
+        parent = node >> 1
+        while parent:
+            pending += self._add[parent]
+            parent >>= 1
+        self._add[node] = 0
+        self._min[node] = value - pending
+        node >>= 1
+        while node:
+            self._min[node] = min(self._min[2 * node], self._min[2 * node + 1]) + self._add[node]
+            node >>= 1
+
+    def add(self, first: int, last: int, delta: int) -> None:
+        """Adds delta to every day in [first, last]."""
+        first, last = max(first, self.first_day), min(last, self.last_day)
+        if first <= last:
+            self._update(1, 0, self.size - 1, first - self.first_day, last - self.first_day, delta)
+
+    def _update(self, node: int, lo: int, hi: int, first: int, last: int, delta: int) -> None:
+        if first <= lo and hi <= last:
+            self._add[node] += delta
+            self._min[node] += delta
+            return
+        mid = (lo + hi) // 2
+        if first <= mid:
+            self._update(2 * node, lo, mid, first, last, delta)
+        if last > mid:
+            self._update(2 * node + 1, mid + 1, hi, first, last, delta)
+        self._min[node] = min(self._min[2 * node], self._min[2 * node + 1]) + self._add[node]
+
+    def min(self, first: int, last: int) -> float:
+        """Lowest balance over days [first, last] (INF if none have entries)."""
+        first, last = max(first, self.first_day), min(last, self.last_day)
+        if first > last:
+            return INF
+        return self._query(1, 0, self.size - 1, first - self.first_day, last - self.first_day)
+
+    def _query(self, node: int, lo: int, hi: int, first: int, last: int) -> float:
+        if first <= lo and hi <= last:
+            return self._min[node]
+        mid = (lo + hi) // 2
+        best = INF
+        if first <= mid:
+            best = self._query(2 * node, lo, mid, first, last)
+        if last > mid:
+            best = min(best, self._query(2 * node + 1, mid + 1, hi, first, last))
+        return best + self._add[node]
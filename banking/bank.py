@@ -1,106 +1,484 @@
-from typing import Dict, List, Optional, Tuple
-from decimal import Decimal, ROUND_HALF_UP
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from decimal import Decimal, InvalidOperation
 from banking.account import Account
+from banking.accrual import InterestAccrual
+from banking.aggregates import BankAggregates
+from banking.ingest import IngestReport
+from banking.metrics import Metrics
+from banking.money import Money
+from banking.checkpoint import MonthCheckpoint
+from banking.dates import date_to_ordinal, month_key, month_range, months_between, ordinal_to_date
+from banking.interest import compute_period_interest, iter_month_interest
+from banking.vector_interest import batch_period_interest
 from banking.interest_rule import InterestRule
+from banking.ledger import TYPE_CODES
+from banking.rule_timeline import InterestRuleTimeline
 from banking.transaction import Transaction
-import datetime
+from concurrent.futures import ProcessPoolExecutor
+import os
 
 class Bank:
     """
     Manages multiple accounts and interest rules.
     Supports adding transactions, defining interest rules,
     and calculating monthly interest.
+    Monthly interest is cached per (account, YYYYMM), so asking for the same
+    month again neither recomputes nor double-credits. A posting on a date
+    drops that account's cached months from that month on; a rule change
+    drops every account's cached months from the rule's month on. A stale
+    month's interest entry is reversed and re-posted when next requested.
+    Each account also carries an InterestAccrual updated on every posting,
+    so computing a month's interest is a read rather than a history scan.
+    Public operations are timed into self.metrics, together with the interest
+    periods, rule lookups, balance lookups and recomputations each performed.
+    Every posting also updates self.aggregates (per-day totals, total
+    balance, sorted balance index) for the portfolio queries.
     """
 
-    def __init__(self):
+    def __init__(self, metrics: Optional[Metrics] = None):
         self.accounts: Dict[str, Account] = {}
-        self.interest_rules: List[InterestRule] = []
+        self.rule_timeline = InterestRuleTimeline()
+        # account_id -> YYYYMM -> (interest txns, interest amount)
+        self._interest_cache: Dict[str, Dict[str, Tuple[List[Transaction], Money]]] = {}
+        self._accruals: Dict[str, InterestAccrual] = {}
+        self.metrics = metrics if metrics is not None else Metrics()
+        self.aggregates = BankAggregates()
+
+    @property
+    def interest_rules(self) -> List[InterestRule]:
+        return self.rule_timeline.rules()
 
     def _find_or_create_account(self, account_id: str) -> Account:
         if account_id not in self.accounts:
             self.accounts[account_id] = Account(account_id)
         return self.accounts[account_id]
 
-    # Return Transaction or raise Exception (match test expectations)
-    def add_transaction(self, date: str, account_id: str, txn_type: str, amount: Decimal) -> Transaction:
-        account = self._find_or_create_account(account_id)
+    def _apply_transaction(self, account: Account, date: str, txn_type: str, amount) -> Transaction:
+        """Single point where deposits/withdrawals are posted; subclasses hook it."""
         txn = account.add_transaction(date, txn_type, amount)  # may raise ValueError
+        self._invalidate_interest(account.account_id, date[:6])
+        self._accrual(account).on_posting(date)
+        self.aggregates.record(account.account_id, date_to_ordinal(date), TYPE_CODES[txn.txn_type],
+                               txn.amount.cents, account.balance.cents)
         return txn
 
-    # Still returning tuple here for status message, can change if needed
-    def add_interest_rule(self, date: str, rule_id: str, rate: Decimal) -> Tuple[bool, str]:
-        if rate <= 0 or rate >= 100:
-            return False, "Rate must be between 0 and 100"
+    def _post_interest(self, account: Account, date: str, amount: Money) -> Transaction:
+        """Single point where interest is posted; subclasses hook it."""
+        txn = account.add_interest(date, amount)
+        self._invalidate_interest(account.account_id, date[:6], inclusive=False)
+        self._accrual(account).on_posting(date)
+        self.aggregates.record(account.account_id, date_to_ordinal(date), TYPE_CODES['I'],
+                               amount.cents, account.balance.cents)
+        return txn
 
-        new_rule = InterestRule(date=date, rule_id=rule_id, rate=rate)
+    def _reverse_interest(self, account: Account, date: str) -> Optional[Money]:
+        """Single point where posted interest is taken back out; subclasses hook it."""
+        amount = account.remove_interest(date)
+        if amount is not None:
+            self._invalidate_interest(account.account_id, date[:6], inclusive=False)
+            # A reversal reopens the period it closed, so recompute rather
+            # than split the open period at the reversal date
+            self._accrual(account).invalidate(date)
+            self.aggregates.record(account.account_id, date_to_ordinal(date), TYPE_CODES['I'],
+                                   -amount.cents, account.balance.cents)
+        return amount
 
-        idx = next((i for i, r in enumerate(self.interest_rules) if r.date == date), None)
-        if idx is not None:
-            self.interest_rules[idx] = new_rule
-        else:
-            self.interest_rules.append(new_rule)
+    def _interest_cut_covered(self, account: Account, date: str, previous: Optional[Money],
+                              interest: Money) -> bool:
+        """
+        Checks a month's recomputed interest against the posting it replaces
+        (already reversed). A lower amount comes out of every later balance,
+        so if one would go negative the previous posting is put back and
+        False is returned.
+        """
+        if previous is None or interest >= previous:
+            return True
+        if account.get_lowest_balance_from(date).cents + interest.cents >= 0:
+            return True
+        self._post_interest(account, date, previous)
+        return False
+
+    def _accrual(self, account: Account) -> InterestAccrual:
+        accrual = self._accruals.get(account.account_id)
+        if accrual is None or accrual.account is not account:
+            accrual = self._accruals[account.account_id] = InterestAccrual(account, self.rule_timeline)
+        return accrual
+
+    def _on_rule_change(self, account_id: str, date: str) -> None:
+        """Invalidates one account's cached and accrued interest from a rule's date."""
+        self._invalidate_interest(account_id, date[:6])
+        accrual = self._accruals.get(account_id)
+        if accrual is not None:
+            accrual.invalidate(date)
+
+    def _invalidate_interest(self, account_id: str, year_month: str, inclusive: bool = True) -> None:
+        """Drops an account's cached interest for year_month (if inclusive) and later months."""
+        cache = self._interest_cache.get(account_id)
+        if cache:
+            for ym in [ym for ym in cache if ym > year_month or (inclusive and ym == year_month)]:
+                del cache[ym]
+
+    def _account_ids(self) -> List[str]:
+        return sorted(self.accounts)
+
+    # Return Transaction or raise Exception (match test expectations)
+    def add_transaction(self, date: str, account_id: str, txn_type: str, amount: Decimal) -> Transaction:
+        with self.metrics.call("add_transaction") as call:
+            account = self._find_or_create_account(account_id)
+            call.track(self._accrual(account))
+            return self._apply_transaction(account, date, txn_type, amount)
 
-        self.interest_rules.sort(key=lambda r: r.date)
-        return True, f"Interest rule {rule_id} added for {date} with rate {rate}%"
+    def add_transactions(self, records: Iterable[Sequence]) -> IngestReport:
+        """
+        Bulk-loads (date, account_id, type, amount) records.
+        Records are grouped per account and applied in their original order,
+        so each account sees the same validation as add_transaction.
+        Rejected records are reported instead of raising.
+        """
+        with self.metrics.call("add_transactions") as call:
+            return self._add_transactions(records, call)
+
+    def _add_transactions(self, records: Iterable[Sequence], call) -> IngestReport:
+        report = IngestReport()
+        by_account: Dict[str, List[Tuple[int, Sequence]]] = {}
+        for idx, record in enumerate(records):
+            report.txn_ids.append(None)
+            if len(record) != 4:
+                report.errors[idx] = "Invalid input format"
+                continue
+            by_account.setdefault(record[1], []).append((idx, record))
+
+        for account_id, group in by_account.items():
+            account = self._find_or_create_account(account_id)
+            call.track(self._accrual(account))
+            for idx, (date, _, txn_type, amount) in group:
+                try:
+                    amount = Money.from_decimal(amount)
+                    report.txn_ids[idx] = self._apply_transaction(account, date, txn_type, amount).txn_id
+                except InvalidOperation:
+                    report.errors[idx] = "Invalid amount format"
+                except ValueError as e:
+                    report.errors[idx] = str(e)
+        self.metrics.incr("add_transactions.records", len(report.txn_ids))
+        self.metrics.incr("add_transactions.rejected", report.rejected)
+        return report
+
+    # Still returning tuple here for status message, can change if needed
+    def add_interest_rule(self, date: str, rule_id: str, rate: Decimal) -> Tuple[bool, str]:
+        with self.metrics.call("add_interest_rule") as call:
+            if rate <= 0 or rate >= 100:
+                return False, "Rate must be between 0 and 100"
+
+            new_rule = InterestRule(date=date, rule_id=rule_id, rate=rate)
+            self.rule_timeline.add(new_rule)
+            account_ids = self._account_ids()
+            for account_id in account_ids:
+                self._on_rule_change(account_id, date)
+            call.count("invalidations", len(account_ids))
+            return True, f"Interest rule {rule_id} added for {date} with rate {rate}%"
 
     def get_interest_rules(self) -> List[InterestRule]:
-        return self.interest_rules.copy()
+        return self.rule_timeline.rules()
 
     def get_interest_rule_for_date(self, date: str) -> Optional[InterestRule]:
-        applicable = [rule for rule in self.interest_rules if rule.date <= date]
-        return applicable[-1] if applicable else None
+        return self.rule_timeline.rule_for_date(date)
+
+    def _interest_inputs(self, account: Account, first: int, last: int) -> List[Tuple[int, Money]]:
+        """
+        End-of-day balances on day ordinal first and on every later
+        transaction date up to last, read straight off the running column.
+        """
+        ledger = account.ledger
+        balances = [(first, Money(ledger.balance_on(first)))]
+        dates, running = ledger.dates, ledger.running
+        lo, hi = ledger.span(first + 1, last)
+        for i in range(lo, hi):
+            if i + 1 == hi or dates[i + 1] != dates[i]:
+                balances.append((dates[i], Money(running[i])))
+        return balances
+
+    def _rate_inputs(self, first: int, last: int) -> List[Tuple[int, Decimal]]:
+        rules = self.rule_timeline.rules_between(ordinal_to_date(first), ordinal_to_date(last))
+        return [(date_to_ordinal(r.date), r.rate) for r in rules]
+
+    def calculate_monthly_interest(self, account_id: str, year_month: str) -> Tuple[List[Transaction], Money]:
+        with self.metrics.call("calculate_monthly_interest") as call:
+            return self._calculate_monthly_interest(account_id, year_month, call)
+
+    def _calculate_monthly_interest(self, account_id: str, year_month: str, call) -> Tuple[List[Transaction], Money]:
+        if account_id not in self.accounts:
+            raise ValueError(f"Account {account_id} not found")
 
-    def calculate_monthly_interest(self, account_id: str, year_month: str) -> Tuple[List[Transaction], Decimal]:
+        cache = self._interest_cache.setdefault(account_id, {})
+        cached = cache.get(year_month)
+        if cached is not None:
+            call.count("cache_hits")
+            return cached
+
+        account = self.accounts[account_id]
+        end = ordinal_to_date(month_range(year_month)[1])
+        if account.month_closed(year_month):
+            call.count("checkpoint_hits")
+            return _closed_interest(end, account.checkpoint(year_month))
+        accrual = self._accrual(account)
+        call.track(accrual)
+        previous = self._reverse_interest(account, end)
+        total_interest = accrual.month_interest(year_month)
+        if not self._interest_cut_covered(account, end, previous, total_interest):
+            raise ValueError(f"Reduced interest for {year_month} would cause negative balance")
+
+        result: Tuple[List[Transaction], Money] = ([], Money(0))
+        if total_interest > 0:
+            result = ([self._post_interest(account, end, total_interest)], total_interest)
+        cache[year_month] = result
+        return result
+
+    def calculate_interest_range(self, account_id: str, from_ym: str,
+                                 to_ym: str) -> Dict[str, Tuple[List[Transaction], Money]]:
+        """
+        Calculates and posts monthly interest for every month from from_ym
+        through to_ym (inclusive), as calculate_monthly_interest would month
+        by month. Cached and closed months are served as they are; from the
+        first month that needs computing on, the ledger is swept once in date
+        order (see iter_month_interest) and each month's interest is posted
+        at its end before the next month is read.
+        Returns each month's (interest txns, interest amount).
+        """
+        with self.metrics.call("calculate_interest_range") as call:
+            return self._calculate_interest_range(account_id, from_ym, to_ym, call)
+
+    def _calculate_interest_range(self, account_id: str, from_ym: str, to_ym: str,
+                                  call) -> Dict[str, Tuple[List[Transaction], Money]]:
         if account_id not in self.accounts:
             raise ValueError(f"Account {account_id} not found")
+        for year_month in (from_ym, to_ym):
+            if len(year_month) != 6 or not year_month.isdigit():
+                raise ValueError("YearMonth must be in YYYYMM format")
+        if from_ym > to_ym:
+            raise ValueError("Start month must not be after end month")
 
         account = self.accounts[account_id]
-        year = int(year_month[:4])
-        month = int(year_month[4:6])
-
-        start_date = datetime.date(year, month, 1)
-        end_date = (
-            datetime.date(year + 1, 1, 1) - datetime.timedelta(days=1)
-            if month == 12
-            else datetime.date(year, month + 1, 1) - datetime.timedelta(days=1)
-        )
-
-        total_interest = Decimal('0.00')
-        tx_dates = [d for d in account.get_all_transaction_dates() if d <= end_date.strftime("%Y%m%d")]
-        dates = sorted(set([start_date.strftime("%Y%m%d"), end_date.strftime("%Y%m%d")] + tx_dates))
-
-        periods = []
-        for i in range(len(dates) - 1):
-            period_start = dates[i]
-            period_end = (datetime.datetime.strptime(dates[i + 1], "%Y%m%d") - datetime.timedelta(days=1)).strftime("%Y%m%d")
-            if period_end >= period_start:
-                periods.append((period_start, period_end))
-        if dates[-1] == end_date.strftime("%Y%m%d"):
-            periods.append((dates[-1], dates[-1]))
-
-        for period_start, period_end in periods:
-            dt_start = datetime.datetime.strptime(period_start, "%Y%m%d").date()
-            dt_end = datetime.datetime.strptime(period_end, "%Y%m%d").date()
-            num_days = (dt_end - dt_start).days + 1
-            if num_days <= 0:
+        cache = self._interest_cache.setdefault(account_id, {})
+        months = months_between(from_ym, to_ym)
+        results: Dict[str, Tuple[List[Transaction], Money]] = {}
+        # Cached and closed months come first: computing a month drops the
+        # cache of every later one
+        pending = 0
+        for year_month in months:
+            if account.month_closed(year_month):
+                results[year_month] = _closed_interest(ordinal_to_date(month_range(year_month)[1]),
+                                                       account.checkpoint(year_month))
+                call.count("checkpoint_hits")
+            elif year_month in cache:
+                results[year_month] = cache[year_month]
+                call.count("cache_hits")
+            else:
+                break
+            pending += 1
+        months = months[pending:]
+        if not months:
+            return results
+
+        rates = self.rule_timeline.rates_between(month_range(months[0])[0], month_range(months[-1])[1])
+        call.count("rule_lookups")
+        call.count("recomputations")
+        sweep = iter_month_interest(account.ledger, months, rates)
+        for year_month in months:
+            end = ordinal_to_date(month_range(year_month)[1])
+            # A stale posting at this month's end must not count towards it
+            previous = self._reverse_interest(account, end)
+            _, interest = next(sweep)
+            if not self._interest_cut_covered(account, end, previous, interest):
+                raise ValueError(f"Reduced interest for {year_month} would cause negative balance")
+            result: Tuple[List[Transaction], Money] = ([], Money(0))
+            if interest > 0:
+                result = ([self._post_interest(account, end, interest)], interest)
+            cache[year_month] = results[year_month] = result
+        return results
+
+    def run_month_end(self, year_month: str, workers: int = 1, engine: str = "accrual") -> Dict[str, Money]:
+        """
+        Calculates and posts monthly interest for every account.
+        The default engine reads each account's running accrual, which lives
+        in this process, so it only runs with workers=1 (ValueError
+        otherwise). With engine="decimal" or "numpy" the month is recomputed
+        from balance points instead, and with workers > 1 the accounts are
+        sharded across a process pool; each worker only receives the month's
+        balance points and rates. Interest is posted in account_id order, so the result does
+        not depend on engine or workers.
+        Accounts whose interest for the month is already cached are skipped.
+        Returns the month's interest per account (accounts with none omitted).
+        Raises ValueError, after posting every other account, if reduced
+        interest would overdraw an account (see _interest_cut_covered).
+        """
+        with self.metrics.call("run_month_end") as call:
+            return self._run_month_end(year_month, workers, engine, call)
+
+    def _run_month_end(self, year_month: str, workers: int, engine: str, call) -> Dict[str, Money]:
+        if engine not in ("accrual", "decimal", "numpy"):
+            raise ValueError(f"Unknown interest engine: {engine}")
+        if engine == "accrual" and workers > 1:
+            raise ValueError("The accrual engine cannot run on multiple workers; use engine='decimal' or 'numpy'")
+        first, last = month_range(year_month)
+        end = ordinal_to_date(last)
+        rates = self._rate_inputs(first, last)
+        call.count("rule_lookups")
+        posted: Dict[str, Money] = {}
+        previous: Dict[str, Optional[Money]] = {}
+        jobs = []
+        for account_id in self._account_ids():
+            cached = self._interest_cache.setdefault(account_id, {}).get(year_month)
+            if cached is not None:
+                if cached[1] > 0:
+                    posted[account_id] = cached[1]
+                call.count("cache_hits")
                 continue
+            account = self.accounts[account_id]
+            if account.month_closed(year_month):
+                checkpoint = account.checkpoint(year_month)
+                if checkpoint is not None and checkpoint.interest > 0:
+                    posted[account_id] = checkpoint.interest
+                continue
+            accrual = self._accrual(account)
+            call.track(accrual)
+            previous[account_id] = self._reverse_interest(account, end)
+            if engine == "accrual":
+                jobs.append((account_id, accrual.month_interest(year_month)))
+            else:
+                balances = self._interest_inputs(account, first, last)
+                call.count("recomputations")
+                call.count("balance_lookups", len(balances))
+                jobs.append((account_id, balances))
 
-            balance = account.get_balance_on_date(period_start)
-            rule = self.get_interest_rule_for_date(period_start)
-            if not rule:
+        if engine == "accrual":
+            results = jobs
+        elif workers <= 1 or len(jobs) < 2:
+            results = _month_end_shard(last, rates, jobs, engine)
+        else:
+            size = -(-len(jobs) // workers)
+            shards = [jobs[i:i + size] for i in range(0, len(jobs), size)]
+            results = []
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for shard_result in pool.map(_month_end_shard, [last] * len(shards),
+                                             [rates] * len(shards), shards, [engine] * len(shards)):
+                    results.extend(shard_result)
+
+        overdrawn = []
+        for account_id, interest in sorted(results, key=lambda r: r[0]):
+            if not self._interest_cut_covered(self.accounts[account_id], end, previous[account_id], interest):
+                overdrawn.append(account_id)
                 continue
+            result: Tuple[List[Transaction], Money] = ([], Money(0))
+            if interest > 0:
+                result = ([self._post_interest(self.accounts[account_id], end, interest)], interest)
+                posted[account_id] = interest
+            self._interest_cache[account_id][year_month] = result
+        if overdrawn:
+            raise ValueError(f"Reduced interest for {year_month} would cause negative balance "
+                             f"in {', '.join(overdrawn)}")
+        return dict(sorted(posted.items()))
 
-            interest = (balance * (rule.rate / Decimal('100')) * Decimal(num_days)) / Decimal('365')
-            interest = interest.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-            total_interest += interest
+    def close_months(self, through: str, evict: bool = False,
+                     archive_dir: Optional[str] = None) -> Dict[str, List[MonthCheckpoint]]:
+        """
+        Month-close compaction for every account: posts any missing interest
+        for each month up to and including `through`, then closes those
+        months (see Account.close_months). With archive_dir, evicted entries
+        go to <archive_dir>/<account>-<through>.ledger. Cached and
+        accrued interest for closed months is dropped; later months start
+        from the closing balance. Returns the new checkpoints per account.
+        """
+        with self.metrics.call("close_months") as call:
+            return self._close_months(through, evict, archive_dir, call)
 
-        total_interest = total_interest.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-        if total_interest > 0:
-            interest_txn = account.add_interest(end_date.strftime("%Y%m%d"), total_interest)
-            return [interest_txn], total_interest
-        return [], Decimal('0.00')
+    def _close_months(self, through: str, evict: bool, archive_dir: Optional[str],
+                      call) -> Dict[str, List[MonthCheckpoint]]:
+        if len(through) != 6 or not through.isdigit():
+            raise ValueError("YearMonth must be in YYYYMM format")
+        closed = {}
+        for account_id in self._account_ids():
+            account = self.accounts[account_id]
+            if account.closed_through is not None:
+                year_month = month_key(account.closed_through + 1)
+            elif len(account.ledger):
+                year_month = month_key(account.ledger.dates[0])
+            else:
+                continue
+            if year_month <= through:
+                self._calculate_interest_range(account_id, year_month, through, call)
+            archive_path = None
+            if archive_dir is not None:
+                archive_path = os.path.join(archive_dir, f"{account_id}-{through}.ledger")
+            checkpoints = self._close_account(account, through, evict, archive_path)
+            if checkpoints:
+                closed[account_id] = checkpoints
+                cache = self._interest_cache.get(account_id, {})
+                for ym in [ym for ym in cache if ym <= through]:
+                    del cache[ym]
+                self._accruals.pop(account_id, None)
+        return closed
+
+    def _close_account(self, account: Account, through: str, evict: bool,
+                       archive_path: Optional[str]) -> List[MonthCheckpoint]:
+        """Closes one account's months, setting aside the day totals of entries it evicts."""
+        last_day = month_range(through)[1]
+        if (evict or archive_path) and (account.closed_through is None or last_day > account.closed_through):
+            self.aggregates.keep_evicted(account.ledger, bisect_right(account.ledger.dates, last_day))
+        return account.close_months(through, evict, archive_path)
 
     def get_account_statement(self, account_id: str, year_month: str) -> List[Transaction]:
-        if account_id not in self.accounts:
-            raise ValueError(f"Account {account_id} not found")
-        return self.accounts[account_id].get_statement(year_month)
+        with self.metrics.call("get_account_statement") as call:
+            if account_id not in self.accounts:
+                raise ValueError(f"Account {account_id} not found")
+            statement = self.accounts[account_id].get_statement(year_month)
+            call.count("rows", len(statement))
+            return statement
+
+    def get_account_statement_range(self, account_id: str, from_ym: str, to_ym: str) -> List[Transaction]:
+        """Transactions of every month from from_ym through to_ym (inclusive), in order."""
+        with self.metrics.call("get_account_statement_range") as call:
+            if account_id not in self.accounts:
+                raise ValueError(f"Account {account_id} not found")
+            statement = self.accounts[account_id].get_statement_range(from_ym, to_ym)
+            call.count("rows", len(statement))
+            return statement
+
+    def get_day_totals(self, date: str) -> Dict[str, Money]:
+        """Bank-wide deposits, withdrawals and interest posted on a date, keyed D/W/I."""
+        return self.aggregates.day_totals(date)
+
+    def get_totals_between(self, start: str, end: str) -> Dict[str, Money]:
+        """Bank-wide deposits, withdrawals and interest posted within [start, end]."""
+        return self.aggregates.totals_between(start, end)
+
+    def get_total_balance(self) -> Money:
+        """Sum of all current account balances."""
+        return self.aggregates.total_balance()
+
+    def get_top_balances(self, n: int) -> List[Tuple[str, Money]]:
+        """The n largest current balances as (account_id, balance), largest first."""
+        return self.aggregates.top_balances(n)
+
+    def get_accounts_below(self, threshold) -> List[Tuple[str, Money]]:
+        """Accounts with a current balance strictly below threshold, lowest first."""
+        return self.aggregates.accounts_below(threshold)
+
+def _closed_interest(end: str, checkpoint: Optional[MonthCheckpoint]) -> Tuple[List[Transaction], Money]:
+    """
+    Interest result for a closed month, rebuilt from its checkpoint. Closed
+    months without one (before the account's first posting) earned none.
+    """
+    if checkpoint is not None and checkpoint.interest > 0:
+        return [Transaction.trusted(end, "", 'I', checkpoint.interest)], checkpoint.interest
+    return [], Money(0)
+
+def _month_end_shard(end: int, rates: List[Tuple[int, Decimal]],
+                     jobs: List[Tuple[str, List[Tuple[int, Money]]]],
+                     engine: str = "decimal") -> List[Tuple[str, Money]]:
+    """Process-pool worker: interest for a shard of accounts."""
+    if engine == "numpy":
+        interests = batch_period_interest(end, [balances for _, balances in jobs], rates)
+        return [(account_id, interest) for (account_id, _), interest in zip(jobs, interests)]
+    return [(account_id, compute_period_interest(end, balances, rates))
+            for account_id, balances in jobs]
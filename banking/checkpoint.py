@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from banking.money import Money
+import zlib
+
+@dataclass(frozen=True)
+class MonthCheckpoint:
+    """
+    Summary of a closed month: balance at month end, interest posted in the
+    month, number of ledger entries and a CRC32 of those entries, so a
+    month's detail can be evicted (or checked against an archive) later.
+    """
+    year_month: str
+    closing_balance: Money
+    interest: Money
+    txn_count: int
+    checksum: int
+
+def month_checksum(ledger, lo: int, hi: int) -> int:
+    """CRC32 over the date, seq, type and amount columns of entries [lo, hi)."""
+    crc = 0
+    for col in (ledger.dates, ledger.seqs, ledger.types, ledger.amounts):
+        crc = zlib.crc32(col[lo:hi].tobytes(), crc)
+    return crc
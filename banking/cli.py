@@ -3,7 +3,14 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from banking.bank import Bank
+from banking.ingest import read_records
+from banking.statement import TableSink, iter_statement
 from decimal import Decimal, InvalidOperation
+from itertools import islice
+from typing import Iterable, List
+
+IMPORT_BATCH_SIZE = 10000
+ECHO_LEVELS = ("none", "summary", "id")
 
 class CLI:
     def __init__(self):
@@ -55,6 +62,101 @@ class CLI:
             except Exception as e:
                 print(f"Error: {e}")
 
+    def import_transactions(self, lines: Iterable[str], batch_size: int = IMPORT_BATCH_SIZE) -> int:
+        """
+        Streams <Date> <Account> <Type> <Amount> lines into the bank in
+        batches and prints a summary instead of per-record statements.
+        Returns the number of rejected records.
+        """
+        records = read_records(lines)
+        accepted = rejected = offset = 0
+        while True:
+            batch = list(islice(records, batch_size))
+            if not batch:
+                break
+            report = self.bank.add_transactions(batch)
+            for idx in sorted(report.errors):
+                print(f"Record {offset + idx + 1}: Error: {report.errors[idx]}")
+            accepted += report.accepted
+            rejected += report.rejected
+            offset += len(batch)
+        print(f"Imported {accepted} transactions, {rejected} rejected.")
+        return rejected
+
+    def run_script(self, lines: Iterable[str], echo: str = "summary") -> int:
+        """
+        Runs T/I/P commands non-interactively, one per line:
+            T <Date> <Account> <Type> <Amount>
+            I <Date> <RuleId> <Rate in %>
+            P <Account> <Year><Month>
+        Blank lines and lines starting with '#' are skipped and Q stops the
+        script. Statements are printed only for P commands. Errors are
+        always printed with their line number; echo "id" also prints each
+        new transaction id and rule message, "summary" only a final count
+        and "none" nothing else. Returns the number of failed commands.
+        """
+        if echo not in ECHO_LEVELS:
+            raise ValueError(f"Echo level must be one of {', '.join(ECHO_LEVELS)}")
+        out: List[str] = []
+        counts = {'T': 0, 'I': 0, 'P': 0}
+        failed = 0
+        for lineno, line in enumerate(lines, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            command, *args = line.split()
+            command = command.upper()
+            if command == 'Q':
+                break
+            try:
+                message = self._run_command(command, args, out)
+                counts[command] += 1
+                if echo == "id" and message:
+                    out.append(message)
+            except InvalidOperation:
+                failed += 1
+                out.append(f"Line {lineno}: Error: Invalid {'rate' if command == 'I' else 'amount'} format")
+            except ValueError as e:
+                failed += 1
+                out.append(f"Line {lineno}: Error: {e}")
+            if len(out) >= IMPORT_BATCH_SIZE:
+                self._flush(out)
+        if echo != "none":
+            out.append(f"Processed {counts['T']} transactions, {counts['I']} interest rules, "
+                       f"{counts['P']} statements; {failed} failed.")
+        self._flush(out)
+        return failed
+
+    def _run_command(self, command: str, args: List[str], out: List[str]) -> str:
+        """Runs one script command and returns its echo line. Raises ValueError on failure."""
+        if command == 'T' and len(args) == 4:
+            date, account_id, txn_type, amount = args
+            txn = self.bank.add_transaction(date, account_id, txn_type, Decimal(amount))
+            return f"Transaction {txn.txn_id} added successfully."
+        if command == 'I' and len(args) == 3:
+            date, rule_id, rate = args
+            success, msg = self.bank.add_interest_rule(date, rule_id, Decimal(rate))
+            if not success:
+                raise ValueError(msg)
+            return msg
+        if command == 'P' and len(args) == 2:
+            account_id, year_month = args
+            if len(year_month) != 6 or not year_month.isdigit():
+                raise ValueError("YearMonth must be in YYYYMM format")
+            self.bank.calculate_monthly_interest(account_id, year_month)
+            self._flush(out)
+            sink = TableSink()
+            sink.write(account_id, iter_statement(self.bank.accounts[account_id], year_month))
+            sink.close()
+            return ""
+        raise ValueError("Invalid input format")
+
+    @staticmethod
+    def _flush(out: List[str]) -> None:
+        if out:
+            sys.stdout.write("\n".join(out) + "\n")
+            out.clear()
+
     def handle_interest_rules(self):
         print("Please enter interest rules details in <Date> <RuleId> <Rate in %> format")
         print("(or enter blank to go back to main menu):")
@@ -96,29 +198,21 @@ class CLI:
                 print(f"Error: {e}")
 
     def print_account_statement(self, account_id: str, year_month: str = None):
+        account = self.bank.accounts.get(account_id)
         if year_month:
-            try:
-                transactions = self.bank.get_account_statement(account_id, year_month)
-            except Exception as e:
-                print(f"Error: {e}")
+            if len(year_month) != 6 or not year_month.isdigit():
+                print("Error: YearMonth must be in YYYYMM format")
                 return
-        else:
-            account = self.bank.accounts.get(account_id)
             if not account:
-                print(f"Account {account_id} not found")
+                print(f"Error: Account {account_id} not found")
                 return
-            transactions = account.transactions
-
-        print(f"Account: {account_id}")
-        print("| Date     | Txn Id      | Type | Amount | Balance |")
-        balance = Decimal('0.00')
-        for txn in sorted(transactions, key=lambda t: (t.date, t.txn_id or "")):
-            if txn.txn_type in ('D', 'I'):
-                balance += txn.amount
-            elif txn.txn_type == 'W':
-                balance -= txn.amount
-            balance = balance.quantize(Decimal('0.01'))
-            print(f"| {txn.date} | {txn.txn_id:<11} | {txn.txn_type}    | {txn.amount:7.2f} | {balance:8.2f} |")
+        elif not account:
+            print(f"Account {account_id} not found")
+            return
+
+        sink = TableSink()
+        sink.write(account_id, iter_statement(account, year_month))
+        sink.close()
 
     def print_interest_rules(self):
         rules = self.bank.get_interest_rules()
@@ -0,0 +1,194 @@
+from contextlib import ExitStack, contextmanager
+from decimal import Decimal
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
+from banking.account import Account
+from banking.bank import Bank
+from banking.checkpoint import MonthCheckpoint
+from banking.interest_rule import InterestRule
+from banking.money import Money
+from banking.transaction import Transaction
+import threading
+
+T = TypeVar('T')
+
+class ReadWriteLock:
+    """Many concurrent readers or one writer; waiting writers block new readers."""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    @contextmanager
+    def read(self):
+        with self._cond:
+            while self._writer or self._waiting_writers:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write(self):
+        with self._cond:
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
+class ConcurrentBank(Bank):
+    """
+    Bank that is safe to call from many threads.
+    Writes to an account hold one of `stripes` re-entrant locks chosen by
+    account_id hash, so different accounts post in parallel. Each write bumps
+    a per-account version twice (odd while in progress); statement and
+    balance reads run without locks and retry under the stripe lock only if
+    a write overlapped them. The interest-rule table sits behind a
+    readers/writer lock, and run_month_end holds every stripe.
+    """
+
+    def __init__(self, stripes: int = 64):
+        super().__init__()
+        self._stripes = [threading.RLock() for _ in range(stripes)]
+        self._accounts_lock = threading.Lock()
+        self._versions: Dict[str, int] = {}
+        self._rules_lock = ReadWriteLock()
+
+    def _lock_for(self, account_id: str) -> threading.RLock:
+        return self._stripes[hash(account_id) % len(self._stripes)]
+
+    def _find_or_create_account(self, account_id: str) -> Account:
+        account = self.accounts.get(account_id)
+        if account is None:
+            with self._accounts_lock:
+                account = self.accounts.get(account_id)
+                if account is None:
+                    # Version first: lock-free readers look it up as soon as
+                    # the account is visible
+                    self._versions[account_id] = 0
+                    account = self.accounts[account_id] = Account(account_id)
+        return account
+
+    def _account_ids(self) -> List[str]:
+        with self._accounts_lock:
+            return sorted(self.accounts)
+
+    @contextmanager
+    def _writing(self, account: Account):
+        account_id = account.account_id
+        with self._lock_for(account_id):
+            self._versions[account_id] += 1
+            try:
+                yield
+            finally:
+                self._versions[account_id] += 1
+
+    def read_account(self, account_id: str, read: Callable[[Account], T], retries: int = 3) -> T:
+        """
+        Runs a read-only callable against an account without taking its lock,
+        retrying under the stripe lock if a write overlapped it.
+        """
+        account = self.accounts.get(account_id)
+        if account is None:
+            raise ValueError(f"Account {account_id} not found")
+        for _ in range(retries):
+            version = self._versions[account_id]
+            if version % 2 == 0:
+                try:
+                    result = read(account)
+                except IndexError:
+                    continue
+                if self._versions[account_id] == version:
+                    return result
+        with self._lock_for(account_id):
+            return read(account)
+
+    def _apply_transaction(self, account: Account, date: str, txn_type: str, amount) -> Transaction:
+        with self._writing(account):
+            return super()._apply_transaction(account, date, txn_type, amount)
+
+    def _post_interest(self, account: Account, date: str, amount: Money) -> Transaction:
+        with self._writing(account):
+            return super()._post_interest(account, date, amount)
+
+    def _reverse_interest(self, account: Account, date: str) -> Optional[Money]:
+        with self._writing(account):
+            return super()._reverse_interest(account, date)
+
+    def _close_account(self, account: Account, through: str, evict: bool,
+                       archive_path: Optional[str]) -> List[MonthCheckpoint]:
+        with self._writing(account):
+            return super()._close_account(account, through, evict, archive_path)
+
+    def _on_rule_change(self, account_id: str, date: str) -> None:
+        with self._lock_for(account_id):
+            super()._on_rule_change(account_id, date)
+
+    def _interest_inputs(self, account: Account, first: int, last: int) -> List[Tuple[int, Money]]:
+        with self._lock_for(account.account_id):
+            return super()._interest_inputs(account, first, last)
+
+    def add_interest_rule(self, date: str, rule_id: str, rate: Decimal) -> Tuple[bool, str]:
+        with self._rules_lock.write():
+            return super().add_interest_rule(date, rule_id, rate)
+
+    def get_interest_rules(self) -> List[InterestRule]:
+        with self._rules_lock.read():
+            return super().get_interest_rules()
+
+    def get_interest_rule_for_date(self, date: str) -> Optional[InterestRule]:
+        with self._rules_lock.read():
+            return super().get_interest_rule_for_date(date)
+
+    def calculate_monthly_interest(self, account_id: str, year_month: str) -> Tuple[List[Transaction], Money]:
+        with self._rules_lock.read(), self._lock_for(account_id):
+            return super().calculate_monthly_interest(account_id, year_month)
+
+    def calculate_interest_range(self, account_id: str, from_ym: str,
+                                 to_ym: str) -> Dict[str, Tuple[List[Transaction], Money]]:
+        with self._rules_lock.read(), self._lock_for(account_id):
+            return super().calculate_interest_range(account_id, from_ym, to_ym)
+
+    def run_month_end(self, year_month: str, workers: int = 1, engine: str = "accrual") -> Dict[str, Money]:
+        # Month-end is a batch close: hold every stripe (in a fixed order) so
+        # no posting can land between reading an account's balances and
+        # caching the interest computed from them.
+        with self._rules_lock.read(), ExitStack() as stack:
+            for lock in self._stripes:
+                stack.enter_context(lock)
+            return super().run_month_end(year_month, workers, engine)
+
+    def close_months(self, through: str, evict: bool = False,
+                     archive_dir: Optional[str] = None) -> Dict[str, List[MonthCheckpoint]]:
+        with self._rules_lock.read(), ExitStack() as stack:
+            for lock in self._stripes:
+                stack.enter_context(lock)
+            return super().close_months(through, evict, archive_dir)
+
+    def get_account_statement(self, account_id: str, year_month: str) -> List[Transaction]:
+        with self.metrics.call("get_account_statement") as call:
+            statement = self.read_account(account_id, lambda account: account.get_statement(year_month))
+            call.count("rows", len(statement))
+            return statement
+
+    def get_account_statement_range(self, account_id: str, from_ym: str, to_ym: str) -> List[Transaction]:
+        with self.metrics.call("get_account_statement_range") as call:
+            statement = self.read_account(account_id, lambda account: account.get_statement_range(from_ym, to_ym))
+            call.count("rows", len(statement))
+            return statement
+
+    def get_balance_on_date(self, account_id: str, date: str) -> Money:
+        return self.read_account(account_id, lambda account: account.get_balance_on_date(date))
@@ -0,0 +1,96 @@
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+from typing import List, Tuple, Union
+import datetime
+
+# Calendar table: first-day ordinal of every month from FIRST_YEAR to
+# LAST_YEAR, plus one sentinel past the end. Dates outside the table fall
+# back to datetime.
+FIRST_YEAR = 1900
+LAST_YEAR = 2199
+
+def _build_month_starts() -> array:
+    starts = array('i')
+    for year in range(FIRST_YEAR, LAST_YEAR + 1):
+        for month in range(1, 13):
+            starts.append(datetime.date(year, month, 1).toordinal())
+    starts.append(datetime.date(LAST_YEAR + 1, 1, 1).toordinal())
+    return starts
+
+_MONTH_STARTS = _build_month_starts()
+_TABLE_FIRST = _MONTH_STARTS[0]
+_TABLE_END = _MONTH_STARTS[-1]
+
+def _month_index(date_ord: int) -> int:
+    """Index into the month table of the month containing date_ord (-1 if outside)."""
+    if _TABLE_FIRST <= date_ord < _TABLE_END:
+        return bisect_right(_MONTH_STARTS, date_ord) - 1
+    return -1
+
+@lru_cache(maxsize=4096)
+def date_to_ordinal(date: str) -> int:
+    """'YYYYMMDD' -> proleptic Gregorian day ordinal. Raises ValueError if invalid."""
+    if len(date) != 8 or not date.isdigit():
+        raise ValueError(f"Invalid date format: {date}")
+    year, month, day = int(date[:4]), int(date[4:6]), int(date[6:])
+    idx = (year - FIRST_YEAR) * 12 + month - 1
+    if FIRST_YEAR <= year <= LAST_YEAR and 1 <= month <= 12:
+        if 1 <= day <= _MONTH_STARTS[idx + 1] - _MONTH_STARTS[idx]:
+            return _MONTH_STARTS[idx] + day - 1
+        raise ValueError(f"Invalid date format: {date}")
+    try:
+        return datetime.date(year, month, day).toordinal()
+    except ValueError:
+        raise ValueError(f"Invalid date format: {date}") from None
+
+@lru_cache(maxsize=4096)
+def ordinal_to_date(date_ord: int) -> str:
+    """Day ordinal -> 'YYYYMMDD'. Only used when formatting output."""
+    idx = _month_index(date_ord)
+    if idx < 0:
+        return datetime.date.fromordinal(date_ord).strftime("%Y%m%d")
+    year, month = divmod(idx, 12)
+    return f"{year + FIRST_YEAR:04d}{month + 1:02d}{date_ord - _MONTH_STARTS[idx] + 1:02d}"
+
+def as_ordinal(date: Union[int, str]) -> int:
+    """Accepts a day ordinal or a 'YYYYMMDD' string."""
+    return date if isinstance(date, int) else date_to_ordinal(date)
+
+def month_start(date_ord: int) -> int:
+    """Ordinal of the first day of date_ord's month."""
+    idx = _month_index(date_ord)
+    if idx < 0:
+        return datetime.date.fromordinal(date_ord).replace(day=1).toordinal()
+    return _MONTH_STARTS[idx]
+
+def month_end(date_ord: int) -> int:
+    """Ordinal of the last day of date_ord's month."""
+    idx = _month_index(date_ord)
+    if idx < 0:
+        d = datetime.date.fromordinal(date_ord)
+        first_next = datetime.date(d.year + 1, 1, 1) if d.month == 12 else datetime.date(d.year, d.month + 1, 1)
+        return first_next.toordinal() - 1
+    return _MONTH_STARTS[idx + 1] - 1
+
+def month_key(date_ord: int) -> str:
+    """'YYYYMM' of the month containing date_ord."""
+    return ordinal_to_date(month_start(date_ord))[:6]
+
+@lru_cache(maxsize=1024)
+def month_range(year_month: str) -> Tuple[int, int]:
+    """First and last day ordinals of a YYYYMM month."""
+    first = date_to_ordinal(year_month + "01")
+    return first, month_end(first)
+
+def next_month(year_month: str) -> str:
+    """The YYYYMM month after year_month."""
+    return month_key(month_range(year_month)[1] + 1)
+
+def months_between(from_ym: str, to_ym: str) -> List[str]:
+    """YYYYMM keys from from_ym through to_ym inclusive (empty if reversed)."""
+    months = []
+    while from_ym <= to_ym:
+        months.append(from_ym)
+        from_ym = next_month(from_ym)
+    return months
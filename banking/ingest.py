@@ -0,0 +1,32 @@
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+@dataclass
+class IngestReport:
+    """
+    Outcome of a bulk transaction load.
+    txn_ids holds the new transaction id for each accepted record (None for
+    rejected ones); errors maps record index to its error message.
+    """
+    txn_ids: List[Optional[str]] = field(default_factory=list)
+    errors: Dict[int, str] = field(default_factory=dict)
+
+    @property
+    def accepted(self) -> int:
+        return len(self.txn_ids) - len(self.errors)
+
+    @property
+    def rejected(self) -> int:
+        return len(self.errors)
+
+def read_records(lines: Iterable[str]) -> Iterator[Sequence[str]]:
+    """
+    Yields <Date> <Account> <Type> <Amount> records from text lines.
+    Blank lines and lines starting with '#' are skipped; other lines are
+    split on whitespace and left for the bank to validate.
+    """
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        yield line.split()
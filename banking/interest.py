@@ -0,0 +1,104 @@
+from decimal import Decimal
+from typing import Iterator, List, Sequence, Tuple, Union
+from banking.dates import as_ordinal, month_range, ordinal_to_date
+from banking.money import Money, half_up_div
+
+def month_bounds(year_month: str) -> Tuple[str, str]:
+    """Returns the first and last dates (YYYYMMDD) of a YYYYMM month."""
+    first, last = month_range(year_month)
+    return ordinal_to_date(first), ordinal_to_date(last)
+
+def compute_period_interest(end: Union[int, str],
+                            balances: Sequence[Tuple[Union[int, str], Money]],
+                            rules: Sequence[Tuple[Union[int, str], Decimal]]) -> Money:
+    """
+    Computes interest for one account over [balances[0][0], end].
+    balances holds (date, end-of-day balance) for the start date and every
+    later transaction date; rules holds (effective date, rate %) for the
+    rules effective in the window. Periods are split at both, each period's
+    interest is rounded HALF_UP to cents and the rounded amounts are summed.
+    The maths is exact integer arithmetic on cents and the rate's ratio.
+    Dates may be day ordinals or YYYYMMDD strings; they are compared and
+    subtracted as ordinals.
+    """
+    end = as_ordinal(end)
+    balances = [(as_ordinal(d), b) for d, b in balances]
+    rules = [(as_ordinal(d), r) for d, r in rules]
+    boundaries: List[Tuple[int, Money]] = []
+    b_idx = r_idx = 0
+    balance = Money(0)
+    # Merge balance and rule dates into one ordered boundary stream
+    while b_idx < len(balances) or r_idx < len(rules):
+        if r_idx >= len(rules) or (b_idx < len(balances) and balances[b_idx][0] <= rules[r_idx][0]):
+            date, balance = balances[b_idx]
+            b_idx += 1
+        else:
+            date = rules[r_idx][0]
+            r_idx += 1
+        if date < balances[0][0] or date > end:
+            continue
+        if boundaries and boundaries[-1][0] == date:
+            boundaries[-1] = (date, balance)
+        else:
+            boundaries.append((date, balance))
+
+    total_cents = 0
+    rule_idx = 0
+    rate = None
+    for i, (period_start, balance) in enumerate(boundaries):
+        next_start = boundaries[i + 1][0] if i + 1 < len(boundaries) else end + 1
+        num_days = next_start - period_start
+
+        while rule_idx < len(rules) and rules[rule_idx][0] <= period_start:
+            rate = rules[rule_idx][1].as_integer_ratio()
+            rule_idx += 1
+        if rate is None:
+            continue
+
+        # balance * rate% * days / 365, rounded HALF_UP to cents
+        total_cents += half_up_div(balance.cents * rate[0] * num_days, 36500 * rate[1])
+
+    return Money(total_cents)
+
+def iter_month_interest(ledger, months: Sequence[str],
+                        rates: Sequence[Tuple[int, Tuple[int, int]]]) -> Iterator[Tuple[str, Money]]:
+    """
+    Yields (YYYYMM, interest) for consecutive months in one forward sweep of
+    the ledger, with the same periods and rounding as compute_period_interest.
+    rates is InterestRuleTimeline.rates_between over the whole range; the
+    active rule is carried from month to month, and each month starts from
+    the running balance just before it. The ledger may be changed between
+    months (e.g. to post the yielded interest) as long as nothing after the
+    yielded month's end moves.
+    """
+    r_idx = 0
+    rate = None
+    for year_month in months:
+        dates, running = ledger.dates, ledger.running
+        first, last = month_range(year_month)
+        lo, hi = ledger.span(first, last)
+        cents = running[lo - 1] if lo else ledger.opening
+        idx = lo
+        while idx < hi and dates[idx] == first:
+            idx += 1
+        if idx > lo:
+            cents = running[idx - 1]
+        total = 0
+        start = first
+        while start <= last:
+            while r_idx < len(rates) and rates[r_idx][0] <= start:
+                rate = rates[r_idx][1]
+                r_idx += 1
+            next_start = last + 1
+            if idx < hi and dates[idx] < next_start:
+                next_start = dates[idx]
+            if r_idx < len(rates) and rates[r_idx][0] < next_start:
+                next_start = rates[r_idx][0]
+            if rate is not None:
+                # balance * rate% * days / 365, rounded HALF_UP to cents
+                total += half_up_div(cents * rate[0] * (next_start - start), 36500 * rate[1])
+            start = next_start
+            while idx < hi and dates[idx] == start:
+                idx += 1
+                cents = running[idx - 1]
+        yield year_month, Money(total)
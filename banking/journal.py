@@ -0,0 +1,142 @@
+from typing import BinaryIO, Iterator, Optional, Tuple
+import os
+import struct
+import threading
+import time
+import zlib
+
+# Record kinds
+TXN = 1
+INTEREST = 2
+RULE = 3
+INTEREST_REVERSAL = 4
+
+_FRAME = struct.Struct('<BI')     # kind, payload length
+_CRC = struct.Struct('<I')
+_TXN = struct.Struct('<QiBq')     # seq, date ordinal, type code, cents
+_SEQ = struct.Struct('<Q')
+_STR = struct.Struct('<H')
+
+def _pack_str(value: str) -> bytes:
+    data = value.encode('utf-8')
+    return _STR.pack(len(data)) + data
+
+def _unpack_str(buf: bytes, offset: int) -> Tuple[str, int]:
+    (length,) = _STR.unpack_from(buf, offset)
+    offset += _STR.size
+    return buf[offset:offset + length].decode('utf-8'), offset + length
+
+def encode_txn(seq: int, date_ord: int, type_code: int, cents: int, account_id: str) -> bytes:
+    return _TXN.pack(seq, date_ord, type_code, cents) + _pack_str(account_id)
+
+def decode_txn(payload: bytes) -> Tuple[int, int, int, int, str]:
+    seq, date_ord, type_code, cents = _TXN.unpack_from(payload)
+    account_id, _ = _unpack_str(payload, _TXN.size)
+    return seq, date_ord, type_code, cents, account_id
+
+def encode_rule(seq: int, date: str, rule_id: str, rate: str) -> bytes:
+    return _SEQ.pack(seq) + _pack_str(date) + _pack_str(rule_id) + _pack_str(rate)
+
+def decode_rule(payload: bytes) -> Tuple[int, str, str, str]:
+    (seq,) = _SEQ.unpack_from(payload)
+    date, offset = _unpack_str(payload, _SEQ.size)
+    rule_id, offset = _unpack_str(payload, offset)
+    rate, _ = _unpack_str(payload, offset)
+    return seq, date, rule_id, rate
+
+def record_seq(payload: bytes) -> int:
+    """Every payload starts with its uint64 sequence number."""
+    return _SEQ.unpack_from(payload)[0]
+
+class Journal:
+    """
+    Append-only binary journal of bank mutations.
+    Each frame is kind, length, payload and a CRC32, so a torn tail write is
+    detected and dropped on recovery. Appends are buffered and fsync'd in
+    groups: once group_size records are pending or group_interval seconds
+    have passed since the last sync, whichever comes first. A background
+    timer syncs records left pending when appends stop, so an idle journal
+    is durable within group_interval.
+    """
+
+    def __init__(self, path: str, group_size: int = 256, group_interval: float = 0.05):
+        self.path = path
+        self.group_size = group_size
+        self.group_interval = group_interval
+        self._file: Optional[BinaryIO] = None
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+    def replay(self) -> Iterator[Tuple[int, bytes]]:
+        """
+        Yields (kind, payload) for every intact record. A corrupt or
+        truncated tail is cut off so later appends follow the last good record.
+        """
+        if not os.path.exists(self.path):
+            return
+        good = 0
+        with open(self.path, 'rb') as f:
+            data = f.read()
+        while good + _FRAME.size <= len(data):
+            kind, length = _FRAME.unpack_from(data, good)
+            end = good + _FRAME.size + length
+            if end + _CRC.size > len(data):
+                break
+            (crc,) = _CRC.unpack_from(data, end)
+            if zlib.crc32(data[good:end]) != crc:
+                break
+            yield kind, data[good + _FRAME.size:end]
+            good = end + _CRC.size
+        if good < len(data):
+            with open(self.path, 'r+b') as f:
+                f.truncate(good)
+
+    def append(self, kind: int, payload: bytes) -> None:
+        frame = _FRAME.pack(kind, len(payload)) + payload
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, 'ab')
+            self._file.write(frame + _CRC.pack(zlib.crc32(frame)))
+            self._pending += 1
+            if self._pending >= self.group_size or time.monotonic() - self._last_sync >= self.group_interval:
+                self._sync()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.group_interval, self._sync_due)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _sync_due(self) -> None:
+        with self._lock:
+            self._timer = None
+            self._sync()
+
+    def sync(self) -> None:
+        """Flushes buffered records and fsyncs them as one group."""
+        with self._lock:
+            self._sync()
+
+    def _sync(self) -> None:
+        if self._file is not None and self._pending:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def reset(self) -> None:
+        """Empties the journal once a snapshot covers everything in it."""
+        self.close()
+        with open(self.path, 'wb') as f:
+            f.flush()
+            os.fsync(f.fileno())
+
+    def close(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._file is not None:
+                self._sync()
+                self._file.close()
+                self._file = None
@@ -0,0 +1,139 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from typing import List, Tuple
+from banking.dates import date_to_ordinal, month_key, month_range, ordinal_to_date
+from banking.money import Money
+from banking.transaction import Transaction
+
+TYPE_CODES = {'D': 0, 'W': 1, 'I': 2}
+TYPE_NAMES = 'DWI'
+COLUMNS = ('dates', 'seqs', 'types', 'amounts', 'running')
+MAX_CENTS = 2 ** 63 - 1  # amounts and running balances are int64 columns
+
+class Ledger:
+    """
+    Columnar transaction history for one account.
+    Parallel arrays hold date ordinal, per-day sequence number (0 for
+    interest, which sorts first on its day), type code, amount in cents and
+    the running balance after each entry, all in (date, seq) order.
+    Transaction objects are only built on demand by materialise().
+    opening is the balance before the first entry: zero unless older
+    entries were evicted by month-close compaction.
+    """
+    __slots__ = COLUMNS + ('opening',)
+
+    def __init__(self):
+        self.dates = array('i')
+        self.seqs = array('I')
+        self.types = array('B')
+        self.amounts = array('q')
+        self.running = array('q')
+        self.opening = 0
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def insert(self, date_ord: int, seq: int, type_code: int, cents: int) -> int:
+        """
+        Inserts an entry at its (date, seq) position and updates the running
+        balances of every later entry. Returns the entry's index.
+        Raises ValueError, leaving the ledger unchanged, if the amount or any
+        resulting balance would not fit the int64 columns.
+        """
+        lo = bisect_left(self.dates, date_ord)
+        hi = bisect_right(self.dates, date_ord, lo)
+        idx = bisect_right(self.seqs, seq, lo, hi)
+        delta = -cents if type_code == TYPE_CODES['W'] else cents
+        running = self.running
+        balance = (running[idx - 1] if idx else self.opening) + delta
+        later = running[idx:]
+        if not (0 <= cents <= MAX_CENTS and _fits(balance)
+                and (not later or _fits(min(later) + delta) and _fits(max(later) + delta))):
+            raise ValueError("Amount out of range")
+
+        self.dates.insert(idx, date_ord)
+        self.seqs.insert(idx, seq)
+        self.types.insert(idx, type_code)
+        self.amounts.insert(idx, cents)
+        running.insert(idx, balance)
+        for i in range(idx + 1, len(running)):
+            running[i] += delta
+        return idx
+
+    def remove(self, idx: int) -> None:
+        """Removes an entry and backs its amount out of every later running balance."""
+        cents = self.amounts[idx]
+        delta = -cents if self.types[idx] == TYPE_CODES['W'] else cents
+        for col in COLUMNS:
+            del getattr(self, col)[idx]
+        running = self.running
+        for i in range(idx, len(running)):
+            running[i] -= delta
+
+    def balance_on(self, date_ord: int) -> int:
+        """Balance in cents at the end of the given day."""
+        idx = bisect_right(self.dates, date_ord)
+        return self.running[idx - 1] if idx else self.opening
+
+    def span(self, first_ord: int, last_ord: int) -> Tuple[int, int]:
+        """Index range [lo, hi) of entries dated within [first_ord, last_ord]."""
+        return bisect_left(self.dates, first_ord), bisect_right(self.dates, last_ord)
+
+    def month_span(self, year_month: str) -> Tuple[int, int]:
+        """Index range [lo, hi) of entries in a YYYYMM month."""
+        return self.span(*month_range(year_month))
+
+    def months(self) -> List[str]:
+        """Sorted YYYYMM keys of months with entries."""
+        return sorted({month_key(d) for d in dict.fromkeys(self.dates)})
+
+    def slice(self, lo: int, hi: int) -> 'Ledger':
+        """Copy of entries [lo, hi) with the matching opening balance."""
+        part = Ledger()
+        for col in COLUMNS:
+            setattr(part, col, getattr(self, col)[lo:hi])
+        part.opening = self.running[lo - 1] if lo else self.opening
+        return part
+
+    def evict(self, hi: int) -> None:
+        """Drops the first hi entries, keeping their net effect as the opening balance."""
+        if hi:
+            self.opening = self.running[hi - 1]
+            for col in COLUMNS:
+                del getattr(self, col)[:hi]
+
+    def materialise(self, idx: int) -> Transaction:
+        date = ordinal_to_date(self.dates[idx])
+        txn_type = TYPE_NAMES[self.types[idx]]
+        txn_id = f"{date}-{self.seqs[idx]:02d}" if txn_type != 'I' else ""
+        return Transaction.trusted(date, txn_id, txn_type, Money(self.amounts[idx]))
+
+def _fits(cents: int) -> bool:
+    return -MAX_CENTS - 1 <= cents <= MAX_CENTS
+
+class TransactionView(Sequence):
+    """Read-only sequence of Transactions over a ledger index range."""
+
+    def __init__(self, ledger: Ledger, lo: int = 0, hi: int = None):
+        self._ledger = ledger
+        self._lo = lo
+        self._hi = hi
+
+    def _bounds(self) -> Tuple[int, int]:
+        return self._lo, len(self._ledger) if self._hi is None else self._hi
+
+    def __len__(self) -> int:
+        lo, hi = self._bounds()
+        return hi - lo
+
+    def __getitem__(self, item):
+        lo, hi = self._bounds()
+        if isinstance(item, slice):
+            return [self._ledger.materialise(i) for i in range(lo, hi)[item]]
+        return self._ledger.materialise(range(lo, hi)[item])
+
+    def __iter__(self):
+        lo, hi = self._bounds()
+        for i in range(lo, hi):
+            yield self._ledger.materialise(i)
@@ -0,0 +1,290 @@
+from typing import Callable, Dict, List, Optional, Tuple
+from time import perf_counter
+import cProfile
+import json
+import pstats
+import threading
+
+# Work counted per call; InterestAccrual keeps attributes of the same names.
+WORK_KEYS = ('periods', 'rule_lookups', 'balance_lookups', 'recomputations')
+
+class Histogram:
+    """
+    Power-of-two bucketed histogram with count, sum and max.
+    Values are multiplied by scale and bucketed by bit length, so bucket i
+    holds scaled values in [2**(i-1), 2**i). Latencies use a scale of 1e6
+    (microsecond buckets); work counts use 1.
+    """
+    __slots__ = ('scale', 'count', 'total', 'max', 'buckets')
+
+    def __init__(self, scale: float = 1):
+        self.scale = scale
+        self.count = 0
+        self.total = 0
+        self.max = 0
+        self.buckets: List[int] = [0] * 64
+
+    def record(self, value) -> None:
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+        idx = int(value * self.scale).bit_length()
+        self.buckets[idx if idx < 64 else 63] += 1
+
+    def merge(self, other: 'Histogram') -> None:
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+
+    def percentile(self, p: float):
+        """Upper bound (in recorded units) of the bucket holding the p-th percentile."""
+        if not self.count:
+            return None
+        rank = p / 100 * self.count
+        seen = 0
+        for idx, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                return min((1 << idx) / self.scale, self.max)
+        return self.max
+
+    def snapshot(self) -> Dict:
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "max": self.max,
+            "mean": self.total / self.count if self.count else None,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+        }
+
+class _OpStats:
+    """Counters and histograms for one operation name."""
+    __slots__ = ('calls', 'errors', 'latency', 'work', 'work_hist')
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.latency = Histogram(1e6)
+        self.work: Dict[str, int] = {}
+        self.work_hist: Dict[str, Histogram] = {}
+
+    def merge(self, other: '_OpStats') -> None:
+        self.calls += other.calls
+        self.errors += other.errors
+        self.latency.merge(other.latency)
+        for key, n in list(other.work.items()):
+            self.work[key] = self.work.get(key, 0) + n
+            self.work_hist.setdefault(key, Histogram()).merge(other.work_hist[key])
+
+class _NullCall:
+    """Stand-in returned while metrics are disabled."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def count(self, key: str, n: int = 1) -> None:
+        pass
+
+    def track(self, accrual) -> None:
+        pass
+
+_NULL_CALL = _NullCall()
+
+class _Call:
+    """
+    One timed operation. Work is added with count(), or by track()ing an
+    InterestAccrual, whose counters are diffed when the call ends.
+    """
+    __slots__ = ('metrics', 'name', 'start', 'work', 'tracked', 'profiling')
+
+    def __init__(self, metrics: 'Metrics', name: str):
+        self.metrics = metrics
+        self.name = name
+        self.work: Optional[Dict[str, int]] = None
+        self.tracked: Optional[List[Tuple[object, Tuple[int, ...]]]] = None
+        self.profiling = metrics._profiler is not None and metrics._profile_enter()
+        self.start = perf_counter()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = perf_counter() - self.start
+        if self.profiling:
+            self.metrics._profile_exit()
+        if self.tracked:
+            for accrual, base in self.tracked:
+                for key, before in zip(WORK_KEYS, base):
+                    delta = getattr(accrual, key) - before
+                    if delta:
+                        self.count(key, delta)
+        self.metrics._record(self.name, elapsed, self.work, exc_type is not None)
+        return False
+
+    def count(self, key: str, n: int = 1) -> None:
+        if self.work is None:
+            self.work = {key: n}
+        else:
+            self.work[key] = self.work.get(key, 0) + n
+
+    def track(self, accrual) -> None:
+        if self.tracked is None:
+            self.tracked = []
+        self.tracked.append((accrual, tuple(getattr(accrual, key) for key in WORK_KEYS)))
+
+class Metrics:
+    """
+    Counters and histograms for bank operations.
+    Each call(name) counts the call (and an error if it raised), records its
+    latency and, for every work key it counted, adds to the operation's work
+    total and records the per-call value in that key's histogram.
+    Every thread records into its own tables, so the hot path takes no lock;
+    snapshot() merges them. Listeners, if any, receive (name, seconds, work)
+    after every call, and a cProfile profile of instrumented calls can be
+    collected on demand.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._tables: List[Tuple[Dict[str, _OpStats], Dict[str, int]]] = []
+        self._listeners: List[Callable[[str, float, Dict[str, int]], None]] = []
+        self._profiler: Optional[cProfile.Profile] = None
+        self._profile_thread: Optional[int] = None
+        self._profile_depth = 0
+
+    def _thread_tables(self) -> Tuple[Dict[str, _OpStats], Dict[str, int]]:
+        tables = getattr(self._local, 'tables', None)
+        if tables is None:
+            tables = self._local.tables = ({}, {})
+            with self._lock:
+                self._tables.append(tables)
+        return tables
+
+    def call(self, name: str):
+        """Context manager timing one operation."""
+        return _Call(self, name) if self.enabled else _NULL_CALL
+
+    def incr(self, name: str, n: int = 1) -> None:
+        """Adds to a free-standing counter."""
+        if self.enabled:
+            counters = self._thread_tables()[1]
+            counters[name] = counters.get(name, 0) + n
+
+    def _record(self, name: str, elapsed: float, work: Optional[Dict[str, int]], failed: bool) -> None:
+        ops = self._thread_tables()[0]
+        stats = ops.get(name)
+        if stats is None:
+            stats = ops[name] = _OpStats()
+        stats.calls += 1
+        if failed:
+            stats.errors += 1
+        stats.latency.record(elapsed)
+        if work:
+            for key, n in work.items():
+                stats.work[key] = stats.work.get(key, 0) + n
+                if key not in stats.work_hist:
+                    # Earlier calls did none of this work
+                    hist = stats.work_hist[key] = Histogram()
+                    hist.count = hist.buckets[0] = stats.calls - 1
+        # Every call lands in every work histogram, zero if it did none
+        for key, hist in stats.work_hist.items():
+            hist.record(work.get(key, 0) if work else 0)
+        if self._listeners:
+            for listener in self._listeners:
+                listener(name, elapsed, work or {})
+
+    def add_listener(self, listener: Callable[[str, float, Dict[str, int]], None]) -> None:
+        """Registers a tracing hook called with (name, seconds, work) after each call."""
+        with self._lock:
+            self._listeners = self._listeners + [listener]
+
+    def remove_listener(self, listener: Callable[[str, float, Dict[str, int]], None]) -> None:
+        with self._lock:
+            self._listeners = [l for l in self._listeners if l is not listener]
+
+    def start_profile(self) -> None:
+        """
+        Starts profiling instrumented calls made from the current thread.
+        Only time inside those calls is profiled.
+        """
+        self._profile_thread = threading.get_ident()
+        self._profile_depth = 0
+        self._profiler = cProfile.Profile()
+
+    def stop_profile(self) -> Optional[pstats.Stats]:
+        """Stops profiling and returns the collected stats (None if nothing ran)."""
+        profiler, self._profiler = self._profiler, None
+        self._profile_thread = None
+        if profiler is None:
+            return None
+        profiler.disable()
+        try:
+            return pstats.Stats(profiler)
+        except TypeError:
+            return None
+
+    def _profile_enter(self) -> bool:
+        if threading.get_ident() != self._profile_thread:
+            return False
+        self._profile_depth += 1
+        if self._profile_depth == 1:
+            self._profiler.enable()
+        return True
+
+    def _profile_exit(self) -> None:
+        self._profile_depth -= 1
+        if self._profile_depth == 0 and self._profiler is not None:
+            self._profiler.disable()
+
+    def snapshot(self) -> Dict:
+        """
+        Plain-dict copy of everything recorded: per-operation call and error
+        counts, latency summary (seconds), work totals and per-call work
+        summaries, plus the free-standing counters.
+        """
+        ops: Dict[str, _OpStats] = {}
+        counters: Dict[str, int] = {}
+        with self._lock:
+            tables = list(self._tables)
+        for thread_ops, thread_counters in tables:
+            for name, stats in list(thread_ops.items()):
+                ops.setdefault(name, _OpStats()).merge(stats)
+            for name, n in list(thread_counters.items()):
+                counters[name] = counters.get(name, 0) + n
+        return {
+            "operations": {
+                name: {
+                    "calls": stats.calls,
+                    "errors": stats.errors,
+                    "latency_seconds": stats.latency.snapshot(),
+                    "work": dict(sorted(stats.work.items())),
+                    "work_per_call": {k: h.snapshot() for k, h in sorted(stats.work_hist.items())},
+                }
+                for name, stats in sorted(ops.items())
+            },
+            "counters": dict(sorted(counters.items())),
+        }
+
+    def export_json(self, path: Optional[str] = None) -> str:
+        """Returns the snapshot as JSON, also writing it to path if given."""
+        text = json.dumps(self.snapshot(), indent=2)
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(text + "\n")
+        return text
+
+    def reset(self) -> None:
+        """Clears everything recorded so far."""
+        with self._lock:
+            for ops, counters in self._tables:
+                ops.clear()
+                counters.clear()
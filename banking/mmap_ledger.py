@@ -0,0 +1,116 @@
+from bisect import bisect_left
+from typing import List, Tuple
+from banking.dates import month_key
+from banking.ledger import Ledger, TYPE_CODES
+import mmap
+import struct
+
+MAGIC = b'AGLEDG01'
+_HEADER = struct.Struct('<8sII')  # magic, record count, month count
+
+def _pad(n: int) -> int:
+    return -n % 8
+
+def write_ledger_file(path: str, ledger: Ledger) -> None:
+    """
+    Writes a ledger as fixed-width column blocks sorted by (date, seq):
+    header, month index (YYYYMM keys and first record index per month),
+    then running balance, amount, date, seq and type columns. Every block
+    starts on an 8-byte boundary so it can be cast in place after mmap.
+    """
+    months: List[int] = []
+    starts: List[int] = []
+    for idx, date_ord in enumerate(ledger.dates):
+        key = int(month_key(date_ord))
+        if not months or months[-1] != key:
+            months.append(key)
+            starts.append(idx)
+    count = len(ledger)
+    blocks = [
+        struct.pack(f'<{len(months)}i', *months),
+        struct.pack(f'<{len(starts)}I', *starts),
+        ledger.running.tobytes(),
+        ledger.amounts.tobytes(),
+        ledger.dates.tobytes(),
+        ledger.seqs.tobytes(),
+        ledger.types.tobytes(),
+    ]
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, count, len(months)))
+        for block in blocks:
+            f.write(block)
+            f.write(b'\0' * _pad(len(block)))
+
+class MappedLedger:
+    """
+    Read-only ledger backed by an mmap'd ledger file.
+    Columns are memoryviews cast over the mapping, so bisects and slices read
+    only the pages they touch and nothing is decoded up front. Exposes the
+    read side of Ledger, so an Account can use it directly.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buf = buf = memoryview(self._map)
+        magic, count, n_months = _HEADER.unpack_from(buf)
+        if magic != MAGIC:
+            buf.release()
+            self._map.close()
+            raise ValueError(f"Not a ledger file: {path}")
+
+        offset = _HEADER.size + _pad(_HEADER.size)
+
+        def column(fmt: str, length: int) -> memoryview:
+            nonlocal offset
+            size = struct.calcsize(fmt) * length
+            view = buf[offset:offset + size].cast(fmt)
+            offset += size + _pad(size)
+            return view
+
+        self._months = column('i', n_months)
+        self._month_starts = column('I', n_months)
+        self.running = column('q', count)
+        self.amounts = column('q', count)
+        self.dates = column('i', count)
+        self.seqs = column('I', count)
+        self.types = column('B', count)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    @property
+    def opening(self) -> int:
+        """Balance before the first record, recovered from the first row."""
+        if not len(self):
+            return 0
+        cents = self.amounts[0]
+        return self.running[0] - (-cents if self.types[0] == TYPE_CODES['W'] else cents)
+
+    def insert(self, date_ord: int, seq: int, type_code: int, cents: int) -> int:
+        raise ValueError("Archived account ledger is read-only")
+
+    def remove(self, idx: int) -> None:
+        raise ValueError("Archived account ledger is read-only")
+
+    balance_on = Ledger.balance_on
+    span = Ledger.span
+    materialise = Ledger.materialise
+
+    def month_span(self, year_month: str) -> Tuple[int, int]:
+        """Index range of a month's records, read from the month index."""
+        pos = bisect_left(self._months, int(year_month))
+        if pos == len(self._months) or self._months[pos] != int(year_month):
+            return 0, 0
+        hi = self._month_starts[pos + 1] if pos + 1 < len(self._months) else len(self)
+        return self._month_starts[pos], hi
+
+    def months(self) -> List[str]:
+        return [str(m) for m in self._months]
+
+    def close(self) -> None:
+        for name in ('_months', '_month_starts', 'running', 'amounts', 'dates', 'seqs', 'types'):
+            getattr(self, name).release()
+        self._buf.release()
+        self._map.close()
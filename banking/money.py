@@ -0,0 +1,91 @@
+from decimal import Decimal, ROUND_HALF_UP
+from functools import total_ordering
+from typing import Union
+
+@total_ordering
+class Money:
+    """
+    Fixed-point amount held as integer cents.
+    Decimal is only used when parsing (from_decimal) and formatting
+    (to_decimal, format()); arithmetic and comparisons are integer ops.
+    Compares equal to the Decimal/int of the same value.
+    """
+    __slots__ = ('cents',)
+
+    def __init__(self, cents: int = 0):
+        self.cents = cents
+
+    @classmethod
+    def from_decimal(cls, value: Union[Decimal, int, str, 'Money']) -> 'Money':
+        """Parses a value, rounding HALF_UP to cents."""
+        if isinstance(value, Money):
+            return value
+        value = Decimal(value).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        return cls(int(value.scaleb(2)))
+
+    def to_decimal(self) -> Decimal:
+        return Decimal(self.cents).scaleb(-2)
+
+    def _other_cents(self, other):
+        if isinstance(other, Money):
+            return other.cents
+        if isinstance(other, int):
+            return other * 100
+        return NotImplemented
+
+    def __add__(self, other):
+        if isinstance(other, Money):
+            return Money(self.cents + other.cents)
+        if other == 0:  # allows sum()
+            return self
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, Money):
+            return Money(self.cents - other.cents)
+        return NotImplemented
+
+    def __neg__(self):
+        return Money(-self.cents)
+
+    def __abs__(self):
+        return Money(abs(self.cents))
+
+    def __bool__(self):
+        return self.cents != 0
+
+    def __eq__(self, other):
+        if isinstance(other, Decimal):
+            return self.to_decimal() == other
+        cents = self._other_cents(other)
+        return NotImplemented if cents is NotImplemented else self.cents == cents
+
+    def __lt__(self, other):
+        if isinstance(other, Decimal):
+            return self.to_decimal() < other
+        cents = self._other_cents(other)
+        return NotImplemented if cents is NotImplemented else self.cents < cents
+
+    def __hash__(self):
+        return hash(self.to_decimal())
+
+    def __format__(self, spec: str) -> str:
+        # Fast path for the common 'N.2f' column format, without a Decimal
+        if spec.endswith('.2f') and spec[:-3].isdigit() or spec == '.2f':
+            cents = abs(self.cents)
+            text = f"{'-' if self.cents < 0 else ''}{cents // 100}.{cents % 100:02d}"
+            return text.rjust(int(spec[:-3] or 0))
+        return format(self.to_decimal(), spec)
+
+    def __str__(self):
+        return str(self.to_decimal())
+
+    def __repr__(self):
+        return f"Money('{self.to_decimal()}')"
+
+def half_up_div(numerator: int, denominator: int) -> int:
+    """Integer division rounding half away from zero (denominator > 0)."""
+    q = (2 * abs(numerator) + denominator) // (2 * denominator)
+    return q if numerator >= 0 else -q
@@ -0,0 +1,168 @@
+from decimal import Decimal
+from typing import Dict, List, Optional
+from banking.account import Account
+from banking.bank import Bank
+from banking.checkpoint import MonthCheckpoint
+from banking.interest_rule import InterestRule
+from banking.journal import (Journal, TXN, INTEREST, INTEREST_REVERSAL, RULE, encode_txn, decode_txn,
+                             encode_rule, decode_rule, record_seq)
+from banking.ledger import COLUMNS, Ledger, TYPE_CODES, TYPE_NAMES, date_to_ordinal, ordinal_to_date
+from banking.money import Money
+from banking.transaction import Transaction
+import os
+import pickle
+
+SNAPSHOT_FILE = "snapshot.bin"
+JOURNAL_FILE = "journal.log"
+
+def write_snapshot(path: str, bank: Bank, last_seq: int) -> None:
+    """
+    Writes accounts and interest rules as one compact pickle of raw ledger
+    columns, atomically replacing any previous snapshot.
+    """
+    state = {
+        'last_seq': last_seq,
+        'rules': [(r.date, r.rule_id, str(r.rate)) for r in bank.rule_timeline],
+        'accounts': {
+            account_id: (account.txn_counter,
+                         [getattr(account.ledger, col).tobytes() for col in COLUMNS])
+            for account_id, account in bank.accounts.items()
+        },
+        'closed': {
+            account_id: (account.ledger.opening,
+                         [(c.year_month, c.closing_balance.cents, c.interest.cents, c.txn_count, c.checksum)
+                          for c in account.checkpoints],
+                         account.closed_through, account.evicted_through, account.archives)
+            for account_id, account in bank.accounts.items() if account.closed_through is not None
+        },
+        'evicted_day_totals': bank.aggregates.evicted_totals(),
+    }
+    tmp = path + ".tmp"
+    with open(tmp, 'wb') as f:
+        pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def load_snapshot(path: str, bank: Bank) -> int:
+    """Loads a snapshot into an empty bank. Returns the last journal seq it covers."""
+    if not os.path.exists(path):
+        return 0
+    with open(path, 'rb') as f:
+        state = pickle.load(f)
+    for date, rule_id, rate in state['rules']:
+        bank.rule_timeline.add(InterestRule(date=date, rule_id=rule_id, rate=Decimal(rate)))
+    for account_id, (txn_counter, columns) in state['accounts'].items():
+        ledger = Ledger()
+        for col, data in zip(COLUMNS, columns):
+            getattr(ledger, col).frombytes(data)
+        closed = state.get('closed', {}).get(account_id)
+        if closed is not None:
+            ledger.opening = closed[0]
+        account = bank.accounts[account_id] = Account.restore(account_id, ledger, txn_counter)
+        if closed is not None:
+            _, checkpoints, account.closed_through, account.evicted_through, account.archives = closed
+            account.checkpoints = [MonthCheckpoint(ym, Money(closing), Money(interest), count, checksum)
+                                   for ym, closing, interest, count, checksum in checkpoints]
+            account._checkpoint_months = [c.year_month for c in account.checkpoints]
+    bank.aggregates.restore_evicted(state.get('evicted_day_totals', {}))
+    return state['last_seq']
+
+class PersistentBank(Bank):
+    """
+    Bank whose transactions, interest rules and interest postings survive
+    restarts. Each mutation is appended to a journal (fsync'd in groups);
+    every snapshot_every records a snapshot is written and the journal reset.
+    Opening a directory loads the snapshot and replays the journal tail.
+    """
+
+    def __init__(self, directory: str, snapshot_every: int = 100000,
+                 group_size: int = 256, group_interval: float = 0.05):
+        super().__init__()
+        os.makedirs(directory, exist_ok=True)
+        self.snapshot_path = os.path.join(directory, SNAPSHOT_FILE)
+        self.journal = Journal(os.path.join(directory, JOURNAL_FILE), group_size, group_interval)
+        self.snapshot_every = snapshot_every
+        self._seq = load_snapshot(self.snapshot_path, self)
+        self._since_snapshot = 0
+        self._replaying = True
+        for kind, payload in self.journal.replay():
+            if record_seq(payload) > self._seq:
+                self._replay(kind, payload)
+        self._replaying = False
+        self.aggregates.rebuild(self.accounts.values())
+
+    def _replay(self, kind: int, payload: bytes) -> None:
+        if kind == RULE:
+            seq, date, rule_id, rate = decode_rule(payload)
+            super().add_interest_rule(date, rule_id, Decimal(rate))
+        else:
+            seq, date_ord, type_code, cents, account_id = decode_txn(payload)
+            account = self._find_or_create_account(account_id)
+            if kind == TXN:
+                account.add_transaction(ordinal_to_date(date_ord), TYPE_NAMES[type_code], Money(cents))
+            elif kind == INTEREST:
+                account.add_interest(ordinal_to_date(date_ord), Money(cents))
+            else:
+                account.remove_interest(ordinal_to_date(date_ord))
+        self._seq = seq
+        self._since_snapshot += 1
+
+    def _log(self, kind: int, payload: bytes) -> None:
+        self.journal.append(kind, payload)
+        self._since_snapshot += 1
+        if self._since_snapshot >= self.snapshot_every:
+            self.snapshot()
+
+    def _apply_transaction(self, account: Account, date: str, txn_type: str, amount) -> Transaction:
+        txn = super()._apply_transaction(account, date, txn_type, amount)
+        if not self._replaying:
+            self._seq += 1
+            self._log(TXN, encode_txn(self._seq, date_to_ordinal(txn.date), TYPE_CODES[txn.txn_type],
+                                      txn.amount.cents, account.account_id))
+        return txn
+
+    def _post_interest(self, account: Account, date: str, amount: Money) -> Transaction:
+        txn = super()._post_interest(account, date, amount)
+        if not self._replaying:
+            self._seq += 1
+            self._log(INTEREST, encode_txn(self._seq, date_to_ordinal(txn.date), TYPE_CODES['I'],
+                                           txn.amount.cents, account.account_id))
+        return txn
+
+    def _reverse_interest(self, account: Account, date: str) -> Optional[Money]:
+        amount = super()._reverse_interest(account, date)
+        if amount is not None and not self._replaying:
+            self._seq += 1
+            self._log(INTEREST_REVERSAL, encode_txn(self._seq, date_to_ordinal(date), TYPE_CODES['I'],
+                                                    amount.cents, account.account_id))
+        return amount
+
+    def add_interest_rule(self, date: str, rule_id: str, rate: Decimal):
+        success, msg = super().add_interest_rule(date, rule_id, rate)
+        if success and not self._replaying:
+            self._seq += 1
+            self._log(RULE, encode_rule(self._seq, date, rule_id, str(rate)))
+        return success, msg
+
+    def snapshot(self) -> None:
+        """Writes a snapshot covering every record so far, then empties the journal."""
+        self.journal.sync()
+        write_snapshot(self.snapshot_path, self, self._seq)
+        self.journal.reset()
+        self._since_snapshot = 0
+
+    def close_months(self, through: str, evict: bool = False,
+                     archive_dir: Optional[str] = None) -> Dict[str, List[MonthCheckpoint]]:
+        """Closes months as Bank.close_months, then snapshots so the closure is durable."""
+        closed = super().close_months(through, evict, archive_dir)
+        if closed:
+            self.snapshot()
+        return closed
+
+    def sync(self) -> None:
+        """Forces pending journal records to disk."""
+        self.journal.sync()
+
+    def close(self) -> None:
+        self.journal.close()
@@ -0,0 +1,66 @@
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Tuple
+from banking.dates import date_to_ordinal
+from banking.interest_rule import InterestRule
+
+class InterestRuleTimeline:
+    """
+    Interest rules kept sorted by effective date.
+    A rule added on a date that already has one replaces it.
+    Lookups and range queries are bisects over the date index. A parallel
+    index of day ordinals and integer rate ratios serves interest maths
+    without touching date strings.
+    """
+
+    def __init__(self):
+        self._dates: List[str] = []
+        self._rules: List[InterestRule] = []
+        self._ords: List[int] = []
+        self._ratios: List[Tuple[int, int]] = []
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def __iter__(self):
+        return iter(self._rules)
+
+    def add(self, rule: InterestRule) -> None:
+        idx = bisect_left(self._dates, rule.date)
+        ratio = rule.rate.as_integer_ratio()
+        if idx < len(self._dates) and self._dates[idx] == rule.date:
+            self._rules[idx] = rule
+            self._ratios[idx] = ratio
+        else:
+            self._dates.insert(idx, rule.date)
+            self._rules.insert(idx, rule)
+            self._ords.insert(idx, date_to_ordinal(rule.date))
+            self._ratios.insert(idx, ratio)
+
+    def rules(self) -> List[InterestRule]:
+        return self._rules.copy()
+
+    def rule_for_date(self, date: str) -> Optional[InterestRule]:
+        """Returns the rule in effect on the given date, if any."""
+        idx = bisect_right(self._dates, date)
+        return self._rules[idx - 1] if idx else None
+
+    def rules_between(self, start: str, end: str) -> List[InterestRule]:
+        """
+        Returns the rules effective in [start, end]: the rule in effect on
+        start (if any) followed by every rule that takes effect after start
+        and on or before end.
+        """
+        lo = bisect_right(self._dates, start)
+        hi = bisect_right(self._dates, end)
+        return self._rules[max(lo - 1, 0):hi]
+
+    def rates_between(self, first: int, last: int) -> List[Tuple[int, Tuple[int, int]]]:
+        """
+        Same window as rules_between, on day ordinals: (ordinal, rate as an
+        integer ratio) for the rule in effect on first and every later rule
+        up to last.
+        """
+        lo = bisect_right(self._ords, first)
+        hi = bisect_right(self._ords, last)
+        lo = max(lo - 1, 0)
+        return list(zip(self._ords[lo:hi], self._ratios[lo:hi]))
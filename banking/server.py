@@ -0,0 +1,157 @@
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from decimal import Decimal, InvalidOperation
+from typing import Dict, List, Optional
+from banking.concurrent_bank import ConcurrentBank
+from banking.statement import iter_statement
+import asyncio
+import json
+
+class BankServer:
+    """
+    Asyncio line-protocol front-end for a ConcurrentBank.
+    Each request is one line using the CLI's formats:
+        T <Date> <Account> <Type> <Amount>
+        I <Date> <RuleId> <Rate>
+        P <Account> <YearMonth>
+    and each reply is one JSON line. Clients may pipeline requests: up to
+    max_inflight per connection run concurrently and replies are written in
+    request order. Requests for the same account are serialised, reading
+    stops while the in-flight window is full (backpressure), and every bank
+    call runs in an executor, so a call waiting on a bank lock never stalls
+    the event loop. Rule changes keep their place in request order: a
+    statement waits for rule changes received before it, and a rule change
+    waits for earlier statements and rule changes. Per-account locks are
+    dropped once no request holds or waits on them.
+    """
+
+    def __init__(self, bank: Optional[ConcurrentBank] = None, max_inflight: int = 32,
+                 executor: Optional[Executor] = None):
+        self.bank = bank or ConcurrentBank()
+        self.max_inflight = max_inflight
+        self.executor = executor or ThreadPoolExecutor(max_workers=4)
+        # account_id -> [lock, requests holding or waiting on it]
+        self._account_locks: Dict[str, List] = {}
+        # Last rule change, and statements received since it
+        self._last_rule: Optional[asyncio.Future] = None
+        self._since_rule: List[asyncio.Future] = []
+
+    @asynccontextmanager
+    async def _account_lock(self, account_id: str):
+        entry = self._account_locks.get(account_id)
+        if entry is None:
+            entry = self._account_locks[account_id] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del self._account_locks[account_id]
+
+    @asynccontextmanager
+    async def _rules_read(self):
+        # Both lists are updated before the first await, so in request order
+        barrier = self._last_rule
+        done = asyncio.get_running_loop().create_future()
+        self._since_rule = [f for f in self._since_rule if not f.done()] + [done]
+        try:
+            if barrier is not None:
+                await barrier
+            yield
+        finally:
+            done.set_result(None)
+
+    @asynccontextmanager
+    async def _rules_write(self):
+        earlier = self._since_rule + ([self._last_rule] if self._last_rule is not None else [])
+        done = self._last_rule = asyncio.get_running_loop().create_future()
+        self._since_rule = []
+        try:
+            await asyncio.gather(*earlier)
+            yield
+        finally:
+            done.set_result(None)
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    async def dispatch(self, line: str) -> dict:
+        parts = line.split()
+        if not parts:
+            return {"ok": False, "error": "Empty request"}
+        command, args = parts[0].upper(), parts[1:]
+        try:
+            if command == 'T' and len(args) == 4:
+                date, account_id, txn_type, amount = args
+                amount = Decimal(amount)
+                async with self._account_lock(account_id):
+                    txn = await self._run(self.bank.add_transaction, date, account_id, txn_type, amount)
+                return {"ok": True, "txn_id": txn.txn_id}
+            if command == 'I' and len(args) == 3:
+                date, rule_id, rate = args
+                rate = Decimal(rate)
+                async with self._rules_write():
+                    success, msg = await self._run(self.bank.add_interest_rule, date, rule_id, rate)
+                return {"ok": success, "message": msg} if success else {"ok": False, "error": msg}
+            if command == 'P' and len(args) == 2:
+                account_id, year_month = args
+                async with self._rules_read(), self._account_lock(account_id):
+                    rows = await self._run(self._statement, account_id, year_month)
+                return {"ok": True, "account": account_id, "rows": rows}
+        except InvalidOperation:
+            return {"ok": False, "error": "Invalid amount format"}
+        except ValueError as e:
+            return {"ok": False, "error": str(e)}
+        except Exception as e:
+            # Anything else still gets a reply, so later pipelined requests are answered
+            return {"ok": False, "error": str(e) or type(e).__name__}
+        return {"ok": False, "error": "Invalid input format"}
+
+    def _statement(self, account_id: str, year_month: str) -> list:
+        """Posts the month's interest and renders its rows; runs in the executor."""
+        self.bank.calculate_monthly_interest(account_id, year_month)
+        return self._statement_rows(account_id, year_month)
+
+    def _statement_rows(self, account_id: str, year_month: str) -> list:
+        rows = self.bank.read_account(account_id, lambda account: list(iter_statement(account, year_month)))
+        return [[r.date, r.txn_id, r.txn_type, f"{r.amount:.2f}", f"{r.balance:.2f}"] for r in rows]
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        pending: "asyncio.Queue[Optional[asyncio.Task]]" = asyncio.Queue()
+        window = asyncio.Semaphore(self.max_inflight)
+
+        async def write_replies():
+            while True:
+                task = await pending.get()
+                if task is None:
+                    break
+                reply = await task
+                window.release()
+                writer.write(json.dumps(reply).encode() + b"\n")
+                await writer.drain()
+
+        replier = asyncio.create_task(write_replies())
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                await window.acquire()
+                await pending.put(asyncio.create_task(self.dispatch(line.decode().strip())))
+        finally:
+            await pending.put(None)
+            await replier
+            writer.close()
+            await writer.wait_closed()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.AbstractServer:
+        return await asyncio.start_server(self.handle_client, host, port)
+
+    def serve_forever(self, host: str = "127.0.0.1", port: int = 8642) -> None:
+        async def main():
+            server = await self.start(host, port)
+            async with server:
+                await server.serve_forever()
+        asyncio.run(main())
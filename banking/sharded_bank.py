@@ -0,0 +1,184 @@
+from decimal import Decimal
+from heapq import nlargest
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from banking.bank import Bank
+from banking.checkpoint import MonthCheckpoint
+from banking.ingest import IngestReport
+from banking.interest_rule import InterestRule
+from banking.money import Money
+from banking.rule_timeline import InterestRuleTimeline
+from banking.transaction import Transaction
+import multiprocessing
+import os
+import zlib
+
+def _serve(conn) -> None:
+    """
+    Shard worker: runs a Bank and answers batches of (method, args) calls
+    with a list of (ok, result or exception), until it receives None.
+    """
+    bank = Bank()
+    while True:
+        batch = conn.recv()
+        if batch is None:
+            break
+        replies = []
+        for method, args in batch:
+            try:
+                replies.append((True, getattr(bank, method)(*args)))
+            except Exception as e:
+                replies.append((False, e))
+        conn.send(replies)
+    conn.close()
+
+def _unwrap(reply: Tuple[bool, object]):
+    ok, value = reply
+    if not ok:
+        raise value
+    return value
+
+class ShardedBank:
+    """
+    Bank facade over `shards` worker processes, each running its own Bank
+    with a disjoint slice of the accounts (crc32 of the account id modulo
+    shards, so routing is stable across runs). Account calls go to the
+    owning shard over a pipe. Bulk loads (add_transactions) are split per
+    shard and sent in batches of batch_size records, one message per shard
+    at a time, so every shard posts in parallel. Interest rules are
+    replicated to every shard and kept locally for reads. Bank-wide calls
+    (run_month_end, close_months, aggregates) fan out and merge.
+    Not thread-safe: use one ShardedBank per thread, and close() it when done.
+    """
+
+    def __init__(self, shards: Optional[int] = None, batch_size: int = 1000):
+        self.shards = shards or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.rule_timeline = InterestRuleTimeline()
+        self._conns = []
+        self._procs = []
+        for _ in range(self.shards):
+            conn, child = multiprocessing.Pipe()
+            proc = multiprocessing.Process(target=_serve, args=(child,), daemon=True)
+            proc.start()
+            child.close()
+            self._conns.append(conn)
+            self._procs.append(proc)
+
+    def shard_for(self, account_id: str) -> int:
+        return zlib.crc32(account_id.encode()) % self.shards
+
+    def _call(self, account_id: str, method: str, *args):
+        conn = self._conns[self.shard_for(account_id)]
+        conn.send([(method, args)])
+        return _unwrap(conn.recv()[0])
+
+    def _broadcast(self, method: str, *args) -> List:
+        for conn in self._conns:
+            conn.send([(method, args)])
+        # Read every reply before raising, so no shard is left out of step
+        replies = [conn.recv()[0] for conn in self._conns]
+        return [_unwrap(reply) for reply in replies]
+
+    def add_transaction(self, date: str, account_id: str, txn_type: str, amount: Decimal) -> Transaction:
+        return self._call(account_id, "add_transaction", date, account_id, txn_type, amount)
+
+    def add_transactions(self, records: Iterable[Sequence]) -> IngestReport:
+        """
+        Bulk-loads (date, account_id, type, amount) records across the
+        shards, with the same per-record results as Bank.add_transactions.
+        """
+        report = IngestReport()
+        groups: List[List[Tuple[int, Sequence]]] = [[] for _ in range(self.shards)]
+        for idx, record in enumerate(records):
+            report.txn_ids.append(None)
+            if len(record) != 4:
+                report.errors[idx] = "Invalid input format"
+                continue
+            groups[self.shard_for(record[1])].append((idx, record))
+
+        for start in range(0, max(map(len, groups)), self.batch_size):
+            sent = []
+            for shard, group in enumerate(groups):
+                chunk = group[start:start + self.batch_size]
+                if chunk:
+                    self._conns[shard].send([("add_transactions", ([record for _, record in chunk],))])
+                    sent.append((shard, chunk))
+            replies = [self._conns[shard].recv()[0] for shard, _ in sent]
+            for (shard, chunk), reply in zip(sent, replies):
+                part = _unwrap(reply)
+                for (idx, _), txn_id in zip(chunk, part.txn_ids):
+                    report.txn_ids[idx] = txn_id
+                for pos, error in part.errors.items():
+                    report.errors[chunk[pos][0]] = error
+        report.errors = dict(sorted(report.errors.items()))
+        return report
+
+    def add_interest_rule(self, date: str, rule_id: str, rate: Decimal) -> Tuple[bool, str]:
+        """Adds a rule on every shard; the shards validate it identically."""
+        success, msg = self._broadcast("add_interest_rule", date, rule_id, rate)[0]
+        if success:
+            self.rule_timeline.add(InterestRule(date=date, rule_id=rule_id, rate=rate))
+        return success, msg
+
+    def get_interest_rules(self) -> List[InterestRule]:
+        return self.rule_timeline.rules()
+
+    def get_interest_rule_for_date(self, date: str) -> Optional[InterestRule]:
+        return self.rule_timeline.rule_for_date(date)
+
+    def calculate_monthly_interest(self, account_id: str, year_month: str) -> Tuple[List[Transaction], Money]:
+        return self._call(account_id, "calculate_monthly_interest", account_id, year_month)
+
+    def calculate_interest_range(self, account_id: str, from_ym: str,
+                                 to_ym: str) -> Dict[str, Tuple[List[Transaction], Money]]:
+        return self._call(account_id, "calculate_interest_range", account_id, from_ym, to_ym)
+
+    def get_account_statement(self, account_id: str, year_month: str) -> List[Transaction]:
+        return self._call(account_id, "get_account_statement", account_id, year_month)
+
+    def get_account_statement_range(self, account_id: str, from_ym: str, to_ym: str) -> List[Transaction]:
+        return self._call(account_id, "get_account_statement_range", account_id, from_ym, to_ym)
+
+    def run_month_end(self, year_month: str, engine: str = "accrual") -> Dict[str, Money]:
+        """Runs month-end on every shard in parallel; returns interest per account."""
+        posted: Dict[str, Money] = {}
+        for part in self._broadcast("run_month_end", year_month, 1, engine):
+            posted.update(part)
+        return dict(sorted(posted.items()))
+
+    def close_months(self, through: str, evict: bool = False,
+                     archive_dir: Optional[str] = None) -> Dict[str, List[MonthCheckpoint]]:
+        closed: Dict[str, List[MonthCheckpoint]] = {}
+        for part in self._broadcast("close_months", through, evict, archive_dir):
+            closed.update(part)
+        return dict(sorted(closed.items()))
+
+    def get_day_totals(self, date: str) -> Dict[str, Money]:
+        return _sum_totals(self._broadcast("get_day_totals", date))
+
+    def get_totals_between(self, start: str, end: str) -> Dict[str, Money]:
+        return _sum_totals(self._broadcast("get_totals_between", start, end))
+
+    def get_total_balance(self) -> Money:
+        return Money(sum(total.cents for total in self._broadcast("get_total_balance")))
+
+    def get_top_balances(self, n: int) -> List[Tuple[str, Money]]:
+        parts = self._broadcast("get_top_balances", n)
+        rows = [row for part in parts for row in part]
+        return nlargest(n, rows, key=lambda row: (row[1].cents, row[0])) if n > 0 else []
+
+    def get_accounts_below(self, threshold) -> List[Tuple[str, Money]]:
+        parts = self._broadcast("get_accounts_below", threshold)
+        return sorted((row for part in parts for row in part), key=lambda row: (row[1].cents, row[0]))
+
+    def close(self) -> None:
+        """Stops the shard processes."""
+        for conn in self._conns:
+            conn.send(None)
+            conn.close()
+        for proc in self._procs:
+            proc.join()
+        self._conns, self._procs = [], []
+
+def _sum_totals(parts: List[Dict[str, Money]]) -> Dict[str, Money]:
+    return {key: Money(sum(part[key].cents for part in parts)) for key in parts[0]}
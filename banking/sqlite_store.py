@@ -0,0 +1,285 @@
+from contextlib import contextmanager
+from decimal import Decimal
+from queue import Empty, Queue
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from banking.account import Account
+from banking.bank import Bank
+from banking.checkpoint import MonthCheckpoint
+from banking.interest import month_bounds
+from banking.interest_rule import InterestRule
+from banking.ledger import Ledger, TYPE_CODES, date_to_ordinal, ordinal_to_date
+from banking.money import Money
+from banking.transaction import Transaction
+import sqlite3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS accounts (
+    account_id TEXT PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS transactions (
+    account_id TEXT NOT NULL,
+    date TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    txn_type TEXT NOT NULL,
+    amount_cents INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_transactions_account_date
+    ON transactions (account_id, date, seq);
+CREATE TABLE IF NOT EXISTS interest_rules (
+    date TEXT PRIMARY KEY,
+    rule_id TEXT NOT NULL,
+    rate TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS account_closes (
+    account_id TEXT PRIMARY KEY,
+    closed_through TEXT NOT NULL,
+    evicted_through TEXT
+);
+CREATE TABLE IF NOT EXISTS month_checkpoints (
+    account_id TEXT NOT NULL,
+    year_month TEXT NOT NULL,
+    closing_cents INTEGER NOT NULL,
+    interest_cents INTEGER NOT NULL,
+    txn_count INTEGER NOT NULL,
+    checksum INTEGER NOT NULL,
+    PRIMARY KEY (account_id, year_month)
+);
+CREATE TABLE IF NOT EXISTS archives (
+    account_id TEXT NOT NULL,
+    first_ym TEXT NOT NULL,
+    last_ym TEXT NOT NULL,
+    path TEXT NOT NULL,
+    PRIMARY KEY (account_id, path)
+);
+"""
+
+TxnRow = Tuple[str, str, int, str, int]  # account_id, date, seq, txn_type, amount_cents
+
+class SqliteStore:
+    """
+    SQLite storage for accounts, transactions, interest rules and month
+    close state (checkpoints, closed/evicted dates, archive files).
+    The database runs in WAL mode so any number of reader processes can
+    query while one writer appends. Writes go through a single connection
+    using executemany batches; reads borrow a connection from a small pool.
+    """
+
+    def __init__(self, path: str, pool_size: int = 4):
+        self.path = path
+        self._writer = self._connect()
+        self._writer.execute("PRAGMA journal_mode=WAL")
+        self._writer.executescript(SCHEMA)
+        self._writer.commit()
+        self._pool: "Queue[sqlite3.Connection]" = Queue()
+        self._pool_size = pool_size
+        self._opened = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrows a pooled read connection, opening one if the pool has room."""
+        try:
+            conn = self._pool.get_nowait()
+        except Empty:
+            if self._opened < self._pool_size:
+                self._opened += 1
+                conn = self._connect()
+            else:
+                conn = self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    def insert_transactions(self, rows: Iterable[TxnRow]) -> None:
+        rows = list(rows)
+        with self._writer:
+            self._writer.executemany("INSERT OR IGNORE INTO accounts (account_id) VALUES (?)",
+                                     {(row[0],) for row in rows})
+            self._writer.executemany(
+                "INSERT INTO transactions (account_id, date, seq, txn_type, amount_cents) VALUES (?, ?, ?, ?, ?)",
+                rows)
+
+    def delete_interest(self, account_id: str, date: str) -> None:
+        with self._writer:
+            self._writer.execute("DELETE FROM transactions WHERE account_id = ? AND date = ? AND txn_type = 'I'",
+                                 (account_id, date))
+
+    def upsert_rule(self, rule: InterestRule) -> None:
+        with self._writer:
+            self._writer.execute("INSERT OR REPLACE INTO interest_rules (date, rule_id, rate) VALUES (?, ?, ?)",
+                                 (rule.date, rule.rule_id, str(rule.rate)))
+
+    def save_close_state(self, accounts: Iterable[Account]) -> None:
+        """Records the close state of every closed account; checkpoints and archives are append-only."""
+        closed = [account for account in accounts if account.closed_through is not None]
+        with self._writer:
+            self._writer.executemany(
+                "INSERT OR REPLACE INTO account_closes (account_id, closed_through, evicted_through) VALUES (?, ?, ?)",
+                [(a.account_id, ordinal_to_date(a.closed_through),
+                  ordinal_to_date(a.evicted_through) if a.evicted_through is not None else None) for a in closed])
+            self._writer.executemany(
+                "INSERT OR IGNORE INTO month_checkpoints (account_id, year_month, closing_cents, interest_cents, "
+                "txn_count, checksum) VALUES (?, ?, ?, ?, ?, ?)",
+                [(a.account_id, c.year_month, c.closing_balance.cents, c.interest.cents, c.txn_count, c.checksum)
+                 for a in closed for c in a.checkpoints])
+            self._writer.executemany(
+                "INSERT OR IGNORE INTO archives (account_id, first_ym, last_ym, path) VALUES (?, ?, ?, ?)",
+                [(a.account_id, first, last, path) for a in closed for first, last, path in a.archives])
+
+    def evicted_day_totals(self) -> Dict[int, List[int]]:
+        """Per-day [D, W, I] totals of the rows evicted from memory by month close."""
+        totals: Dict[int, List[int]] = {}
+        with self.reader() as conn:
+            rows = conn.execute(
+                "SELECT t.date, t.txn_type, SUM(t.amount_cents) FROM transactions t "
+                "JOIN account_closes c ON c.account_id = t.account_id "
+                "WHERE t.date <= c.evicted_through GROUP BY t.date, t.txn_type")
+            for date, txn_type, cents in rows:
+                totals.setdefault(date_to_ordinal(date), [0, 0, 0])[TYPE_CODES[txn_type]] += cents
+        return totals
+
+    def balance_on(self, account_id: str, date: str) -> Money:
+        with self.reader() as conn:
+            (cents,) = conn.execute(
+                "SELECT COALESCE(SUM(CASE txn_type WHEN 'W' THEN -amount_cents ELSE amount_cents END), 0) "
+                "FROM transactions WHERE account_id = ? AND date <= ?", (account_id, date)).fetchone()
+        return Money(cents)
+
+    def statement(self, account_id: str, year_month: str) -> List[Transaction]:
+        start, end = month_bounds(year_month)
+        with self.reader() as conn:
+            rows = conn.execute(
+                "SELECT date, seq, txn_type, amount_cents FROM transactions "
+                "WHERE account_id = ? AND date BETWEEN ? AND ? ORDER BY date, seq",
+                (account_id, start, end)).fetchall()
+        return [Transaction.trusted(date, f"{date}-{seq:02d}" if txn_type != 'I' else "", txn_type, Money(cents))
+                for date, seq, txn_type, cents in rows]
+
+    def rule_for_date(self, date: str) -> Optional[InterestRule]:
+        with self.reader() as conn:
+            row = conn.execute("SELECT date, rule_id, rate FROM interest_rules WHERE date <= ? "
+                               "ORDER BY date DESC LIMIT 1", (date,)).fetchone()
+        return InterestRule(row[0], row[1], Decimal(row[2])) if row else None
+
+    def rules(self) -> List[InterestRule]:
+        with self.reader() as conn:
+            rows = conn.execute("SELECT date, rule_id, rate FROM interest_rules ORDER BY date").fetchall()
+        return [InterestRule(date, rule_id, Decimal(rate)) for date, rule_id, rate in rows]
+
+    def account_ids(self) -> List[str]:
+        with self.reader() as conn:
+            return [row[0] for row in conn.execute("SELECT account_id FROM accounts ORDER BY account_id")]
+
+    def load_account(self, account_id: str) -> Account:
+        """
+        Rebuilds an in-memory Account from its stored rows (index order) and
+        restores its month close state, evicting again what had been evicted.
+        """
+        ledger = Ledger()
+        txn_counter: Dict[str, int] = {}
+        with self.reader() as conn:
+            rows = conn.execute("SELECT date, seq, txn_type, amount_cents FROM transactions "
+                                "WHERE account_id = ? ORDER BY date, seq", (account_id,))
+            for date, seq, txn_type, cents in rows:
+                ledger.insert(date_to_ordinal(date), seq, TYPE_CODES[txn_type], cents)
+                if seq:
+                    txn_counter[date] = max(seq, txn_counter.get(date, 0))
+            account = Account.restore(account_id, ledger, txn_counter)
+            row = conn.execute("SELECT closed_through, evicted_through FROM account_closes WHERE account_id = ?",
+                               (account_id,)).fetchone()
+            if row is None:
+                return account
+            account.checkpoints = [
+                MonthCheckpoint(ym, Money(closing), Money(interest), count, checksum)
+                for ym, closing, interest, count, checksum in conn.execute(
+                    "SELECT year_month, closing_cents, interest_cents, txn_count, checksum FROM month_checkpoints "
+                    "WHERE account_id = ? ORDER BY year_month", (account_id,))]
+            account.archives = conn.execute("SELECT first_ym, last_ym, path FROM archives "
+                                            "WHERE account_id = ? ORDER BY first_ym", (account_id,)).fetchall()
+        account._checkpoint_months = [c.year_month for c in account.checkpoints]
+        account.closed_through = date_to_ordinal(row[0])
+        if row[1] is not None:
+            account.evict_through(date_to_ordinal(row[1]))
+        return account
+
+    def close(self) -> None:
+        self._writer.close()
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except Empty:
+                break
+
+class SqliteBank(Bank):
+    """
+    Bank that writes through to a SqliteStore.
+    Postings are buffered and flushed with executemany every batch_size rows
+    (and on flush()/close()); rules are written immediately. Opening an
+    existing database reloads accounts and rules into memory, so validation
+    and interest maths run unchanged. Other processes can open their own
+    SqliteStore on the same file to serve statements and balances.
+    """
+
+    def __init__(self, path: str, batch_size: int = 1000):
+        super().__init__()
+        self.store = SqliteStore(path)
+        self.batch_size = batch_size
+        self._pending: List[TxnRow] = []
+        for rule in self.store.rules():
+            self.rule_timeline.add(rule)
+        for account_id in self.store.account_ids():
+            self.accounts[account_id] = self.store.load_account(account_id)
+        self.aggregates.restore_evicted(self.store.evicted_day_totals())
+        self.aggregates.rebuild(self.accounts.values())
+
+    def _buffer(self, account: Account, txn: Transaction) -> None:
+        seq = int(txn.txn_id[9:]) if txn.txn_id else 0
+        self._pending.append((account.account_id, txn.date, seq, txn.txn_type, txn.amount.cents))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def _apply_transaction(self, account: Account, date: str, txn_type: str, amount) -> Transaction:
+        txn = super()._apply_transaction(account, date, txn_type, amount)
+        self._buffer(account, txn)
+        return txn
+
+    def _post_interest(self, account: Account, date: str, amount: Money) -> Transaction:
+        txn = super()._post_interest(account, date, amount)
+        self._buffer(account, txn)
+        return txn
+
+    def _reverse_interest(self, account: Account, date: str) -> Optional[Money]:
+        amount = super()._reverse_interest(account, date)
+        if amount is not None:
+            self.flush()
+            self.store.delete_interest(account.account_id, date)
+        return amount
+
+    def add_interest_rule(self, date: str, rule_id: str, rate: Decimal):
+        success, msg = super().add_interest_rule(date, rule_id, rate)
+        if success:
+            self.store.upsert_rule(self.rule_timeline.rule_for_date(date))
+        return success, msg
+
+    def close_months(self, through: str, evict: bool = False,
+                     archive_dir: Optional[str] = None) -> Dict[str, List[MonthCheckpoint]]:
+        """Closes months as Bank does and records the close state in the store."""
+        closed = super().close_months(through, evict, archive_dir)
+        self.flush()
+        self.store.save_close_state(self.accounts.values())
+        return closed
+
+    def flush(self) -> None:
+        """Writes buffered postings in one executemany batch."""
+        if self._pending:
+            self.store.insert_transactions(self._pending)
+            self._pending = []
+
+    def close(self) -> None:
+        self.flush()
+        self.store.close()
@@ -0,0 +1,128 @@
+from typing import Iterable, Iterator, NamedTuple, Optional, TextIO, Tuple
+from banking.account import Account
+from banking.ledger import TYPE_NAMES, ordinal_to_date
+from banking.money import Money
+import csv
+import io
+import json
+import sys
+
+class StatementRow(NamedTuple):
+    account_id: str
+    date: str
+    txn_id: str
+    txn_type: str
+    amount: Money
+    balance: Money
+
+def iter_statement(account: Account, year_month: Optional[str] = None) -> Iterator[StatementRow]:
+    """
+    Lazily yields statement rows for one month (or the whole history) with
+    the running balance after each entry, read straight from the ledger
+    columns; no transaction list is built and nothing is re-sorted.
+    """
+    ledger = account.statement_ledger(year_month) if year_month else account.ledger
+    lo, hi = ledger.month_span(year_month) if year_month else (0, len(ledger))
+    return _rows(account, ledger, lo, hi)
+
+def _rows(account: Account, ledger, lo: int, hi: int) -> Iterator[StatementRow]:
+    for i in range(lo, hi):
+        date = ordinal_to_date(ledger.dates[i])
+        txn_type = TYPE_NAMES[ledger.types[i]]
+        txn_id = f"{date}-{ledger.seqs[i]:02d}" if txn_type != 'I' else ""
+        yield StatementRow(account.account_id, date, txn_id, txn_type,
+                           Money(ledger.amounts[i]), Money(ledger.running[i]))
+
+class StatementSink:
+    """
+    Base for statement writers. Rendered text is collected in a buffer and
+    written to `out` in chunks of buffer_rows rows, not once per row.
+    """
+
+    def __init__(self, out: Optional[TextIO] = None, buffer_rows: int = 1024):
+        self.out = out if out is not None else sys.stdout
+        self.buffer_rows = buffer_rows
+        self._chunks = []
+
+    def _emit(self, text: str) -> None:
+        self._chunks.append(text)
+        if len(self._chunks) >= self.buffer_rows:
+            self.flush()
+
+    def begin(self, account_id: str) -> None:
+        pass
+
+    def write_row(self, row: StatementRow) -> None:
+        raise NotImplementedError
+
+    def write(self, account_id: str, rows: Iterable[StatementRow]) -> None:
+        self.begin(account_id)
+        for row in rows:
+            self.write_row(row)
+
+    def flush(self) -> None:
+        if self._chunks:
+            self.out.write("".join(self._chunks))
+            self._chunks = []
+
+    def close(self) -> None:
+        self.flush()
+        self.out.flush()
+
+class TableSink(StatementSink):
+    """The CLI's '| Date | Txn Id | Type | Amount | Balance |' table."""
+
+    def begin(self, account_id: str) -> None:
+        self._emit(f"Account: {account_id}\n| Date     | Txn Id      | Type | Amount | Balance |\n")
+
+    def write_row(self, row: StatementRow) -> None:
+        self._emit(f"| {row.date} | {row.txn_id:<11} | {row.txn_type}    | {row.amount:7.2f} | {row.balance:8.2f} |\n")
+
+class CsvSink(StatementSink):
+    """account_id,date,txn_id,type,amount,balance with a single header line."""
+
+    def __init__(self, out: Optional[TextIO] = None, buffer_rows: int = 1024):
+        super().__init__(out, buffer_rows)
+        self._line = io.StringIO()
+        self._writer = csv.writer(self._line, lineterminator="\n")
+        self._emit_line(StatementRow._fields)
+
+    def _emit_line(self, values) -> None:
+        self._writer.writerow(values)
+        self._emit(self._line.getvalue())
+        self._line.seek(0)
+        self._line.truncate()
+
+    def write_row(self, row: StatementRow) -> None:
+        self._emit_line((row.account_id, row.date, row.txn_id, row.txn_type,
+                         f"{row.amount:.2f}", f"{row.balance:.2f}"))
+
+class JsonLinesSink(StatementSink):
+    """One JSON object per row; amounts are strings to keep them exact."""
+
+    def write_row(self, row: StatementRow) -> None:
+        self._emit(json.dumps({
+            "account_id": row.account_id, "date": row.date, "txn_id": row.txn_id,
+            "type": row.txn_type, "amount": f"{row.amount:.2f}", "balance": f"{row.balance:.2f}",
+        }) + "\n")
+
+SINKS = {"table": TableSink, "csv": CsvSink, "jsonl": JsonLinesSink}
+
+def export_statements(bank, selections: Iterable[Tuple[str, Optional[str]]], sink: StatementSink) -> int:
+    """
+    Streams statements for many (account_id, year_month) pairs into one sink
+    in a single pass; year_month None exports the full history. Unknown
+    accounts are skipped. Returns the number of rows written.
+    """
+    count = 0
+    for account_id, year_month in selections:
+        account = bank.accounts.get(account_id)
+        if account is None:
+            continue
+        rows = iter_statement(account, year_month)
+        sink.begin(account_id)
+        for row in rows:
+            sink.write_row(row)
+            count += 1
+    sink.close()
+    return count
@@ -1,15 +1,18 @@
 from dataclasses import dataclass
 from decimal import Decimal, ROUND_HALF_UP
+from banking.money import Money
 import re
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Transaction:
     date: str       # YYYYMMdd
     txn_id: str     # Unique ID, e.g. "20230626-01"
     txn_type: str   # 'D' or 'W' or 'I' (interest)
-    amount: Decimal # Always positive
+    amount: Money   # Always positive; Decimal input is converted
 
     def __post_init__(self):
+        if not isinstance(self.amount, Money):
+            object.__setattr__(self, 'amount', Money.from_decimal(self.amount))
         if not re.match(r"^\d{8}$", self.date):
             raise ValueError(f"Invalid date format: {self.date}")
         if self.txn_type.upper() not in {'D', 'W', 'I'}:
@@ -17,6 +20,16 @@ class Transaction:
         if self.amount <= 0:
             raise ValueError("Transaction amount must be > 0")
 
+    @classmethod
+    def trusted(cls, date: str, txn_id: str, txn_type: str, amount: Money) -> 'Transaction':
+        """Builds a Transaction from already-validated ledger fields, skipping __post_init__."""
+        txn = object.__new__(cls)
+        object.__setattr__(txn, 'date', date)
+        object.__setattr__(txn, 'txn_id', txn_id)
+        object.__setattr__(txn, 'txn_type', txn_type)
+        object.__setattr__(txn, 'amount', amount)
+        return txn
+
     @staticmethod
     def round_amount(value: Decimal) -> Decimal:
         return value.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
@@ -0,0 +1,162 @@
+from typing import Callable, Dict, List, Optional, Tuple
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+
+from banking.bank import Bank
+from benchmarks.workload import Workload, generate
+
+class _with_setup:
+    """Callable whose untimed setup step runs before each timed call."""
+
+    def __init__(self, setup: Callable[[], None], run: Callable[[], None]):
+        self.setup = setup
+        self.run = run
+
+    def __call__(self):
+        self.run()
+
+def _ingested(workload: Workload) -> Bank:
+    bank = Bank()
+    for date, rule_id, rate in workload.rules:
+        bank.add_interest_rule(date, rule_id, rate)
+    bank.add_transactions(workload.records)
+    return bank
+
+def bench_ingest(workload: Workload) -> Tuple[Callable[[], None], int]:
+    """Rules plus every record through Bank.add_transactions on a fresh bank."""
+    return (lambda: _ingested(workload)), len(workload.records)
+
+def bench_month_end(workload: Workload) -> Tuple[Callable[[], None], int]:
+    """Bank.run_month_end for every month of the workload on a fresh bank."""
+    banks: List[Bank] = []
+
+    def setup():
+        banks.append(_ingested(workload))
+
+    def run():
+        bank = banks.pop()
+        for ym in workload.months:
+            bank.run_month_end(ym)
+    return _with_setup(setup, run), len(workload.months) * len(workload.account_ids)
+
+def bench_statement(workload: Workload, sample: int = 500, seed: int = 0) -> Tuple[Callable[[], None], int]:
+    """get_account_statement for random (account, month) pairs, interest included."""
+    bank = _ingested(workload)
+    # Post every month's interest up front, so statements carry their
+    # interest rows and only the read path is timed
+    for ym in workload.months:
+        bank.run_month_end(ym)
+    rng = random.Random(seed)
+    # Sparse workloads leave some ids without a posting, hence no account
+    account_ids = [a for a in workload.account_ids if a in bank.accounts]
+    picks = [(rng.choice(account_ids), rng.choice(workload.months)) for _ in range(sample)]
+
+    def run():
+        for account_id, ym in picks:
+            bank.get_account_statement(account_id, ym)
+    return run, sample
+
+def bench_balance_query(workload: Workload, sample: int = 20000, seed: int = 0) -> Tuple[Callable[[], None], int]:
+    """Account.get_balance_on_date for random (account, date) pairs."""
+    bank = _ingested(workload)
+    rng = random.Random(seed)
+    dates = sorted({r[0] for r in workload.records})
+    accounts = [bank.accounts[a] for a in workload.account_ids if a in bank.accounts]
+    picks = [(rng.choice(accounts), rng.choice(dates)) for _ in range(sample)]
+
+    def run():
+        for account, date in picks:
+            account.get_balance_on_date(date)
+    return run, sample
+
+SCENARIOS = {
+    "ingest": bench_ingest,
+    "month_end": bench_month_end,
+    "statement": bench_statement,
+    "balance_query": bench_balance_query,
+}
+
+def _time(fn: Callable[[], None], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        if isinstance(fn, _with_setup):
+            fn.setup()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def run_benchmarks(workload: Workload, scenarios: Optional[List[str]] = None, repeat: int = 3) -> Dict[str, Dict[str, float]]:
+    """
+    Runs the named scenarios (all by default) and returns, per scenario, the
+    best-of-`repeat` wall time, the operation count and operations per second.
+    """
+    results = {}
+    for name in scenarios or list(SCENARIOS):
+        fn, ops = SCENARIOS[name](workload)
+        seconds = _time(fn, repeat)
+        results[name] = {"seconds": round(seconds, 6), "ops": ops,
+                         "ops_per_sec": round(ops / seconds, 1) if seconds else 0.0}
+    return results
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            tolerance: float = 0.25) -> List[str]:
+    """
+    Returns one message per scenario whose time is more than `tolerance`
+    (a fraction) slower than the baseline. Scenarios missing from either
+    side are ignored.
+    """
+    regressions = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if not base or not base.get("seconds"):
+            continue
+        ratio = current["seconds"] / base["seconds"]
+        if ratio > 1 + tolerance:
+            regressions.append(f"{name}: {current['seconds']:.4f}s vs baseline {base['seconds']:.4f}s ({ratio:.2f}x)")
+    return regressions
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="AwesomeGIC Bank benchmarks")
+    parser.add_argument("--accounts", type=int, default=200)
+    parser.add_argument("--transactions", type=int, default=20000)
+    parser.add_argument("--rules", type=int, default=12)
+    parser.add_argument("--months", type=int, default=12)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--scenario", action="append", choices=list(SCENARIOS),
+                        help="scenario to run (repeatable; default all)")
+    parser.add_argument("--output", metavar="FILE", help="write the JSON report to FILE")
+    parser.add_argument("--baseline", metavar="FILE", help="compare against a stored JSON report")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown versus baseline as a fraction (default 0.25)")
+    args = parser.parse_args(argv)
+
+    params = {"accounts": args.accounts, "transactions": args.transactions, "rules": args.rules,
+              "months": args.months, "seed": args.seed}
+    workload = generate(**params)
+    report = {
+        "workload": params,
+        "python": platform.python_version(),
+        "results": run_benchmarks(workload, args.scenario, args.repeat),
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    print(text)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get("workload") != params:
+            print("Warning: baseline was recorded with a different workload", file=sys.stderr)
+        regressions = compare(report["results"], baseline["results"], args.tolerance)
+        for line in regressions:
+            print(f"Regression: {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
@@ -0,0 +1,61 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import List, Tuple
+import datetime
+import random
+
+Record = Tuple[str, str, str, str]  # date, account_id, type, amount
+
+@dataclass
+class Workload:
+    """A reproducible synthetic bank workload."""
+    records: List[Record]
+    rules: List[Tuple[str, str, Decimal]]
+    account_ids: List[str]
+    months: List[str]
+
+def generate(accounts: int = 100, transactions: int = 10000, rules: int = 12,
+             start: str = "20200101", months: int = 12, backdated: float = 0.02,
+             seed: int = 42) -> Workload:
+    """
+    Builds a seeded workload: `transactions` postings spread over `months`
+    months starting at `start`, across `accounts` accounts, plus `rules`
+    interest-rule changes. Activity is skewed (a few busy accounts, more
+    postings on weekdays), mostly in date order with a `backdated` fraction
+    of late corrections. Withdrawals never exceed the running balance of
+    in-order postings.
+    """
+    rng = random.Random(seed)
+    first = datetime.datetime.strptime(start, "%Y%m%d").date()
+    month_keys = []
+    y, m = first.year, first.month
+    for _ in range(months):
+        month_keys.append(f"{y}{m:02d}")
+        y, m = (y + 1, 1) if m == 12 else (y, m + 1)
+    last = (datetime.date(y, m, 1) - datetime.timedelta(days=1))
+    days = [first + datetime.timedelta(days=i) for i in range((last - first).days + 1)]
+    weights = [1.0 if d.weekday() < 5 else 0.3 for d in days]
+
+    account_ids = [f"AC{i:06d}" for i in range(accounts)]
+    activity = [1.0 / (i + 1) ** 0.8 for i in range(accounts)]
+    dates = sorted(rng.choices(days, weights=weights, k=transactions))
+    balances = dict.fromkeys(account_ids, 0)
+
+    records: List[Record] = []
+    for date in dates:
+        account_id = rng.choices(account_ids, weights=activity)[0]
+        if rng.random() < backdated:
+            date = max(first, date - datetime.timedelta(days=rng.randint(1, 60)))
+        cents = rng.randint(100, 500000)
+        if balances[account_id] > cents and rng.random() < 0.4:
+            txn_type = 'W'
+            balances[account_id] -= cents
+        else:
+            txn_type = 'D'
+            balances[account_id] += cents
+        records.append((date.strftime("%Y%m%d"), account_id, txn_type, f"{cents // 100}.{cents % 100:02d}"))
+
+    rule_dates = sorted(rng.sample(days, min(rules, len(days))))
+    rule_list = [(d.strftime("%Y%m%d"), f"RULE{i:04d}", Decimal(rng.randint(50, 500)) / 100)
+                 for i, d in enumerate(rule_dates)]
+    return Workload(records, rule_list, account_ids, month_keys)
@@ -1,8 +1,41 @@
-from banking.cli import CLI
+import argparse
+import sys
+from banking.cli import CLI, ECHO_LEVELS
+from banking.server import BankServer
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="AwesomeGIC Bank")
+    parser.add_argument("--import", dest="import_file", metavar="FILE",
+                        help="bulk-load transactions from FILE ('-' for stdin) and exit")
+    parser.add_argument("--script", metavar="FILE",
+                        help="run T/I/P commands from FILE ('-' for stdin) and exit")
+    parser.add_argument("--echo", choices=ECHO_LEVELS, default="summary",
+                        help="script output besides errors and statements (default: summary)")
+    parser.add_argument("--serve", metavar="PORT", type=int,
+                        help="serve the T/I/P commands over TCP on localhost:PORT")
+    args = parser.parse_args(argv)
+
+    if args.serve is not None:
+        BankServer().serve_forever(port=args.serve)
+        return 0
 
-def main():
     cli = CLI()
+    if args.import_file:
+        if args.import_file == "-":
+            rejected = cli.import_transactions(sys.stdin)
+        else:
+            with open(args.import_file) as f:
+                rejected = cli.import_transactions(f)
+        return 1 if rejected else 0
+    if args.script:
+        if args.script == "-":
+            failed = cli.run_script(sys.stdin, args.echo)
+        else:
+            with open(args.script) as f:
+                failed = cli.run_script(f, args.echo)
+        return 1 if failed else 0
     cli.run()
+    return 0
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
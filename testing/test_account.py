@@ -21,6 +21,17 @@ def test_withdrawal_without_deposit_raises_error():
     with pytest.raises(ValueError):
         account.add_transaction("20230626", "W", Decimal("100.00"))
 
+def test_oversized_amount_rejected_without_touching_ledger():
+    account = Account("AC001")
+    account.add_transaction("20230101", "D", Decimal("10.00"))
+    with pytest.raises(ValueError, match="too large"):
+        account.add_transaction("20230102", "D", Decimal("1e20"))
+    with pytest.raises(ValueError, match="out of range"):
+        account.add_transaction("20230102", "D", Decimal("92233720368547758.00"))
+    txn = account.add_transaction("20230102", "D", Decimal("5.00"))
+    assert txn.txn_id == "20230102-01"
+    assert [t.amount for t in account.get_statement("202301")] == [Decimal("10.00"), Decimal("5.00")]
+
 def test_transaction_id_sequence():
     account = Account("AC001")
     t1 = account.add_transaction("20230626", "D", Decimal("10.00"))
@@ -42,3 +53,67 @@ def test_add_interest():
     txn = account.add_interest("20230630", Decimal("0.39"))
     assert txn.txn_type == "I"
     assert account.balance == Decimal("100.39")
+
+def test_balance_on_date_with_backdated_insert():
+    account = Account("AC001")
+    account.add_transaction("20230601", "D", Decimal("100.00"))
+    account.add_transaction("20230620", "D", Decimal("50.00"))
+    account.add_transaction("20230610", "W", Decimal("30.00"))
+    assert account.get_balance_on_date("20230531") == Decimal("0.00")
+    assert account.get_balance_on_date("20230609") == Decimal("100.00")
+    assert account.get_balance_on_date("20230615") == Decimal("70.00")
+    assert account.get_balance_on_date("20230630") == Decimal("120.00")
+    assert [t.date for t in account.transactions] == ["20230601", "20230610", "20230620"]
+
+def test_statement_uses_month_buckets_in_order():
+    account = Account("AC001")
+    account.add_transaction("20230710", "D", Decimal("10.00"))
+    account.add_transaction("20230601", "D", Decimal("100.00"))
+    account.add_transaction("20230605", "D", Decimal("20.00"))
+    account.add_transaction("20230602", "W", Decimal("5.00"))
+    assert account.get_months() == ["202306", "202307"]
+    assert [t.date for t in account.get_statement("202306")] == ["20230601", "20230602", "20230605"]
+    assert account.get_statement("202305") == []
+    assert account.get_transaction_dates_between("20230601", "20230630") == ["20230601", "20230602", "20230605"]
+
+def test_backdated_withdrawal_checked_against_later_balances():
+    account = Account("AC001")
+    account.add_transaction("20230601", "D", Decimal("100.00"))
+    account.add_transaction("20230620", "W", Decimal("80.00"))
+    account.add_transaction("20230625", "D", Decimal("500.00"))
+    # Today's balance is 520.00, but on 20230620 it would drop to -10.00
+    with pytest.raises(ValueError, match="negative balance"):
+        account.add_transaction("20230610", "W", Decimal("30.00"))
+    with pytest.raises(ValueError, match="negative balance"):
+        account.add_transaction("20230501", "W", Decimal("1.00"))
+    account.add_transaction("20230610", "W", Decimal("20.00"))
+    assert account.get_balance_on_date("20230620") == Decimal("0.00")
+    account.add_transaction("20230626", "W", Decimal("500.00"))
+    assert account.balance == Decimal("0.00")
+
+def test_backdated_withdrawals_match_brute_force():
+    import random
+    rng = random.Random(3)
+    account = Account("AC001")
+    account.add_transaction("20230101", "D", Decimal("100.00"))
+    for _ in range(400):
+        date = f"2023{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}"
+        txn_type = rng.choice("DWW")
+        amount = Decimal(rng.randint(1, 8000)) / 100
+        if txn_type == 'W':
+            # Brute force: every balance from the end of date onwards must cover it
+            running = [account.get_balance_on_date(date)]
+            for txn in account.transactions:
+                if txn.date > date:
+                    running.append(running[-1] + (-txn.amount if txn.txn_type == 'W' else txn.amount))
+            allowed = min(running) >= amount
+        else:
+            allowed = True
+        try:
+            account.add_transaction(date, txn_type, amount)
+            assert allowed
+        except ValueError:
+            assert not allowed
+        if rng.random() < 0.05:
+            account.add_interest(f"2023{rng.randint(1, 12):02d}28", Decimal("0.50"))
+    assert min(account.ledger.running) >= 0
@@ -0,0 +1,82 @@
+import pytest
+from decimal import Decimal
+from banking.aggregates import BankAggregates
+from banking.bank import Bank
+from banking.dates import date_to_ordinal
+from banking.persistence import PersistentBank
+from banking.sqlite_store import SqliteBank
+from banking.money import Money
+
+def populate(bank):
+    bank.add_interest_rule("20230101", "R1", Decimal("2.00"))
+    bank.add_transaction("20230105", "AC001", "D", Decimal("1000.00"))
+    bank.add_transaction("20230105", "AC002", "D", Decimal("250.00"))
+    bank.add_transaction("20230110", "AC003", "D", Decimal("40.00"))
+    bank.add_transaction("20230120", "AC001", "W", Decimal("300.00"))
+    bank.add_transaction("20230103", "AC002", "D", Decimal("10.00"))  # backdated
+    bank.calculate_monthly_interest("AC001", "202301")
+
+def scanned(bank):
+    """Reference aggregates built by scanning every account."""
+    reference = BankAggregates()
+    reference.rebuild(bank.accounts.values())
+    return reference
+
+def test_day_totals_and_total_balance():
+    bank = Bank()
+    populate(bank)
+    assert bank.get_day_totals("20230105") == {'D': Decimal("1250.00"), 'W': 0, 'I': 0}
+    interest = bank.accounts["AC001"].get_statement("202301")[-1].amount
+    assert bank.get_day_totals("20230131")['I'] == interest
+    totals = bank.get_totals_between("20230101", "20230115")
+    assert totals == {'D': Decimal("1300.00"), 'W': 0, 'I': 0}
+    assert bank.get_total_balance() == sum(a.balance for a in bank.accounts.values())
+    # A stale month's interest is reversed and re-posted
+    bank.add_transaction("20230125", "AC001", "D", Decimal("5000.00"))
+    bank.calculate_monthly_interest("AC001", "202301")
+    reference = scanned(bank)
+    assert bank.get_day_totals("20230131") == reference.day_totals("20230131")
+    assert bank.get_total_balance() == reference.total_balance()
+
+def test_top_balances_and_threshold():
+    bank = Bank()
+    populate(bank)
+    ranked = sorted(((a.account_id, a.balance) for a in bank.accounts.values()), key=lambda r: -r[1].cents)
+    assert bank.get_top_balances(2) == ranked[:2]
+    assert bank.get_top_balances(0) == []
+    assert bank.get_accounts_below(Decimal("260.01")) == [("AC003", Money(4000)), ("AC002", Money(26000))]
+    assert bank.get_accounts_below("260.00") == [("AC003", Money(4000))]
+    assert bank.get_accounts_below(40) == []
+    bank.add_transaction("20230201", "AC003", "D", Decimal("10000.00"))
+    assert bank.get_top_balances(1) == [("AC003", Money(1004000))]
+
+def test_aggregates_rebuilt_on_reload(tmp_path):
+    bank = PersistentBank(str(tmp_path), snapshot_every=4)
+    populate(bank)
+    bank.close()
+    recovered = PersistentBank(str(tmp_path))
+    assert recovered.get_total_balance() == bank.get_total_balance()
+    assert recovered.get_top_balances(3) == bank.get_top_balances(3)
+    assert recovered.get_totals_between("20230101", "20231231") == bank.get_totals_between("20230101", "20231231")
+    assert recovered.aggregates._days == [date_to_ordinal(d) for d in
+                                          ("20230103", "20230105", "20230110", "20230120", "20230131")]
+
+@pytest.mark.parametrize("reopen", [lambda path: PersistentBank(str(path)),
+                                    lambda path: SqliteBank(str(path / "bank.db"))],
+                         ids=["journal", "sqlite"])
+def test_evicted_day_totals_survive_reload(tmp_path, reopen):
+    plain = Bank()
+    populate(plain)
+    bank = reopen(tmp_path)
+    populate(bank)
+    for b in (plain, bank):
+        b.add_transaction("20230205", "AC001", "D", Decimal("7.00"))
+        b.close_months("202301", evict=True)
+    assert bank.accounts["AC001"].evicted_through is not None
+    assert bank.get_totals_between("20230101", "20230228") == plain.get_totals_between("20230101", "20230228")
+    bank.close()
+    recovered = reopen(tmp_path)
+    assert recovered.get_totals_between("20230101", "20230228") == plain.get_totals_between("20230101", "20230228")
+    assert recovered.get_day_totals("20230131") == plain.get_day_totals("20230131")
+    assert recovered.get_total_balance() == plain.get_total_balance()
+    recovered.close()
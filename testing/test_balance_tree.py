@@ -0,0 +1,31 @@
+import random
+from banking.balance_tree import INF, BalanceTree
+
+def test_range_add_and_min_match_list():
+    rng = random.Random(5)
+    tree = BalanceTree(1000, 50)
+    values = [INF] * tree.size
+    for _ in range(500):
+        op = rng.random()
+        a = rng.randint(1000, tree.last_day)
+        b = rng.randint(a, tree.last_day)
+        if op < 0.3:
+            v = rng.randint(-100, 100)
+            tree.set(a, v)
+            values[a - 1000] = v
+        elif op < 0.6:
+            delta = rng.randint(-50, 50)
+            tree.add(a, b, delta)
+            for i in range(a - 1000, b - 1000 + 1):
+                values[i] += delta
+        else:
+            assert tree.min(a, b) == min(values[a - 1000:b - 1000 + 1])
+
+def test_load_and_clamped_ranges():
+    tree = BalanceTree(10, 8)
+    tree.load([(10, 5), (12, 3), (17, 9)])
+    assert tree.min(0, 100) == 3
+    assert tree.min(13, 16) == INF
+    tree.add(12, 40, 10)
+    assert tree.min(11, 17) == 13
+    assert not tree.covers(18) and tree.covers(17)
@@ -51,3 +51,186 @@ def test_statement_includes_interest():
     bank.calculate_monthly_interest("AC001", "202306")
     stmts = bank.get_account_statement("AC001", "202306")
     assert any(t.txn_type == 'I' for t in stmts)
+
+def test_rule_change_splits_interest_period():
+    bank = Bank()
+    bank.add_interest_rule("20230101", "RULE01", Decimal("1.95"))
+    bank.add_interest_rule("20230520", "RULE02", Decimal("1.90"))
+    bank.add_interest_rule("20230615", "RULE03", Decimal("2.20"))
+    bank.add_transaction("20230505", "AC001", "D", Decimal("100.00"))
+    bank.add_transaction("20230601", "AC001", "D", Decimal("150.00"))
+    bank.add_transaction("20230626", "AC001", "W", Decimal("20.00"))
+    bank.add_transaction("20230626", "AC001", "W", Decimal("100.00"))
+    _, interest = bank.calculate_monthly_interest("AC001", "202306")
+    # 250 * 1.90% * 14 + 250 * 2.20% * 11 + 130 * 2.20% * 5, each / 365
+    assert interest == Decimal("0.39")
+
+def test_add_transactions_bulk_report():
+    bank = Bank()
+    report = bank.add_transactions([
+        ("20230601", "AC001", "D", "100.00"),
+        ("20230601", "AC002", "W", "10.00"),
+        ("20230602", "AC001", "W", "30.00"),
+        ("20230603", "AC001", "D", "abc"),
+        ("20230603", "AC001"),
+        ("20230602", "AC002", "D", Decimal("5.00")),
+        ("20230603", "AC001", "D", "1e20"),
+    ])
+    assert report.txn_ids == ["20230601-01", None, "20230602-01", None, None, "20230602-01", None]
+    assert report.accepted == 3
+    assert report.errors == {
+        1: "First transaction cannot be withdrawal",
+        3: "Invalid amount format",
+        4: "Invalid input format",
+        6: "Amount is too large",
+    }
+    assert bank.accounts["AC001"].balance == Decimal("70.00")
+
+def test_run_month_end_matches_per_account_interest():
+    def build():
+        bank = Bank()
+        bank.add_interest_rule("20230520", "RULE02", Decimal("1.90"))
+        bank.add_interest_rule("20230615", "RULE03", Decimal("2.20"))
+        for i in range(5):
+            account_id = f"AC{i:03d}"
+            bank.add_transaction("20230601", account_id, "D", Decimal(100 * (i + 1)))
+            bank.add_transaction("20230620", account_id, "W", Decimal("10.00"))
+        return bank
+
+    expected = build()
+    for account_id in sorted(expected.accounts):
+        expected.calculate_monthly_interest(account_id, "202306")
+
+    serial = build().run_month_end("202306")
+    bank = build()
+    parallel = bank.run_month_end("202306", workers=2, engine="decimal")
+    assert serial == parallel
+    assert list(parallel) == sorted(parallel)
+    with pytest.raises(ValueError, match="accrual engine"):
+        build().run_month_end("202306", workers=2)
+    for account_id, account in expected.accounts.items():
+        assert parallel[account_id] == account.transactions[-1].amount
+        assert bank.accounts[account_id].balance == account.balance
+
+def test_monthly_interest_is_cached_and_idempotent():
+    bank = Bank()
+    bank.add_transaction("20230601", "AC001", "D", Decimal("36500.00"))
+    bank.add_interest_rule("20230601", "R1", Decimal("1.0"))
+    first = bank.calculate_monthly_interest("AC001", "202306")
+    second = bank.calculate_monthly_interest("AC001", "202306")
+    assert second is first
+    assert bank.accounts["AC001"].balance == Decimal("36530.00")
+    assert len(bank.get_account_statement("AC001", "202306")) == 2
+
+def test_backdated_transaction_recomputes_interest():
+    bank = Bank()
+    bank.add_transaction("20230601", "AC001", "D", Decimal("36500.00"))
+    bank.add_interest_rule("20230601", "R1", Decimal("1.0"))
+    bank.calculate_monthly_interest("AC001", "202306")
+    bank.calculate_monthly_interest("AC001", "202307")
+    july = bank.accounts["AC001"].get_statement("202307")[-1].amount
+    bank.add_transaction("20230611", "AC001", "W", Decimal("36500.00"))
+    _, june = bank.calculate_monthly_interest("AC001", "202306")
+    assert june == Decimal("10.00")
+    # June's corrected interest also flows into July
+    _, july_again = bank.calculate_monthly_interest("AC001", "202307")
+    assert july_again != july
+    assert [t.txn_type for t in bank.get_account_statement("AC001", "202306")] == ["D", "W", "I"]
+    assert bank.accounts["AC001"].balance == june + july_again
+
+def test_rule_change_invalidates_cached_months():
+    bank = Bank()
+    bank.add_transaction("20230601", "AC001", "D", Decimal("36500.00"))
+    bank.add_interest_rule("20230601", "R1", Decimal("1.0"))
+    bank.calculate_monthly_interest("AC001", "202306")
+    bank.add_interest_rule("20230616", "R2", Decimal("2.0"))
+    _, interest = bank.calculate_monthly_interest("AC001", "202306")
+    # 15 days at 1% + 15 days at 2% of 36500, each / 365
+    assert interest == Decimal("45.00")
+    assert bank.accounts["AC001"].balance == Decimal("36545.00")
+
+def test_interest_range_matches_monthly_calculation():
+    monthly, ranged = Bank(), Bank()
+    for bank in (monthly, ranged):
+        bank.add_interest_rule("20230101", "R1", Decimal("2.0"))
+        bank.add_transaction("20230110", "AC001", "D", Decimal("5000.00"))
+        bank.add_interest_rule("20230215", "R2", Decimal("3.5"))
+        bank.add_transaction("20230301", "AC001", "W", Decimal("1200.00"))
+        bank.add_transaction("20230520", "AC001", "D", Decimal("80.00"))
+    expected = {ym: monthly.calculate_monthly_interest("AC001", ym)
+                for ym in ("202301", "202302", "202303", "202304", "202305")}
+    assert ranged.calculate_interest_range("AC001", "202301", "202305") == expected
+    assert ranged.accounts["AC001"].balance == monthly.accounts["AC001"].balance
+    # A backdated posting makes later months stale; the rerun recomputes them
+    for bank in (monthly, ranged):
+        bank.add_transaction("20230215", "AC001", "D", Decimal("300.00"))
+    expected = {ym: monthly.calculate_monthly_interest("AC001", ym) for ym in expected}
+    assert ranged.calculate_interest_range("AC001", "202301", "202305") == expected
+    with pytest.raises(ValueError):
+        ranged.calculate_interest_range("AC001", "202305", "202301")
+    for from_ym, to_ym in (("2023-1", "202305"), ("202301", "2023051"), ("20230a", "202305")):
+        with pytest.raises(ValueError, match="YYYYMM"):
+            ranged.calculate_interest_range("AC001", from_ym, to_ym)
+
+def test_statement_range_spans_months():
+    bank = Bank()
+    bank.add_interest_rule("20230101", "R1", Decimal("2.0"))
+    bank.add_transaction("20230110", "AC001", "D", Decimal("5000.00"))
+    bank.add_transaction("20230301", "AC001", "W", Decimal("1200.00"))
+    bank.calculate_interest_range("AC001", "202301", "202303")
+    statement = bank.get_account_statement_range("AC001", "202301", "202303")
+    assert statement == [t for ym in ("202301", "202302", "202303")
+                         for t in bank.get_account_statement("AC001", ym)]
+    assert [t.txn_type for t in statement] == ["D", "I", "I", "W", "I"]
+    assert bank.get_account_statement_range("AC001", "202302", "202302") == bank.get_account_statement("AC001", "202302")
+
+@pytest.mark.parametrize("engine", ["accrual", "decimal"])
+def test_month_end_is_not_a_separate_period(engine):
+    # 164.25 at 1% earns 0.0045 a day. June as one 30-day period is 0.135,
+    # which rounds to 0.14. Splitting off the 30th as its own period (as
+    # earlier versions did) gives 0.13 + 0.00.
+    bank = Bank()
+    bank.add_interest_rule("20230101", "R1", Decimal("1.00"))
+    bank.add_transaction("20230601", "AC001", "D", Decimal("164.25"))
+    assert bank.run_month_end("202306", engine=engine) == {"AC001": Decimal("0.14")}
+    ranged = Bank()
+    ranged.add_interest_rule("20230101", "R1", Decimal("1.00"))
+    ranged.add_transaction("20230601", "AC001", "D", Decimal("164.25"))
+    assert ranged.calculate_interest_range("AC001", "202306", "202306")["202306"][1] == Decimal("0.14")
+
+@pytest.mark.parametrize("engine", ["accrual", "decimal"])
+def test_recomputed_month_does_not_depend_on_other_calls(engine):
+    def june(unrelated_call):
+        bank = Bank()
+        bank.add_interest_rule("20230101", "R1", Decimal("3.47"))
+        bank.add_transaction("20230611", "AC1", "D", Decimal("85.06"))
+        bank.run_month_end("202306", engine=engine)
+        bank.add_transaction("20230601", "AC1", "D", Decimal("100.42"))
+        if unrelated_call:
+            bank.calculate_monthly_interest("AC1", "202301")
+        return bank.calculate_monthly_interest("AC1", "202306")[1]
+    # 10 days on 100.42 (0.10) and 20 days on 185.48 (0.35)
+    assert june(False) == june(True) == Decimal("0.45")
+
+@pytest.mark.parametrize("recompute", [
+    lambda bank: bank.calculate_monthly_interest("AC001", "202301"),
+    lambda bank: bank.calculate_interest_range("AC001", "202301", "202302"),
+    lambda bank: bank.run_month_end("202301"),
+], ids=["monthly", "range", "month_end"])
+def test_interest_cut_cannot_overdraw_later_balances(recompute):
+    bank = Bank()
+    bank.add_interest_rule("20230101", "R1", Decimal("10.00"))
+    bank.add_transaction("20230105", "AC001", "D", Decimal("1000.00"))
+    assert bank.calculate_monthly_interest("AC001", "202301")[1] == Decimal("7.40")
+    bank.add_transaction("20230210", "AC001", "W", Decimal("1007.40"))
+    bank.add_interest_rule("20230101", "R1", Decimal("1.00"))
+    with pytest.raises(ValueError, match="negative balance"):
+        recompute(bank)
+    account = bank.accounts["AC001"]
+    assert account.balance == 0
+    assert account.get_statement("202301")[-1].amount == Decimal("7.40")
+    # Once the later balance can absorb the cut, the month is recomputed
+    bank.add_transaction("20230205", "AC001", "D", Decimal("10.00"))
+    assert bank.calculate_monthly_interest("AC001", "202301")[1] == Decimal("0.74")
+    assert account.balance == Decimal("3.34")
+    assert bank.get_total_balance() == account.balance
@@ -0,0 +1,36 @@
+from benchmarks.runner import compare, run_benchmarks
+from benchmarks.workload import generate
+
+def test_workload_is_reproducible():
+    a = generate(accounts=5, transactions=200, rules=3, months=2, seed=7)
+    b = generate(accounts=5, transactions=200, rules=3, months=2, seed=7)
+    assert a.records == b.records and a.rules == b.rules
+    assert a.months == ["202001", "202002"]
+    assert generate(accounts=5, transactions=200, seed=8).records != a.records
+
+def test_workload_ingests_cleanly():
+    from banking.bank import Bank
+    report = Bank().add_transactions(generate(accounts=5, transactions=300, backdated=0).records)
+    assert report.rejected == 0
+
+def test_run_benchmarks_and_compare():
+    workload = generate(accounts=3, transactions=50, rules=2, months=2)
+    results = run_benchmarks(workload, repeat=1)
+    assert set(results) == {"ingest", "month_end", "statement", "balance_query"}
+    assert results["ingest"]["ops"] == 50
+
+    baseline = {"ingest": {"seconds": 1.0}, "statement": {"seconds": 1.0}}
+    current = {"ingest": {"seconds": 1.2}, "statement": {"seconds": 2.0}, "month_end": {"seconds": 5.0}}
+    regressions = compare(current, baseline, tolerance=0.25)
+    assert len(regressions) == 1 and regressions[0].startswith("statement")
+
+def test_statement_scenario_skips_accounts_without_postings():
+    from banking.bank import Bank
+    from benchmarks.runner import bench_statement
+    workload = generate(accounts=500, transactions=50, months=2)
+    bank = Bank()
+    bank.add_transactions(workload.records)
+    assert len(bank.accounts) < len(workload.account_ids)
+    run, ops = bench_statement(workload, sample=200)
+    run()
+    assert ops == 200
@@ -0,0 +1,103 @@
+import pytest
+from decimal import Decimal
+from banking.bank import Bank
+from banking.persistence import PersistentBank
+
+def populate(bank):
+    bank.add_interest_rule("20230101", "RULE01", Decimal("2.00"))
+    bank.add_interest_rule("20230315", "RULE02", Decimal("3.50"))
+    bank.add_transaction("20230105", "AC001", "D", Decimal("1000.00"))
+    bank.add_transaction("20230120", "AC001", "W", Decimal("200.00"))
+    bank.add_transaction("20230210", "AC001", "D", Decimal("50.00"))
+    # March is quiet apart from interest
+    bank.add_transaction("20230402", "AC001", "W", Decimal("100.00"))
+    bank.add_transaction("20230115", "AC002", "D", Decimal("300.00"))
+
+def test_checkpoints_record_closing_balance_and_interest():
+    bank = Bank()
+    populate(bank)
+    closed = bank.close_months("202302")
+    account = bank.accounts["AC001"]
+    jan, feb = closed["AC001"]
+    assert jan.year_month == "202301" and feb.year_month == "202302"
+    assert jan.closing_balance == bank.accounts["AC001"].get_balance_on_date("20230131")
+    assert jan.interest == bank.calculate_monthly_interest("AC001", "202301")[1]
+    assert jan.txn_count == 3  # two transactions and the interest posting
+    assert jan.checksum != feb.checksum
+    assert account.checkpoint("202303") is None
+    # Closing again is a no-op
+    assert bank.close_months("202302") == {}
+
+def test_closed_months_reject_postings():
+    bank = Bank()
+    populate(bank)
+    bank.close_months("202302")
+    with pytest.raises(ValueError, match="Month 202302 is closed"):
+        bank.add_transaction("20230228", "AC001", "D", Decimal("1.00"))
+    # A rule dated in a closed month does not reopen its interest
+    interest = bank.calculate_monthly_interest("AC001", "202302")
+    bank.add_interest_rule("20230201", "RULE03", Decimal("1.00"))
+    assert bank.calculate_monthly_interest("AC001", "202302") == interest
+    bank.add_transaction("20230301", "AC001", "D", Decimal("1.00"))
+
+def test_eviction_keeps_balances_and_later_interest(tmp_path):
+    plain, compacted = Bank(), Bank()
+    populate(plain)
+    populate(compacted)
+    for ym in ("202301", "202302"):
+        plain.calculate_monthly_interest("AC001", ym)
+    compacted.close_months("202302", archive_dir=str(tmp_path))
+    account = compacted.accounts["AC001"]
+    assert account.ledger.dates[0] > account.evicted_through
+    for date in ("20221231", "20230105", "20230119", "20230131", "20230215", "20230228", "20230402"):
+        assert compacted.accounts["AC001"].get_balance_on_date(date) == plain.accounts["AC001"].get_balance_on_date(date)
+    assert compacted.get_account_statement("AC001", "202301") == plain.get_account_statement("AC001", "202301")
+    for ym in ("202302", "202303", "202304"):
+        assert compacted.calculate_monthly_interest("AC001", ym) == plain.calculate_monthly_interest("AC001", ym)
+    assert compacted.accounts["AC001"].balance == plain.accounts["AC001"].balance
+
+def test_eviction_without_archive_drops_statements():
+    bank = Bank()
+    populate(bank)
+    bank.close_months("202302", evict=True)
+    with pytest.raises(ValueError, match="compacted"):
+        bank.get_account_statement("AC001", "202301")
+    assert bank.accounts["AC001"].get_balance_on_date("20230228") == bank.accounts["AC001"].checkpoint("202302").closing_balance
+
+def test_withdrawal_after_every_entry_is_evicted():
+    bank = Bank()
+    populate(bank)
+    bank.close_months("202304", evict=True)
+    account = bank.accounts["AC001"]
+    assert not len(account.ledger) and account.balance > 0
+    balance = account.balance.to_decimal()
+    with pytest.raises(ValueError, match="negative balance"):
+        bank.add_transaction("20230510", "AC001", "W", balance + Decimal("0.01"))
+    bank.add_transaction("20230510", "AC001", "W", Decimal("100.00"))
+    assert account.balance == balance - Decimal("100.00")
+
+def test_closed_months_survive_restart(tmp_path):
+    bank = PersistentBank(str(tmp_path / "data"))
+    populate(bank)
+    bank.close_months("202302", archive_dir=str(tmp_path))
+    bank.add_transaction("20230405", "AC001", "D", Decimal("5.00"))
+    bank.close()
+    recovered = PersistentBank(str(tmp_path / "data"))
+    account = recovered.accounts["AC001"]
+    assert account.checkpoints == bank.accounts["AC001"].checkpoints
+    assert account.balance == bank.accounts["AC001"].balance
+    assert recovered.get_account_statement("AC001", "202301") == bank.get_account_statement("AC001", "202301")
+    assert recovered.calculate_monthly_interest("AC001", "202304") == bank.calculate_monthly_interest("AC001", "202304")
+    with pytest.raises(ValueError):
+        recovered.add_transaction("20230201", "AC001", "D", Decimal("1.00"))
+
+def test_months_before_first_posting_stay_interest_free_after_close():
+    bank = Bank()
+    populate(bank)
+    assert bank.calculate_monthly_interest("AC001", "202212") == ([], 0)
+    bank.close_months("202302")
+    assert bank.accounts["AC001"].month_closed("202212")
+    assert bank.calculate_monthly_interest("AC001", "202212") == ([], 0)
+    ranged = bank.calculate_interest_range("AC001", "202211", "202303")
+    assert [ym for ym, (_, interest) in ranged.items() if interest] == ["202301", "202302", "202303"]
+    assert "AC001" not in bank.run_month_end("202212")
@@ -1,5 +1,6 @@
 import pytest
 from unittest.mock import patch
+from decimal import Decimal
 from banking.cli import CLI
 
 def test_quit_command_prints_exit_message(capsys):
@@ -29,3 +30,52 @@ def test_handle_interest_rules_invalid_input(capsys):
         cli.run()
         captured = capsys.readouterr()
         assert "Invalid input format" in captured.out
+
+def test_import_transactions_prints_summary(capsys):
+    lines = ["# end of day", "20230601 AC001 D 100.00", "", "20230602 AC001 W 500.00", "20230603 AC001 W 20.00"]
+    cli = CLI()
+    rejected = cli.import_transactions(lines, batch_size=2)
+    captured = capsys.readouterr()
+    assert rejected == 1
+    assert "Record 2: Error: Withdrawal would cause negative balance" in captured.out
+    assert "Imported 2 transactions, 1 rejected." in captured.out
+    assert cli.bank.accounts["AC001"].balance == Decimal("80.00")
+
+SCRIPT = [
+    "# teller session",
+    "I 20230101 RULE01 1.95",
+    "T 20230505 AC001 D 100.00",
+    "T 20230610 AC001 W 200.00",
+    "t 20230611 AC001 D 50.00",
+    "P AC001 202306",
+    "Q",
+    "T 20230612 AC001 D 1.00",
+]
+
+def test_run_script_prints_statements_only_on_demand(capsys):
+    cli = CLI()
+    failed = cli.run_script(SCRIPT)
+    out = capsys.readouterr().out
+    assert failed == 1
+    assert "Line 4: Error: Withdrawal would cause negative balance" in out
+    assert out.count("Account: AC001") == 1
+    assert "| 20230630 |             | I    |" in out
+    assert "added successfully" not in out
+    assert "Processed 2 transactions, 1 interest rules, 1 statements; 1 failed." in out
+    # Nothing after Q runs
+    assert cli.bank.accounts["AC001"].balance == Decimal("150.21")
+
+def test_run_script_echo_levels(capsys):
+    CLI().run_script(SCRIPT[:5], echo="id")
+    out = capsys.readouterr().out
+    assert "Transaction 20230505-01 added successfully." in out
+    assert "Interest rule RULE01 added" in out
+
+    CLI().run_script(SCRIPT[:5] + ["P AC001 2023-6"], echo="none")
+    out = capsys.readouterr().out
+    assert out.splitlines() == [
+        "Line 4: Error: Withdrawal would cause negative balance",
+        "Line 6: Error: YearMonth must be in YYYYMM format",
+    ]
+    with pytest.raises(ValueError):
+        CLI().run_script([], echo="loud")
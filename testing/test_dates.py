@@ -0,0 +1,31 @@
+import datetime
+import pytest
+from banking.dates import (as_ordinal, date_to_ordinal, month_end, month_key, month_range,
+                           month_start, months_between, next_month, ordinal_to_date)
+
+@pytest.mark.parametrize("date", ["19000101", "20230228", "20240229", "20231231", "21991231", "18991231", "22000101"])
+def test_round_trip_matches_datetime(date):
+    ordinal = datetime.date(int(date[:4]), int(date[4:6]), int(date[6:])).toordinal()
+    assert date_to_ordinal(date) == ordinal
+    assert ordinal_to_date(ordinal) == date
+    assert as_ordinal(date) == as_ordinal(ordinal) == ordinal
+
+@pytest.mark.parametrize("date", ["20230229", "20231301", "20230000", "20230431", "2023061", "2023O601"])
+def test_invalid_dates_rejected(date):
+    with pytest.raises(ValueError, match="Invalid date format"):
+        date_to_ordinal(date)
+
+def test_month_table():
+    first, last = month_range("202402")
+    assert (ordinal_to_date(first), ordinal_to_date(last)) == ("20240201", "20240229")
+    mid = date_to_ordinal("20231215")
+    assert month_start(mid) == date_to_ordinal("20231201")
+    assert month_end(mid) == date_to_ordinal("20231231")
+    assert month_key(mid) == "202312"
+    # Outside the table falls back to datetime
+    assert month_end(date_to_ordinal("18500210")) == date_to_ordinal("18500228")
+
+def test_month_sequences():
+    assert next_month("202312") == "202401"
+    assert months_between("202311", "202402") == ["202311", "202312", "202401", "202402"]
+    assert months_between("202402", "202401") == []
@@ -0,0 +1,46 @@
+import pytest
+from banking.ledger import Ledger, TransactionView, COLUMNS, MAX_CENTS, TYPE_CODES, date_to_ordinal, ordinal_to_date
+
+def test_date_ordinal_round_trip():
+    assert ordinal_to_date(date_to_ordinal("20240229")) == "20240229"
+    assert date_to_ordinal("20230701") - date_to_ordinal("20230630") == 1
+
+def test_invalid_date_rejected():
+    with pytest.raises(ValueError):
+        date_to_ordinal("20231301")
+    with pytest.raises(ValueError):
+        date_to_ordinal("2023-06-01")
+
+def test_insert_keeps_date_sequence_order_and_running_balance():
+    ledger = Ledger()
+    d1, d2 = date_to_ordinal("20230601"), date_to_ordinal("20230602")
+    ledger.insert(d2, 1, TYPE_CODES['D'], 5000)
+    ledger.insert(d1, 1, TYPE_CODES['D'], 10000)
+    ledger.insert(d1, 2, TYPE_CODES['W'], 2500)
+    ledger.insert(d1, 0, TYPE_CODES['I'], 10)
+    assert list(ledger.seqs) == [0, 1, 2, 1]
+    assert list(ledger.running) == [10, 10010, 7510, 12510]
+    assert ledger.balance_on(d1) == 7510
+    assert ledger.balance_on(d1 - 1) == 0
+
+def test_transaction_view_materialises_lazily():
+    ledger = Ledger()
+    ledger.insert(date_to_ordinal("20230601"), 1, TYPE_CODES['D'], 10000)
+    ledger.insert(date_to_ordinal("20230630"), 0, TYPE_CODES['I'], 39)
+    view = TransactionView(ledger)
+    assert len(view) == 2
+    assert view[0].txn_id == "20230601-01"
+    assert view[-1].txn_type == "I" and view[-1].txn_id == ""
+    assert [t.date for t in view[0:1]] == ["20230601"]
+
+def test_out_of_range_insert_leaves_columns_unchanged():
+    ledger = Ledger()
+    d1, d2 = date_to_ordinal("20230601"), date_to_ordinal("20230602")
+    ledger.insert(d2, 1, TYPE_CODES['D'], MAX_CENTS - 100)
+    before = [list(getattr(ledger, col)) for col in COLUMNS]
+    for date_ord, cents in ((d1, 10 ** 22), (d1, 101), (d2, 101)):
+        with pytest.raises(ValueError, match="out of range"):
+            ledger.insert(date_ord, 2, TYPE_CODES['D'], cents)
+    assert [list(getattr(ledger, col)) for col in COLUMNS] == before
+    ledger.insert(d1, 1, TYPE_CODES['D'], 100)
+    assert ledger.running[-1] == MAX_CENTS
@@ -0,0 +1,80 @@
+import json
+import threading
+import pytest
+from decimal import Decimal
+from banking.bank import Bank
+from banking.metrics import Histogram, Metrics
+
+def make_bank(metrics=None):
+    bank = Bank(metrics)
+    bank.add_interest_rule("20230101", "RULE01", Decimal("1.95"))
+    bank.add_transaction("20230505", "AC001", "D", Decimal("100.00"))
+    bank.add_transaction("20230610", "AC001", "D", Decimal("50.00"))
+    bank.add_interest_rule("20230615", "RULE02", Decimal("2.20"))
+    return bank
+
+def test_operations_are_counted_with_work():
+    bank = make_bank()
+    bank.calculate_monthly_interest("AC001", "202306")
+    bank.calculate_monthly_interest("AC001", "202306")
+    with pytest.raises(ValueError):
+        bank.get_account_statement("NOPE", "202306")
+
+    ops = bank.metrics.snapshot()["operations"]
+    assert ops["add_transaction"]["calls"] == 2
+    assert ops["add_interest_rule"]["calls"] == 2
+    assert ops["get_account_statement"]["errors"] == 1
+
+    interest = ops["calculate_monthly_interest"]
+    assert interest["calls"] == 2
+    assert interest["work"]["cache_hits"] == 1
+    assert interest["work"]["recomputations"] == 1
+    assert interest["work"]["periods"] >= 3
+    # The cached call did no period work and still counts in the histogram
+    assert interest["work_per_call"]["periods"]["count"] == 2
+    assert interest["latency_seconds"]["count"] == 2
+
+def test_disabled_metrics_record_nothing():
+    bank = make_bank(Metrics(enabled=False))
+    bank.get_account_statement("AC001", "202306")
+    assert bank.metrics.snapshot() == {"operations": {}, "counters": {}}
+
+def test_threads_merge_and_reset():
+    metrics = Metrics()
+
+    def work():
+        for _ in range(100):
+            with metrics.call("op") as call:
+                call.count("items", 2)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    op = json.loads(metrics.export_json())["operations"]["op"]
+    assert op["calls"] == 400 and op["work"]["items"] == 800
+    metrics.reset()
+    assert metrics.snapshot()["operations"] == {}
+
+def test_listener_and_profile():
+    metrics = Metrics()
+    seen = []
+    metrics.add_listener(lambda name, seconds, work: seen.append((name, work)))
+    metrics.start_profile()
+    with metrics.call("outer") as call:
+        call.count("rows", 3)
+        with metrics.call("inner"):
+            pass
+    stats = metrics.stop_profile()
+    assert seen == [("inner", {}), ("outer", {"rows": 3})]
+    assert stats is not None
+
+def test_histogram_percentiles():
+    hist = Histogram()
+    for value in [1, 2, 3, 100]:
+        hist.record(value)
+    snap = hist.snapshot()
+    assert snap["count"] == 4 and snap["sum"] == 106 and snap["max"] == 100
+    # Percentiles report the bucket bound, capped at the max seen
+    assert snap["p50"] == 4 and snap["p99"] == 100
@@ -0,0 +1,41 @@
+import pytest
+from decimal import Decimal
+from banking.account import Account
+from banking.mmap_ledger import MappedLedger, write_ledger_file
+
+def build_account():
+    account = Account("AC001")
+    account.add_transaction("20230505", "D", Decimal("100.00"))
+    account.add_transaction("20230601", "D", Decimal("150.00"))
+    account.add_transaction("20230626", "W", Decimal("20.00"))
+    account.add_interest("20230630", Decimal("0.39"))
+    account.add_transaction("20230815", "D", Decimal("5.00"))
+    return account
+
+def test_archived_account_matches_in_memory(tmp_path):
+    account = build_account()
+    path = str(tmp_path / "AC001.ledger")
+    write_ledger_file(path, account.ledger)
+    archived = Account.open_archive("AC001", path)
+    assert archived.get_balance() == account.get_balance()
+    assert archived.get_months() == ["202305", "202306", "202308"]
+    for ym in ("202305", "202306", "202307", "202308"):
+        assert archived.get_statement(ym) == account.get_statement(ym)
+    for date in ("20230430", "20230601", "20230629", "20230630", "20231231"):
+        assert archived.get_balance_on_date(date) == account.get_balance_on_date(date)
+    assert archived.get_all_transaction_dates() == account.get_all_transaction_dates()
+    archived.ledger.close()
+
+def test_archived_account_is_read_only(tmp_path):
+    path = str(tmp_path / "AC001.ledger")
+    write_ledger_file(path, build_account().ledger)
+    archived = Account.open_archive("AC001", path)
+    with pytest.raises(ValueError):
+        archived.add_transaction("20230901", "D", Decimal("1.00"))
+    archived.ledger.close()
+
+def test_rejects_foreign_file(tmp_path):
+    path = tmp_path / "bogus"
+    path.write_bytes(b"x" * 64)
+    with pytest.raises(ValueError):
+        MappedLedger(str(path))
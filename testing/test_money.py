@@ -0,0 +1,27 @@
+from decimal import Decimal
+from banking.money import Money, half_up_div
+
+def test_from_decimal_rounds_half_up():
+    assert Money.from_decimal(Decimal("100.005")).cents == 10001
+    assert Money.from_decimal("0.004").cents == 0
+    assert Money.from_decimal(Decimal("-1.005")).cents == -101
+
+def test_compares_with_decimal_and_int():
+    m = Money(10039)
+    assert m == Decimal("100.39")
+    assert m.to_decimal() == Decimal("100.39")
+    assert m > 0
+    assert m < Decimal("200")
+    assert hash(m) == hash(Decimal("100.39"))
+
+def test_arithmetic_and_format():
+    total = sum([Money(150), Money(250)])
+    assert total == Money(400)
+    assert total - Money(500) == Money(-100)
+    assert f"{total:8.2f}" == "    4.00"
+    assert str(Money(5)) == "0.05"
+
+def test_half_up_div():
+    assert half_up_div(5, 10) == 1
+    assert half_up_div(4, 10) == 0
+    assert half_up_div(-5, 10) == -1
@@ -0,0 +1,92 @@
+import os
+import time
+from decimal import Decimal
+from banking.journal import Journal, TXN
+from banking.persistence import PersistentBank, JOURNAL_FILE, SNAPSHOT_FILE
+
+def populate(bank):
+    bank.add_interest_rule("20230520", "RULE02", Decimal("1.90"))
+    bank.add_transaction("20230601", "AC001", "D", Decimal("250.00"))
+    bank.add_transaction("20230601", "AC002", "D", Decimal("75.50"))
+    bank.add_transaction("20230626", "AC001", "W", Decimal("120.00"))
+    bank.calculate_monthly_interest("AC001", "202306")
+
+def assert_same_state(a, b):
+    assert sorted(a.accounts) == sorted(b.accounts)
+    for account_id in a.accounts:
+        assert list(a.accounts[account_id].transactions) == list(b.accounts[account_id].transactions)
+        assert a.accounts[account_id].balance == b.accounts[account_id].balance
+    assert a.get_interest_rules() == b.get_interest_rules()
+
+def test_recovers_from_journal(tmp_path):
+    bank = PersistentBank(str(tmp_path))
+    populate(bank)
+    bank.close()
+    recovered = PersistentBank(str(tmp_path))
+    assert_same_state(bank, recovered)
+    # Transaction ids continue after recovery
+    assert recovered.add_transaction("20230626", "AC001", "D", Decimal("1")).txn_id == "20230626-02"
+
+def test_snapshot_resets_journal_and_recovers(tmp_path):
+    bank = PersistentBank(str(tmp_path), snapshot_every=3)
+    populate(bank)
+    bank.add_transaction("20230701", "AC002", "D", Decimal("10.00"))
+    bank.close()
+    assert os.path.exists(tmp_path / SNAPSHOT_FILE)
+    recovered = PersistentBank(str(tmp_path))
+    assert_same_state(bank, recovered)
+
+def test_records_covered_by_snapshot_are_not_replayed(tmp_path):
+    bank = PersistentBank(str(tmp_path))
+    populate(bank)
+    bank.journal.sync()
+    journal_bytes = (tmp_path / JOURNAL_FILE).read_bytes()
+    bank.snapshot()
+    bank.close()
+    # Simulate a crash between writing the snapshot and resetting the journal
+    (tmp_path / JOURNAL_FILE).write_bytes(journal_bytes)
+    recovered = PersistentBank(str(tmp_path))
+    assert_same_state(bank, recovered)
+
+def test_torn_tail_is_dropped(tmp_path):
+    bank = PersistentBank(str(tmp_path))
+    populate(bank)
+    bank.close()
+    with open(tmp_path / JOURNAL_FILE, 'ab') as f:
+        f.write(bytes([TXN, 40, 0, 0, 0, 1, 2]))
+    recovered = PersistentBank(str(tmp_path))
+    assert_same_state(bank, recovered)
+    assert len(list(Journal(str(tmp_path / JOURNAL_FILE)).replay())) == 5
+
+def test_recovers_recalculated_interest(tmp_path):
+    bank = PersistentBank(str(tmp_path))
+    populate(bank)
+    bank.add_transaction("20230610", "AC001", "D", Decimal("1000.00"))
+    bank.calculate_monthly_interest("AC001", "202306")
+    bank.close()
+    recovered = PersistentBank(str(tmp_path))
+    assert_same_state(bank, recovered)
+    assert [t.txn_type for t in recovered.get_account_statement("AC001", "202306")] == ["D", "D", "W", "I"]
+
+def test_idle_journal_syncs_pending_records(tmp_path):
+    path = str(tmp_path / JOURNAL_FILE)
+    # A long interval keeps the timer from firing before the first check
+    journal = Journal(path, group_size=1000, group_interval=60)
+    journal.append(TXN, b"\0" * 8)
+    assert os.path.getsize(path) == 0  # still buffered
+    assert journal._timer is not None
+    journal._timer.cancel()
+    journal._sync_due()  # what the timer runs once the interval is up
+    assert journal._pending == 0 and journal._timer is None
+    assert os.path.getsize(path) > 0
+    journal.close()
+
+    # With a short interval the timer does it unprompted
+    journal = Journal(path, group_size=1000, group_interval=0.05)
+    journal.append(TXN, b"\0" * 8)
+    for _ in range(100):
+        if not journal._pending:
+            break
+        time.sleep(0.01)
+    assert journal._pending == 0
+    journal.close()
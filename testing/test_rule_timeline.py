@@ -0,0 +1,33 @@
+from decimal import Decimal
+from banking.interest_rule import InterestRule
+from banking.rule_timeline import InterestRuleTimeline
+
+def make_timeline():
+    timeline = InterestRuleTimeline()
+    timeline.add(InterestRule("20230615", "RULE03", Decimal("2.20")))
+    timeline.add(InterestRule("20230101", "RULE01", Decimal("1.95")))
+    timeline.add(InterestRule("20230520", "RULE02", Decimal("1.90")))
+    return timeline
+
+def test_rules_sorted_by_date():
+    timeline = make_timeline()
+    assert [r.rule_id for r in timeline.rules()] == ["RULE01", "RULE02", "RULE03"]
+
+def test_same_date_replaces_rule():
+    timeline = make_timeline()
+    timeline.add(InterestRule("20230520", "RULE04", Decimal("1.50")))
+    assert len(timeline) == 3
+    assert timeline.rule_for_date("20230520").rule_id == "RULE04"
+
+def test_rule_for_date():
+    timeline = make_timeline()
+    assert timeline.rule_for_date("20221231") is None
+    assert timeline.rule_for_date("20230101").rule_id == "RULE01"
+    assert timeline.rule_for_date("20230614").rule_id == "RULE02"
+    assert timeline.rule_for_date("20231231").rule_id == "RULE03"
+
+def test_rules_between():
+    timeline = make_timeline()
+    rules = timeline.rules_between("20230601", "20230630")
+    assert [r.rule_id for r in rules] == ["RULE02", "RULE03"]
+    assert timeline.rules_between("20221201", "20221231") == []
@@ -0,0 +1,104 @@
+import asyncio
+import json
+import threading
+import time
+from banking.server import BankServer
+
+async def roundtrip(server, lines):
+    srv = await server.start()
+    port = srv.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    # Pipeline every request before reading any reply
+    writer.write("".join(line + "\n" for line in lines).encode())
+    await writer.drain()
+    replies = [json.loads(await reader.readline()) for _ in lines]
+    writer.close()
+    await writer.wait_closed()
+    srv.close()
+    await srv.wait_closed()
+    return replies
+
+def test_pipelined_requests_reply_in_order():
+    server = BankServer(max_inflight=2)
+    replies = asyncio.run(roundtrip(server, [
+        "T 20230505 AC001 D 100.00",
+        "T 20230601 AC001 D 150.00",
+        "T 20230626 AC001 W 20.00",
+        "T 20230626 AC001 W 100.00",
+        "I 20230520 RULE02 1.90",
+        "I 20230615 RULE03 2.20",
+        "P AC001 202306",
+    ]))
+    assert [r.get("txn_id") for r in replies[:4]] == ["20230505-01", "20230601-01", "20230626-01", "20230626-02"]
+    assert all(r["ok"] for r in replies)
+    assert replies[-1]["rows"] == [
+        ["20230601", "20230601-01", "D", "150.00", "250.00"],
+        ["20230626", "20230626-01", "W", "20.00", "230.00"],
+        ["20230626", "20230626-02", "W", "100.00", "130.00"],
+        ["20230630", "", "I", "0.39", "130.39"],
+    ]
+
+def test_errors_are_reported_per_request():
+    replies = asyncio.run(roundtrip(BankServer(), [
+        "T 20230601 AC009 W 10.00",
+        "T 20230601 AC009 D abc",
+        "I 20230601 R1 0",
+        "P AC404 202306",
+        "X",
+    ]))
+    assert [r["ok"] for r in replies] == [False] * 5
+    assert replies[0]["error"] == "First transaction cannot be withdrawal"
+    assert replies[1]["error"] == "Invalid amount format"
+    assert replies[2]["error"] == "Rate must be between 0 and 100"
+    assert replies[3]["error"] == "Account AC404 not found"
+    assert replies[4]["error"] == "Invalid input format"
+
+def test_unexpected_error_does_not_stall_the_connection():
+    server = BankServer()
+    add_transaction = server.bank.add_transaction
+
+    def failing(date, account_id, txn_type, amount):
+        if account_id == "AC666":
+            raise OverflowError("int too big to convert")
+        return add_transaction(date, account_id, txn_type, amount)
+
+    server.bank.add_transaction = failing
+    replies = asyncio.run(asyncio.wait_for(roundtrip(server, [
+        "T 20230601 AC666 D 10.00",
+        "T 20230601 AC001 D 10.00",
+    ]), timeout=5))
+    assert replies[0] == {"ok": False, "error": "int too big to convert"}
+    assert replies[1] == {"ok": True, "txn_id": "20230601-01"}
+
+def test_bank_calls_do_not_block_the_event_loop():
+    server = BankServer()
+    held, release = threading.Event(), threading.Event()
+
+    def hold_rules():
+        with server.bank._rules_lock.read():
+            held.set()
+            release.wait(2)
+
+    async def main():
+        holder = threading.Thread(target=hold_rules)
+        holder.start()
+        held.wait()
+        # The rule change waits for the rules lock in the executor...
+        rule = asyncio.create_task(server.dispatch("I 20230601 R1 1.00"))
+        start = time.monotonic()
+        await asyncio.sleep(0.05)
+        # ...while the loop keeps serving other requests
+        reply = await server.dispatch("T 20230601 AC001 D 10.00")
+        assert time.monotonic() - start < 1
+        assert reply["ok"] and not rule.done()
+        release.set()
+        assert (await rule)["ok"]
+        holder.join()
+
+    asyncio.run(main())
+
+def test_idle_account_locks_are_dropped():
+    server = BankServer()
+    asyncio.run(roundtrip(server, ["T 20230601 AC%03d D 10.00" % i for i in range(50)] +
+                                  ["P AC404 202306", "T 20230601 AC001 X 1"]))
+    assert server._account_locks == {}
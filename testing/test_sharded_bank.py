@@ -0,0 +1,52 @@
+import pytest
+from decimal import Decimal
+from banking.bank import Bank
+from banking.sharded_bank import ShardedBank
+
+RECORDS = [
+    ("20230105", "AC001", "D", "1000.00"),
+    ("20230105", "AC002", "D", "250.00"),
+    ("20230110", "AC003", "D", "40.00"),
+    ("20230120", "AC001", "W", "300.00"),
+    ("20230121", "AC003", "W", "90.00"),   # overdraws, rejected
+    ("20230122", "AC004", "D"),            # malformed
+    ("20230201", "AC005", "D", "75.50"),
+    ("20230203", "AC002", "W", "10.00"),
+]
+
+@pytest.fixture
+def sharded():
+    bank = ShardedBank(shards=3, batch_size=2)
+    yield bank
+    bank.close()
+
+def test_bulk_load_matches_single_bank(sharded):
+    single = Bank()
+    for bank in (single, sharded):
+        bank.add_interest_rule("20230101", "R1", Decimal("2.00"))
+    expected = single.add_transactions(RECORDS)
+    report = sharded.add_transactions(RECORDS)
+    assert report.txn_ids == expected.txn_ids
+    assert report.errors == expected.errors
+    assert sharded.run_month_end("202301") == single.run_month_end("202301")
+    for account_id in ("AC001", "AC002", "AC003"):
+        assert sharded.get_account_statement(account_id, "202301") == single.get_account_statement(account_id, "202301")
+    assert sharded.get_total_balance() == single.get_total_balance()
+    assert sharded.get_top_balances(2) == single.get_top_balances(2)
+    assert sharded.get_accounts_below(Decimal("300")) == single.get_accounts_below(Decimal("300"))
+    assert sharded.get_totals_between("20230101", "20230228") == single.get_totals_between("20230101", "20230228")
+
+def test_rules_replicated_and_errors_routed(sharded):
+    assert sharded.add_interest_rule("20230101", "R1", Decimal("2.00"))[0]
+    assert not sharded.add_interest_rule("20230101", "R2", Decimal("150"))[0]
+    assert [r.rule_id for r in sharded.get_interest_rules()] == ["R1"]
+    txn = sharded.add_transaction("20230105", "AC001", "D", Decimal("100.00"))
+    assert txn.txn_id == "20230105-01"
+    with pytest.raises(ValueError):
+        sharded.add_transaction("20230106", "AC001", "W", Decimal("500.00"))
+    with pytest.raises(ValueError, match="not found"):
+        sharded.calculate_monthly_interest("AC999", "202301")
+    # Every shard holds the rule, whichever owns the account
+    for account_id in ("AC001", "AC002", "AC003", "AC004"):
+        sharded.add_transaction("20230110", account_id, "D", Decimal("36500.00"))
+        assert sharded.calculate_monthly_interest(account_id, "202301")[1] > 0
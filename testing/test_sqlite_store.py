@@ -0,0 +1,66 @@
+import pytest
+from decimal import Decimal
+from banking.sqlite_store import SqliteBank, SqliteStore
+
+def populate(bank):
+    bank.add_interest_rule("20230520", "RULE02", Decimal("1.90"))
+    bank.add_interest_rule("20230615", "RULE03", Decimal("2.20"))
+    bank.add_transaction("20230505", "AC001", "D", Decimal("100.00"))
+    bank.add_transaction("20230601", "AC001", "D", Decimal("150.00"))
+    bank.add_transaction("20230626", "AC001", "W", Decimal("20.00"))
+    bank.add_transaction("20230626", "AC001", "W", Decimal("100.00"))
+    bank.add_transaction("20230601", "AC002", "D", Decimal("10.00"))
+    bank.calculate_monthly_interest("AC001", "202306")
+
+def test_store_queries_match_bank(tmp_path):
+    path = str(tmp_path / "bank.db")
+    bank = SqliteBank(path, batch_size=3)
+    populate(bank)
+    bank.flush()
+
+    reader = SqliteStore(path)
+    assert reader.statement("AC001", "202306") == bank.get_account_statement("AC001", "202306")
+    for date in ("20230501", "20230601", "20230626", "20230630"):
+        assert reader.balance_on("AC001", date) == bank.accounts["AC001"].get_balance_on_date(date)
+    assert reader.rule_for_date("20230620").rule_id == "RULE03"
+    assert reader.rule_for_date("20230101") is None
+    assert reader.account_ids() == ["AC001", "AC002"]
+    reader.close()
+    bank.close()
+
+def test_reopen_restores_state(tmp_path):
+    path = str(tmp_path / "bank.db")
+    bank = SqliteBank(path)
+    populate(bank)
+    bank.close()
+
+    reopened = SqliteBank(path)
+    assert reopened.get_interest_rules() == bank.get_interest_rules()
+    for account_id, account in bank.accounts.items():
+        assert list(reopened.accounts[account_id].transactions) == list(account.transactions)
+        assert reopened.accounts[account_id].balance == account.balance
+    assert reopened.add_transaction("20230626", "AC001", "D", Decimal("1")).txn_id == "20230626-03"
+    reopened.close()
+
+def test_reopen_restores_month_close(tmp_path):
+    path = str(tmp_path / "bank.db")
+    bank = SqliteBank(path)
+    populate(bank)
+    bank.add_transaction("20230705", "AC003", "D", Decimal("5.00"))
+    bank.close_months("202305")
+    bank.close_months("202306", archive_dir=str(tmp_path))
+    bank.close()
+
+    reopened = SqliteBank(path)
+    for account_id, account in bank.accounts.items():
+        restored = reopened.accounts[account_id]
+        assert restored.checkpoints == account.checkpoints
+        assert restored.closed_through == account.closed_through
+        assert restored.evicted_through == account.evicted_through
+        assert restored.archives == account.archives
+        assert list(restored.transactions) == list(account.transactions)
+    assert reopened.get_account_statement("AC001", "202306") == bank.get_account_statement("AC001", "202306")
+    assert reopened.calculate_monthly_interest("AC001", "202306") == bank.calculate_monthly_interest("AC001", "202306")
+    with pytest.raises(ValueError, match="Month 202306 is closed"):
+        reopened.add_transaction("20230630", "AC003", "D", Decimal("1.00"))
+    reopened.close()
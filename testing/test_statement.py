@@ -0,0 +1,46 @@
+import io
+import json
+from decimal import Decimal
+from banking.bank import Bank
+from banking.statement import CsvSink, JsonLinesSink, TableSink, export_statements, iter_statement
+
+def make_bank():
+    bank = Bank()
+    bank.add_transaction("20230505", "AC001", "D", Decimal("100.00"))
+    bank.add_transaction("20230601", "AC001", "D", Decimal("150.00"))
+    bank.add_transaction("20230626", "AC001", "W", Decimal("20.00"))
+    bank.add_transaction("20230601", "AC002", "D", Decimal("5.00"))
+    return bank
+
+def test_rows_carry_running_balance_from_before_the_month():
+    rows = list(iter_statement(make_bank().accounts["AC001"], "202306"))
+    assert [(r.txn_id, r.balance) for r in rows] == [("20230601-01", Decimal("250.00")),
+                                                     ("20230626-01", Decimal("230.00"))]
+
+def test_table_sink_matches_cli_format():
+    out = io.StringIO()
+    sink = TableSink(out, buffer_rows=1)
+    sink.write("AC001", iter_statement(make_bank().accounts["AC001"], "202306"))
+    sink.close()
+    assert out.getvalue().splitlines() == [
+        "Account: AC001",
+        "| Date     | Txn Id      | Type | Amount | Balance |",
+        "| 20230601 | 20230601-01 | D    |  150.00 |   250.00 |",
+        "| 20230626 | 20230626-01 | W    |   20.00 |   230.00 |",
+    ]
+
+def test_export_many_accounts_to_csv():
+    out = io.StringIO()
+    count = export_statements(make_bank(), [("AC001", None), ("AC404", "202306"), ("AC002", "202306")], CsvSink(out))
+    lines = out.getvalue().splitlines()
+    assert count == 4
+    assert lines[0] == "account_id,date,txn_id,txn_type,amount,balance"
+    assert lines[-1] == "AC002,20230601,20230601-01,D,5.00,5.00"
+
+def test_export_json_lines():
+    out = io.StringIO()
+    export_statements(make_bank(), [("AC001", "202305")], JsonLinesSink(out))
+    assert [json.loads(line) for line in out.getvalue().splitlines()] == [{
+        "account_id": "AC001", "date": "20230505", "txn_id": "20230505-01",
+        "type": "D", "amount": "100.00", "balance": "100.00",
+    }]
@@ -0,0 +1,65 @@
+import random
+import pytest
+from decimal import Decimal
+from banking.bank import Bank
+from banking.dates import month_range
+from banking.interest import compute_period_interest
+from banking.money import Money
+
+pytest.importorskip("numpy")
+from banking.vector_interest import batch_period_interest
+
+def random_bank(seed):
+    rng = random.Random(seed)
+    bank = Bank()
+    for month in (5, 6):
+        for _ in range(3):
+            day = rng.randint(1, 28)
+            rate = Decimal(rng.randint(1, 999)) / 100
+            bank.add_interest_rule(f"2023{month:02d}{day:02d}", f"R{month}{day}", rate)
+    for i in range(40):
+        account_id = f"AC{i:03d}"
+        for _ in range(rng.randint(1, 8)):
+            date = f"2023{rng.choice((5, 6)):02d}{rng.randint(1, 30):02d}"
+            amount = Decimal(rng.randint(1, 10 ** 7)) / 100
+            try:
+                bank.add_transaction(date, account_id, rng.choice("DDW"), amount)
+            except ValueError:
+                pass
+    return bank
+
+@pytest.mark.parametrize("seed", range(5))
+def test_numpy_engine_matches_decimal_path(seed):
+    bank = random_bank(seed)
+    start, end = month_range("202306")
+    rates = bank._rate_inputs(start, end)
+    inputs = [bank._interest_inputs(a, start, end) for _, a in sorted(bank.accounts.items())]
+    expected = [compute_period_interest(end, points, rates) for points in inputs]
+    assert batch_period_interest(end, inputs, rates) == expected
+
+def test_half_up_rounding_per_period():
+    # 18.25 * 1.00% * 10 / 365 = 0.005 exactly, which rounds up to 0.01
+    points = [("20230621", Money(1825))]
+    rates = [("20230101", Decimal("1.00"))]
+    assert compute_period_interest("20230630", points, rates) == Decimal("0.01")
+    assert batch_period_interest("20230630", [points], rates) == [Decimal("0.01")]
+
+def test_fine_grained_rates_fall_back_to_decimal():
+    points = [("20230601", Money(100000))]
+    rates = [("20230101", Decimal("1.955"))]
+    assert batch_period_interest("20230630", [points], rates) == [compute_period_interest("20230630", points, rates)]
+
+def test_run_month_end_with_numpy_engine():
+    expected = random_bank(7).run_month_end("202306")
+    assert random_bank(7).run_month_end("202306", engine="numpy") == expected
+
+@pytest.mark.parametrize("rule_date", [None, "20230701"])
+def test_engines_agree_without_a_rule_in_effect(rule_date):
+    results = []
+    for engine in ("accrual", "decimal", "numpy"):
+        bank = Bank()
+        if rule_date:
+            bank.add_interest_rule(rule_date, "R1", Decimal("2.00"))
+        bank.add_transaction("20230601", "AC001", "D", Decimal("100.00"))
+        results.append(bank.run_month_end("202306", engine=engine))
+    assert results == [{}, {}, {}]